@@ -0,0 +1,40 @@
+"""Measures the size of a serialized corpus against its davar text, and the time to
+read it back against transcribing the text, for a corpus of mostly distinct Words.
+
+Run from the project directory with `python -m benchmarks.bench_binary`.
+"""
+
+import random
+from davar import binary, parsing
+from benchmarks.timing import timed
+
+STATEMENTS = 30000
+
+
+def corpus(seed: int = 0) -> str:
+    """Returns davar text of generated Statements with mostly distinct Words."""
+    rng = random.Random(seed)
+    return " ".join(
+        f"(P{rng.randint(1, 300)} Q{rng.randint(1, 10 ** 6)} "
+        f"(Q{rng.randint(1, 10 ** 6)} {rng.randint(0, 10 ** 7):08d}-n))"
+        for _ in range(STATEMENTS)
+    )
+
+
+def main():
+    text = corpus()
+    statements, transcribe_seconds = timed(lambda: parsing.transcribe(text))
+    data, dumps_seconds = timed(lambda: binary.dumps(statements))
+    _, loads_seconds = timed(lambda: binary.loads(data))
+    corpus_file = binary.StatementFile._from_buffer(data)
+    _, item_seconds = timed(lambda: corpus_file[STATEMENTS // 2])
+    print(f"davar text          {len(text) / 2 ** 20:10.2f} MiB")
+    print(f"serialized          {len(data) / 2 ** 20:10.2f} MiB")
+    print(f"transcribe          {transcribe_seconds * 1e3:10.1f} ms")
+    print(f"dumps               {dumps_seconds * 1e3:10.1f} ms")
+    print(f"loads               {loads_seconds * 1e3:10.1f} ms")
+    print(f"one statement       {item_seconds * 1e6:10.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Measures the memory held by a generated corpus as Statements against as a
+ColumnarDavar, and the time to describe it both ways against a local fake Wikidata.
+
+Run from the project directory with `python -m benchmarks.bench_columnar`.
+"""
+
+import gc
+import tracemalloc
+from davar import parsing
+from davar.columnar import ColumnarDavar
+from davar.utils import Davar
+from benchmarks.corpus import generate_corpus
+from benchmarks.fake_wikidata import FakeWikidata, use
+from benchmarks.timing import timed
+
+STATEMENTS = 100000
+
+
+def held(build):
+    """Returns what build returns, and the bytes of memory it holds."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current
+
+
+def main():
+    text = generate_corpus(STATEMENTS, reuse=0.99)
+    davar, davar_bytes = held(lambda: Davar(parsing.transcribe(text)))
+    del davar
+    columnar, columnar_bytes = held(lambda: ColumnarDavar.from_davartext(text))
+    davar = Davar(parsing.transcribe(text))
+    with FakeWikidata(latency=0) as fake:
+        use(fake)
+        davar.resolve("en")
+        _, davar_seconds = timed(lambda: davar.describe("en"))
+        _, columnar_seconds = timed(lambda: columnar.describe("en"))
+    print(f"statements          {STATEMENTS:10}")
+    print(f"nodes               {len(columnar.kinds):10}")
+    print(f"Statements held     {davar_bytes / 2 ** 20:10.1f} MiB")
+    print(f"columnar held       {columnar_bytes / 2 ** 20:10.1f} MiB")
+    print(f"describe Davar      {davar_seconds * 1e3:10.1f} ms")
+    print(f"describe columnar   {columnar_seconds * 1e3:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
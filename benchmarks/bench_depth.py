@@ -0,0 +1,41 @@
+"""Measures transcribing, describing and printing a single statement nested to depths
+of 10^4 to 10^5, far past Python's recursion limit, which the explicit-stack walks of
+parsing and describing have to handle in time linear in depth.
+
+Run from the project directory with `python -m benchmarks.bench_depth`.
+"""
+
+import sys
+from davar import model, parsing
+from benchmarks.timing import timed
+
+DEPTHS = (10 ** 4, 3 * 10 ** 4, 10 ** 5)
+
+
+def nested(depth: int) -> str:
+    """Returns a davar statement of LabeledEdges and Edges nested depth levels deep."""
+    return "(P31 Q42 (Q5 " * (depth // 2) + "Q2" + "))" * (depth // 2)
+
+
+def main():
+    # labels are served from memory, so that describing measures only the walk
+    for id, label in {"Q2": "Earth", "Q5": "human", "Q42": "Douglas Adams"}.items():
+        model.label_lru.set((model.WikidataItem, id, "en"), label)
+    model.label_lru.set((model.WikidataProperty, "P31", "en"), "instance of")
+    print(f"recursion limit {sys.getrecursionlimit()}")
+    for depth in DEPTHS:
+        text = nested(depth)
+        (statement,), seconds = timed(lambda: parsing.transcribe(text))
+        print(f"depth {depth:>7}  transcribe {seconds * 1e3:9.1f} ms")
+        for name, func in {
+            "describe": lambda: statement.describe("en"),
+            "str": lambda: str(statement),
+            "repr": lambda: repr(statement),
+            "words": lambda: sum(1 for _ in statement.words()),
+        }.items():
+            _, seconds = timed(func)
+            print(f"{'':>13}  {name:<10} {seconds * 1e3:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
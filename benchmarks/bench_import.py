@@ -0,0 +1,32 @@
+"""Measures the wall time of importing davar and of `python -m davar --help` in fresh
+interpreters, which short-lived command line calls and batch workers pay every time
+they start, against the interpreter starting on its own.
+
+Run from the project directory with `python -m benchmarks.bench_import`.
+"""
+
+import subprocess
+import sys
+import time
+
+COMMANDS = {
+    "python": [sys.executable, "-c", "pass"],
+    "import davar": [sys.executable, "-c", "import davar"],
+    "import davar.model": [sys.executable, "-c", "import davar.model"],
+    "python -m davar --help": [sys.executable, "-m", "davar", "--help"],
+}
+REPEAT = 10
+
+
+def main():
+    for name, command in COMMANDS.items():
+        times = []
+        for _ in range(REPEAT):
+            start = time.perf_counter()
+            subprocess.run(command, check=True, stdout=subprocess.DEVNULL)
+            times.append(time.perf_counter() - start)
+        print(f"{name:<30} {min(times) * 1e3:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Measures the time to build an index of a generated corpus, and to find a Word
+with it against scanning every Statement for it.
+
+Run from the project directory with `python -m benchmarks.bench_index`.
+"""
+
+from davar import model, parsing
+from davar.index import StatementIndex
+from benchmarks.corpus import generate_corpus
+from benchmarks.timing import timed
+
+STATEMENTS = 100000
+
+
+def scan(statements, id: str) -> list:
+    """Returns the top-level Statements id is the subject of, by walking all of them."""
+    found = []
+    for statement in statements:
+        stack = [statement]
+        while stack:
+            item = stack.pop()
+            if isinstance(item.sub, model.Statement):
+                stack.append(item.sub)
+            elif item.sub.id == id:
+                found.append(statement)
+                break
+            if isinstance(item, model.Edge) and isinstance(item.ob, model.Statement):
+                stack.append(item.ob)
+    return found
+
+
+def main():
+    statements = parsing.transcribe(generate_corpus(STATEMENTS))
+    sub = statements[0].sub
+    while isinstance(sub, model.Statement):
+        sub = sub.sub
+    id = sub.id
+    index, build_seconds = timed(lambda: StatementIndex(statements))
+    scanned, scan_seconds = timed(lambda: scan(statements, id))
+    found, find_seconds = timed(lambda: index.statements_with(id, role="sub"))
+    assert found == scanned
+    print(f"statements          {STATEMENTS:10}")
+    print(f"build index         {build_seconds * 1e3:10.1f} ms")
+    print(f"scan                {scan_seconds * 1e3:10.1f} ms")
+    print(f"find with index     {find_seconds * 1e3:10.3f} ms ({len(found)} found)")
+
+
+if __name__ == "__main__":
+    main()
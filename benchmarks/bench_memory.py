@@ -0,0 +1,27 @@
+"""Measures the memory held by a transcribed corpus that mentions a few words many
+times, and the number of distinct Word objects in it.
+
+Run from the project directory with `python -m benchmarks.bench_memory`.
+"""
+import tracemalloc
+from davar import parsing
+
+STATEMENT = "(P31 Q42 (Q5 02084071-n)) "
+REPEATS = 20000
+
+
+def main():
+    text = STATEMENT * REPEATS
+    tracemalloc.start()
+    statements = parsing.transcribe(text)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    words = {id(word) for s in statements for word in s.words()}
+    print(f"statements          {len(statements):>10}")
+    print(f"distinct Words      {len(words):>10}")
+    print(f"memory held         {current / 2 ** 20:>10.1f} MiB")
+    print(f"peak memory         {peak / 2 ** 20:>10.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
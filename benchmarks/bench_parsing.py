@@ -0,0 +1,34 @@
+"""Measures the per-call cost of `davar.parsing.parse`, comparing a parser built for
+every call (the behaviour before parsers were cached) with the cached parser, and the
+throughput of `davar.parsing.transcribe` through the arpeggio parser and the fast path.
+
+Run from the project directory with `python -m benchmarks.bench_parsing`.
+"""
+import timeit
+from arpeggio import ParserPython
+from davar import parsing
+
+TEXT = "(Q5)(P31 Q42 Q5) (Q5 Q42) (P106 Q3236990 (01835496-v Q42 02084071-n))"
+NUMBER = 2000
+
+
+def parse_uncached(davartext: str):
+    """Parses davartext the way `parsing.parse` did before parsers were cached."""
+    return ParserPython(parsing.davar).parse(davartext)
+
+
+def main():
+    benchmarks = {
+        "uncached parser": lambda: parse_uncached(TEXT),
+        "cached parser": lambda: parsing.parse(TEXT),
+        "cached parser (memoization)": lambda: parsing.parse(TEXT, memoization=True),
+        "transcribe (arpeggio)": lambda: parsing.visit(parsing.parse(TEXT)),
+        "transcribe (fast path)": lambda: parsing.transcribe(TEXT),
+    }
+    for name, func in benchmarks.items():
+        seconds = min(timeit.repeat(func, number=NUMBER, repeat=3)) / NUMBER
+        print(f"{name:<30} {seconds * 1e6:10.1f} µs/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Measures the latency of describe requests to a davar server, over TCP and a Unix
+socket, against running the command line tool for each, with labels from a local
+fake Wikidata.
+
+Run from the project directory with `python -m benchmarks.bench_serve`.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from davar import serve
+from davar.client import Client
+from benchmarks.fake_wikidata import FakeWikidata, use
+
+TEXT = "(P31 Q42 Q5) (Q2 (P31 Q42 Q5))"
+REQUESTS = 200
+
+
+def latency(func, repeat: int) -> float:
+    """Returns the median seconds taken by func."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return sorted(times)[len(times) // 2]
+
+
+def main():
+    with FakeWikidata(latency=0.05) as fake, tempfile.TemporaryDirectory() as tmp:
+        use(fake)
+        results = {}
+        for address in ("127.0.0.1:0", f"unix:{os.path.join(tmp, 'davar.sock')}"):
+            server = serve.make_server(address)
+            if not address.startswith("unix:"):
+                address = f"127.0.0.1:{server.server_address[1]}"
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            with Client(address) as client:
+                client.describe(TEXT, ["en"])
+                kind = address.split(":")[0] if "unix" in address else "tcp"
+                results[f"request ({kind})"] = latency(
+                    lambda: client.describe(TEXT, ["en"]), REQUESTS
+                )
+                results[f"batch of 100 ({kind})"] = latency(
+                    lambda: client.describe_batch([TEXT] * 100, ["en"]), REQUESTS // 10
+                )
+            command = [sys.executable, "-m", "davar", TEXT, "-l", "en"]
+            results[f"command line client ({kind})"] = latency(
+                lambda: subprocess.run(
+                    command + ["--server", address], check=True, capture_output=True
+                ),
+                10,
+            )
+            server.shutdown()
+            server.server_close()
+    for name, seconds in results.items():
+        print(f"{name:<28} {seconds * 1e3:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
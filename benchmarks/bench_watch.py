@@ -0,0 +1,32 @@
+"""Measures the time to describe a large generated file written in davar, and to
+describe it again after editing one statement, against a local fake Wikidata.
+
+Run from the project directory with `python -m benchmarks.bench_watch`.
+"""
+
+from davar.watch import IncrementalDescriber
+from benchmarks.corpus import generate_corpus
+from benchmarks.fake_wikidata import FakeWikidata, use
+from benchmarks.timing import timed
+
+STATEMENTS = 100000
+
+
+def main():
+    text = generate_corpus(STATEMENTS)
+    middle = text.index("\n", len(text) // 2) + 1
+    edited = text[:middle] + "(Q42 (P31 Q5 Q2))\n" + text[middle:]
+    with FakeWikidata(latency=0.05) as fake:
+        use(fake)
+        describer = IncrementalDescriber(["en"])
+        _, first_seconds = timed(lambda: describer.update(text))
+        _, edit_seconds = timed(lambda: describer.update(edited))
+        _, undo_seconds = timed(lambda: describer.update(text))
+    print(f"statements          {STATEMENTS:10}")
+    print(f"describe all        {first_seconds * 1e3:10.1f} ms")
+    print(f"after an edit       {edit_seconds * 1e3:10.1f} ms")
+    print(f"after undoing it    {undo_seconds * 1e3:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""Generates synthetic davar corpora for benchmarks, with configurable size, nesting
+depth and reuse of identifiers.
+
+Run from the project directory with `python -m benchmarks.corpus` to print a corpus.
+"""
+
+import argparse
+import random
+
+
+class CorpusGenerator:
+    """Generates random davar statements.
+
+    Every Word is drawn from the Words generated so far with probability `reuse`, and
+    is a new identifier otherwise, so that reuse controls how many distinct labels a
+    corpus needs. Every statement has a nested statement as one of its children with
+    probability `nesting`, until `max_depth` levels are reached.
+    """
+
+    def __init__(
+        self,
+        max_depth: int = 3,
+        reuse: float = 0.9,
+        nesting: float = 0.3,
+        synsets: float = 0.0,
+        seed: int = 0,
+    ):
+        """Sets up a generator.
+
+        Parameters
+        ----------
+        max_depth : int, optional
+            Deepest level of nesting, by default 3
+        reuse : float, optional
+            Probability of reusing an identifier, by default 0.9
+        nesting : float, optional
+            Probability of a statement nesting another, by default 0.3
+        synsets : float, optional
+            Probability of a new Word being an OMW synset rather than a Wikidata
+            entity, by default 0.0 as describing synsets needs the wordnet
+        seed : int, optional
+            Seed of the random number generator, by default 0
+        """
+        self.max_depth = max_depth
+        self.reuse = reuse
+        self.nesting = nesting
+        self.synsets = synsets
+        self.random = random.Random(seed)
+        self.nodes = []
+        self.rels = []
+
+    def _word(self, words: list, new) -> str:
+        if words and self.random.random() < self.reuse:
+            return self.random.choice(words)
+        word = new()
+        words.append(word)
+        return word
+
+    def _new_synset(self, pos: str) -> str:
+        return f"{self.random.randrange(10 ** 8):08d}-{pos}"
+
+    def node(self) -> str:
+        """Returns a Node: a Wikidata item or a noun synset."""
+        if self.random.random() < self.synsets:
+            return self._word(self.nodes, lambda: self._new_synset("n"))
+        return self._word(self.nodes, lambda: f"Q{self.random.randrange(1, 10 ** 8)}")
+
+    def rel(self) -> str:
+        """Returns a Rel: a Wikidata property or a verb synset."""
+        if self.random.random() < self.synsets:
+            return self._word(self.rels, lambda: self._new_synset("v"))
+        return self._word(self.rels, lambda: f"P{self.random.randrange(1, 10 ** 4)}")
+
+    def statement(self, depth: int = 0) -> str:
+        """Returns a Statement, Edge or LabeledEdge, nested up to `max_depth` levels
+        deep counting from depth.
+        """
+        # statements are built inside out, so that deep nesting never recurses
+        inner = None
+        for level in range(max(self.max_depth - depth, 1)):
+            if level and self.random.random() >= self.nesting:
+                break
+            children = [self.node() for _ in range(self.random.choice((1, 2, 2)))]
+            if inner is not None:
+                children[self.random.randrange(len(children))] = inner
+            if len(children) == 2 and self.random.random() < 0.5:
+                children.insert(0, self.rel())
+            inner = f"({' '.join(children)})"
+        return inner
+
+    def corpus(self, statements: int) -> str:
+        """Returns davar text of a number of top-level statements, one per line."""
+        return "\n".join(self.statement() for _ in range(statements)) + "\n"
+
+    def nested(self, depth: int) -> str:
+        """Returns davar text of one statement nested exactly depth levels deep."""
+        nesting, max_depth = self.nesting, self.max_depth
+        self.nesting, self.max_depth = 1.0, depth
+        try:
+            return self.statement()
+        finally:
+            self.nesting, self.max_depth = nesting, max_depth
+
+
+def generate_corpus(
+    statements: int,
+    max_depth: int = 3,
+    reuse: float = 0.9,
+    nesting: float = 0.3,
+    synsets: float = 0.0,
+    seed: int = 0,
+) -> str:
+    """Returns davar text of a synthetic corpus. See `CorpusGenerator`."""
+    return CorpusGenerator(max_depth, reuse, nesting, synsets, seed).corpus(statements)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.corpus",
+        description="Print a synthetic davar corpus.",
+    )
+    parser.add_argument("-n", "--statements", type=int, default=1000)
+    parser.add_argument("--max-depth", type=int, default=3)
+    parser.add_argument("--reuse", type=float, default=0.9)
+    parser.add_argument("--nesting", type=float, default=0.3)
+    parser.add_argument("--synsets", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    print(
+        generate_corpus(
+            args.statements,
+            args.max_depth,
+            args.reuse,
+            args.nesting,
+            args.synsets,
+            args.seed,
+        ),
+        end="",
+    )
+
+
+if __name__ == "__main__":
+    main()
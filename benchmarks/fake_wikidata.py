@@ -0,0 +1,142 @@
+"""Local stand-in for the Wikidata endpoint davar uses, serving given labels, or a
+made up label for every entity, after a configurable latency, so that resolving
+labels can be measured and tested offline and reproducibly.
+
+Run from the project directory with `python -m benchmarks.fake_wikidata` to serve it
+until interrupted.
+"""
+
+import argparse
+import gzip
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+
+class FakeWikidata:
+    """Serves `wbgetentities` at `/w/api.php`, with the labels it was given, or
+    labelling every entity `ID (lang)` if it was given none.
+    """
+
+    def __init__(self, labels: dict = None, latency: float = 0.05, port: int = 0):
+        """Starts the server on a background thread.
+
+        Parameters
+        ----------
+        labels : dict, optional
+            Maps the id of each entity to a dict mapping language to label, by default
+            every entity exists with a made up label in every language
+        latency : float, optional
+            Seconds every response is delayed by, by default 0.05
+        port : int, optional
+            Port to listen on, by default any free port
+        """
+        self.labels = labels
+        self.latency = latency
+        self.requests = []  # paths of every request made
+        self.connections = set()  # client addresses requests were made from
+        self._lock = threading.Lock()
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                with fake._lock:
+                    fake.requests.append(self.path)
+                    fake.connections.add(self.client_address)
+                time.sleep(fake.latency)
+                url = urlsplit(self.path)
+                query = parse_qs(url.query)
+                if url.path == "/w/api.php":
+                    ids = query["ids"][0].split("|")
+                    langs = query["languages"][0].split("|")
+                    body = {"entities": {id: fake.entity(id, langs) for id in ids}}
+                else:
+                    self.send_response(404)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                data = json.dumps(body).encode()
+                self.send_response(200)
+                if "gzip" in self.headers.get("Accept-Encoding", ""):
+                    data = gzip.compress(data)
+                    self.send_header("Content-Encoding", "gzip")
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+        self.api_url = f"{self.url}/w/api.php"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def entity(self, id: str, langs) -> dict:
+        """Returns the entity data served for an entity, with its labels in langs."""
+        if self.labels is None:
+            labels = {lang: f"{id} ({lang})" for lang in langs}
+        elif id in self.labels:
+            labels = {
+                lang: label for lang, label in self.labels[id].items() if lang in langs
+            }
+        else:
+            return {"id": id, "missing": ""}
+        return {
+            "id": id,
+            "type": "item" if id[0] == "Q" else "property",
+            "labels": {
+                lang: {"language": lang, "value": label}
+                for lang, label in labels.items()
+            },
+        }
+
+    def api_requests(self) -> list:
+        """Returns the paths of the requests made to `/w/api.php`."""
+        return [r for r in self.requests if r.startswith("/w/api.php")]
+
+    def close(self):
+        """Stops the server."""
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def use(fake: FakeWikidata):
+    """Points davar at a fake Wikidata instead of the real one."""
+    from davar import model
+
+    model.WIKIDATA_API_URL = fake.api_url
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.fake_wikidata",
+        description="Serve a fake Wikidata until interrupted.",
+    )
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument(
+        "--latency", type=float, default=0.05, help="Seconds to delay responses by."
+    )
+    args = parser.parse_args(argv)
+    with FakeWikidata(latency=args.latency, port=args.port) as fake:
+        print(f"Serving a fake Wikidata API at {fake.api_url}")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
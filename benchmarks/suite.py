@@ -0,0 +1,146 @@
+"""Runs the benchmark suite: parsing, visiting and transcribing a synthetic corpus,
+describing it against a local fake Wikidata with latency, and command line startup.
+Results are saved as JSON, by default to `benchmarks/results/COMMIT.json`, and can be
+compared with the results of an earlier commit to spot regressions.
+
+Run from the project directory with `python -m benchmarks.suite`, and see
+`python -m benchmarks.suite --help` for options.
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from davar import model, parsing
+from davar.utils import Davar
+from benchmarks.corpus import generate_corpus
+from benchmarks.fake_wikidata import FakeWikidata, use
+
+RESULTS_DIR = os.path.join("benchmarks", "results")
+
+
+def best_of(func, repeat: int, setup=None) -> float:
+    """Returns the fastest of repeat runs of func in seconds, calling setup untimed
+    before each.
+    """
+    times = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def commit() -> str:
+    """Returns the short hash of the checked out commit, or "unknown"."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def run(args) -> dict:
+    """Runs every benchmark, returning seconds taken by name."""
+    text = generate_corpus(
+        args.statements, args.max_depth, args.reuse, args.nesting, seed=args.seed
+    )
+    results = {}
+    tree = parsing.parse(text)
+    results["parse"] = best_of(lambda: parsing.parse(text), args.repeat)
+    results["visit"] = best_of(lambda: parsing.visit(tree), args.repeat)
+    results["transcribe"] = best_of(lambda: parsing.transcribe(text), args.repeat)
+    davar = Davar.from_davartext(text)
+    with FakeWikidata(latency=args.latency) as fake:
+        use(fake)
+        results["describe (cold)"] = best_of(
+            lambda: davar.describe("en"), args.repeat, setup=model.clear_labels
+        )
+        results["describe (warm)"] = best_of(lambda: davar.describe("en"), args.repeat)
+        results["describe_many en,fr,de (cold)"] = best_of(
+            lambda: davar.describe_many(["en", "fr", "de"]),
+            args.repeat,
+            setup=model.clear_labels,
+        )
+    results["cli --help"] = best_of(
+        lambda: subprocess.run(
+            [sys.executable, "-m", "davar", "--help"],
+            check=True,
+            stdout=subprocess.DEVNULL,
+        ),
+        args.repeat,
+    )
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.suite", description="Run the benchmark suite."
+    )
+    parser.add_argument("-n", "--statements", type=int, default=2000)
+    parser.add_argument("--max-depth", type=int, default=3)
+    parser.add_argument("--reuse", type=float, default=0.9)
+    parser.add_argument("--nesting", type=float, default=0.3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.05,
+        help="Seconds the fake Wikidata delays every response by.",
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "-o", "--output", help="File to save results to, by default in " + RESULTS_DIR
+    )
+    parser.add_argument(
+        "--compare", metavar="RESULTS", help="Earlier results to compare against."
+    )
+    args = parser.parse_args(argv)
+
+    params = {
+        name: getattr(args, name)
+        for name in ("statements", "max_depth", "reuse", "nesting", "seed", "latency")
+    }
+    results = run(args)
+    baseline = {}
+    if args.compare is not None:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if baseline["params"] != params:
+            print("Warning: comparing results of different parameters", file=sys.stderr)
+    for name, seconds in results.items():
+        line = f"{name:<32} {seconds * 1e3:10.1f} ms"
+        if name in baseline.get("results", {}):
+            line += f" {seconds / baseline['results'][name]:8.2f}x"
+        print(line)
+
+    output = args.output
+    if output is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        output = os.path.join(RESULTS_DIR, f"{commit()}.json")
+    with open(output, "w") as f:
+        json.dump(
+            {
+                "commit": commit(),
+                "date": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+                "python": platform.python_version(),
+                "params": params,
+                "results": results,
+            },
+            f,
+            indent=2,
+        )
+    print(f"Saved results to {output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,10 @@
+"""Timing helpers shared by the benchmarks."""
+
+import time
+
+
+def timed(func) -> tuple:
+    """Calls func once, and returns what it returned and the seconds it took."""
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
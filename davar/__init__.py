@@ -1,22 +1,20 @@
-# import stuff to top level
-from davar.parsing import transcribe
-from davar.utils import Davar
-import nltk
+# import stuff to top level, lazily so that importing davar stays fast and never
+# touches the network or the NLTK corpora, which are found on first use instead
+_exports = {"transcribe": "davar.parsing", "Davar": "davar.utils"}
 
-# so that it can detect downloaded nltk_data in the project file
-nltk.data.path.append(r"./nltk_data")
 
-# try to download omw if not present
-try:
-    nltk.data.find(r"corpora/omw")
-except LookupError:
-    nltk.download("omw", r"./nltk_data")
+def __getattr__(name):
+    if name in _exports:
+        from importlib import import_module
 
-# try to download wordnet if not present
-try:
-    nltk.data.find(r"corpora/wordnet")
-except LookupError:
-    nltk.download("wordnet", r"./nltk_data")
+        value = getattr(import_module(_exports[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted([*globals(), *_exports])
 
 
 __version__ = "0.2.0"
@@ -1,21 +1,126 @@
 import argparse
-from davar.utils import Davar
+import sys
 
 
-def main():
+def main(argv=None):
     """Allows davar to be used as a commmand line tool
     """
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv and argv[0] == "batch":
+        from davar import batch
+
+        return batch.main(argv[1:])
+    if argv and argv[0] == "index":
+        from davar import wikidump
+
+        return wikidump.main(argv[1:])
+    if argv and argv[0] == "lemmas":
+        from davar import lemmas
+
+        return lemmas.main(argv[1:])
+    if argv and argv[0] == "watch":
+        from davar import watch
+
+        return watch.main(argv[1:])
+    if argv and argv[0] == "serve":
+        from davar import serve
+
+        return serve.main(argv[1:])
+    if argv and argv[0] == "download":
+        from davar import corpora
+
+        return corpora.main(argv[1:])
+
     parser = argparse.ArgumentParser(
-        description="Command line tool for the davar experimental intepreted IAL."
+        prog="python -m davar",
+        description="Command line tool for the davar experimental intepreted IAL.",
+        epilog="Run `python -m davar batch --help` to describe many documents at once, "
+        "`python -m davar index --help` to build an offline label index, "
+        "`python -m davar lemmas --help` to build a lemma table, "
+        "`python -m davar watch --help` to describe a file again as it is edited, "
+        "`python -m davar serve --help` to keep a server running to describe with, or "
+        "`python -m davar download` to download the NLTK corpora.",
     )
     parser.add_argument("davartext", metavar="DAVARTEXT", type=str)
     parser.add_argument(
-        "-l", "--lang", required=True, default=None, help="2 character language code.",
+        "-l",
+        "--lang",
+        required=True,
+        default=None,
+        help="2 character language code, or comma separated codes like en,fr,de.",
+    )
+    parser.add_argument(
+        "--cache", metavar="PATH", help="SQLite file to keep labels in across runs."
     )
 
-    args = parser.parse_args()
-    for s in Davar.from_davartext(args.davartext).describe(args.lang):
-        print(s)
+    parser.add_argument(
+        "--index",
+        metavar="PATH",
+        help="Offline Wikidata label index to read labels from.",
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Never fetch labels from Wikidata, only from --index or --cache.",
+    )
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="Print the time spent in each phase, requests made and cache hits to "
+        "stderr.",
+    )
+    parser.add_argument(
+        "--server",
+        metavar="ADDRESS",
+        help="Describe with a server started by `python -m davar serve` at HOST:PORT "
+        "or unix:PATH, instead of in this process.",
+    )
+
+    args = parser.parse_args(argv)
+    langs = args.lang.split(",")
+    if args.server is not None:
+        if args.cache or args.index or args.offline or args.stats:
+            parser.error(
+                "--cache, --index, --offline and --stats can't be used with "
+                "--server, pass them to the server instead"
+            )
+        from davar.client import Client
+
+        with Client(args.server) as client:
+            try:
+                descriptions = client.describe(args.davartext, langs)
+            except (ValueError, OSError) as e:
+                sys.exit(f"Error: {e}")
+        _print_descriptions(descriptions, langs)
+        return
+
+    from davar import model
+    from davar.utils import Davar
+
+    model.configure_labels(args.cache, args.index, args.offline)
+    stats = None
+    if args.stats:
+        from davar.instrument import Stats
+
+        stats = Stats()
+    davar = Davar.from_davartext(args.davartext, stats=stats)
+    if len(langs) == 1:
+        descriptions = {langs[0]: davar.describe(langs[0], stats=stats)}
+    else:
+        descriptions = davar.describe_many(langs, stats=stats)
+    _print_descriptions(descriptions, langs)
+    if stats is not None:
+        print(stats.report(), file=sys.stderr)
+
+
+def _print_descriptions(descriptions: dict, langs: list):
+    """Prints descriptions by language, prefixing each with its language if there are
+    several.
+    """
+    for lang, lang_descriptions in descriptions.items():
+        for s in lang_descriptions:
+            print(s if len(langs) == 1 else f"{lang}\t{s}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,207 @@
+import argparse
+import os
+import sys
+import time
+from multiprocessing import Pool
+from davar import model
+from davar.utils import Davar
+
+
+def iter_documents(inputs):
+    """Iterates over the davar documents in the given inputs, reading them lazily.
+
+    Parameters
+    ----------
+    inputs : iterable of str
+        Paths to files, each holding one document, or to directories, whose files are
+        read in sorted order. A path of `-` reads one document per non-empty line of
+        standard input.
+
+    Yields
+    ------
+    str
+        Text of each document.
+    """
+    for path in inputs:
+        if path == "-":
+            for line in sys.stdin:
+                if line.strip():
+                    yield line
+        elif os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for name in sorted(files):
+                    with open(os.path.join(root, name), encoding="utf-8") as f:
+                        yield f.read()
+        else:
+            with open(path, encoding="utf-8") as f:
+                yield f.read()
+
+
+def _init_worker(cache_path: str, index_path: str = None, offline: bool = False):
+    """Sets up a worker process, opening the shared label cache and index, and
+    forbidding requests to Wikidata if offline.
+    """
+    model.configure_labels(cache_path, index_path, offline)
+
+
+def _describe_document(job: tuple) -> tuple:
+    """Describes one document in a worker.
+
+    Parameters
+    ----------
+    job : tuple
+        Index of the document, its text, and the BCP 47 language tag to describe it in
+
+    Returns
+    -------
+    tuple
+        Index of the document, its descriptions or None if describing it failed, and an
+        error message or None if it succeeded.
+    """
+    index, text, lang = job
+    try:
+        return index, Davar.from_davartext(text).describe(lang, workers=1), None
+    except Exception as e:
+        return index, None, f"{type(e).__name__}: {e}"
+
+
+def describe_batch(
+    texts,
+    lang: str,
+    workers: int = None,
+    chunksize: int = 64,
+    ordered: bool = True,
+    cache_path: str = None,
+    index_path: str = None,
+    offline: bool = False,
+):
+    """Describes many davar documents, sharding them across a pool of processes.
+
+    Parameters
+    ----------
+    texts : iterable of str
+        Texts of the documents, read lazily as workers need them
+    lang : str
+        BCP 47 language tag
+    workers : int, optional
+        Number of worker processes, by default one per CPU. With 1, documents are
+        described in this process.
+    chunksize : int, optional
+        Number of documents sent to a worker at a time, by default 64
+    ordered : bool, optional
+        If true, results are yielded in the order of texts, and otherwise as soon as
+        they are ready, by default True
+    cache_path : str, optional
+        Path to an SQLite label cache shared by all workers, by default None
+    index_path : str, optional
+        Path to an offline Wikidata label index read by all workers, by default None
+    offline : bool, optional
+        If true, labels are never fetched from Wikidata, only read from the index or
+        the cache, by default False
+
+    Yields
+    ------
+    tuple
+        Index of each document, its descriptions or None if describing it failed, and
+        an error message or None if it succeeded.
+    """
+    jobs = ((index, text, lang) for index, text in enumerate(texts))
+    initargs = (cache_path, index_path, offline)
+    if workers == 1:
+        # described in this process, so the caller's label sources are put back after
+        saved = model.label_cache, model.label_index, model.offline
+        try:
+            _init_worker(*initargs)
+            yield from map(_describe_document, jobs)
+        finally:
+            model.label_cache, model.label_index, model.offline = saved
+        return
+    with Pool(workers, initializer=_init_worker, initargs=initargs) as pool:
+        imap = pool.imap if ordered else pool.imap_unordered
+        yield from imap(_describe_document, jobs, chunksize)
+
+
+def main(argv=None):
+    """Describes many davar documents from the command line, and reports throughput.
+
+    Parameters
+    ----------
+    argv : list, optional
+        Command line arguments after `batch`, by default those of this process
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m davar batch",
+        description="Describe many davar documents in parallel.",
+    )
+    parser.add_argument(
+        "inputs",
+        metavar="INPUT",
+        nargs="*",
+        default=["-"],
+        help="File or directory of files to describe, or - for one document per line "
+        "of standard input (the default).",
+    )
+    parser.add_argument(
+        "-l", "--lang", required=True, help="2 character language code."
+    )
+    parser.add_argument(
+        "-j", "--workers", type=int, default=None, help="Number of worker processes."
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=64,
+        help="Number of documents sent to a worker at a time.",
+    )
+    parser.add_argument(
+        "--tag",
+        action="store_true",
+        help="Prefix every output line with the index of its document.",
+    )
+    parser.add_argument(
+        "--unordered",
+        action="store_true",
+        help="Write documents as soon as they are described. Implies --tag.",
+    )
+    parser.add_argument(
+        "--cache", metavar="PATH", help="SQLite file to keep labels in across runs."
+    )
+    parser.add_argument(
+        "--index",
+        metavar="PATH",
+        help="Offline Wikidata label index to read labels from.",
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Never fetch labels from Wikidata, only from --index or --cache.",
+    )
+    args = parser.parse_args(argv)
+
+    tag = args.tag or args.unordered
+    documents = failures = 0
+    start = time.perf_counter()
+    for index, descriptions, error in describe_batch(
+        iter_documents(args.inputs),
+        args.lang,
+        workers=args.workers,
+        chunksize=args.chunk_size,
+        ordered=not args.unordered,
+        cache_path=args.cache,
+        index_path=args.index,
+        offline=args.offline,
+    ):
+        documents += 1
+        if error is not None:
+            failures += 1
+            print(f"{index}\t{error}", file=sys.stderr)
+            continue
+        for description in descriptions:
+            print(f"{index}\t{description}" if tag else description)
+    seconds = time.perf_counter() - start
+    print(
+        f"Described {documents} documents ({failures} failed) in {seconds:.2f}s, "
+        f"{documents / seconds if seconds else 0:.1f} documents/s.",
+        file=sys.stderr,
+    )
@@ -0,0 +1,288 @@
+import mmap
+import os
+import struct
+from collections.abc import Sequence
+from davar import model
+
+# Format of a serialized corpus, all integers being unsigned LEB128 varints unless
+# noted otherwise:
+#
+#   header    magic, then little-endian uint64 counts of words and statements,
+#             offsets of the word table, the statements and the statement index, and
+#             the width in bytes of the entries of the statement index
+#   words     every distinct Word once, as its number shifted left by 2 and or'ed
+#             with its kind: 0 for Q ids, 1 for P ids, 2 for synsets, whose number
+#             is their offset shifted left by 3 and or'ed with their part of speech
+#   body      every top-level Statement in prefix order, each node being one varint:
+#             a Word is its index in the word table shifted left by 2, and a
+#             Statement is 1, 2 or 3 for Statement, Edge and LabeledEdge, followed by
+#             its children in the order they are written
+#   index     little-endian offset of each top-level Statement from the start of the
+#             statements, as a uint32, or a uint64 if the statements are 4 GiB or more
+_MAGIC = b"DAVARB1\0"
+_header = struct.Struct("<8s6Q")
+_offsets = {4: struct.Struct("<I"), 8: struct.Struct("<Q")}
+
+_WORD_KINDS = (model.WikidataItem, model.WikidataProperty, model.OMWSynset)
+_STATEMENT_KINDS = (None, model.Statement, model.Edge, model.LabeledEdge)
+_statement_tags = {cls: tag for tag, cls in enumerate(_STATEMENT_KINDS) if tag}
+# parts of speech a synset id may end in, including the "|" its id pattern allows
+_POS = "nvar|"
+
+
+def _write_varint(out: bytearray, value: int):
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data, pos: int) -> tuple:
+    byte = data[pos]
+    if byte < 0x80:
+        return byte, pos + 1
+    value = byte & 0x7F
+    shift = 7
+    while True:
+        pos += 1
+        byte = data[pos]
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos + 1
+        shift += 7
+
+
+def _encode_word(word) -> int:
+    if type(word) not in _WORD_KINDS:
+        raise ValueError(f"{type(word).__name__} can't be serialized")
+    kind = _WORD_KINDS.index(type(word))
+    if kind == 2:
+        number = int(word.id[:-2]) << 3 | _POS.index(word.id[-1])
+    else:
+        if word.id[1] == "0" and len(word.id) > 2:
+            # stored as a number, so it would be read back without its zeros
+            raise ValueError(f"{word.id} has leading zeros and can't be serialized")
+        number = int(word.id[1:])
+    return number << 2 | kind
+
+
+def _decode_word(value: int):
+    kind, number = value & 3, value >> 2
+    if kind == 0:
+        return model.WikidataItem(f"Q{number}")
+    if kind == 1:
+        return model.WikidataProperty(f"P{number}")
+    if kind == 2:
+        return model.OMWSynset(f"{number >> 3:08d}-{_POS[number & 7]}")
+    raise ValueError(f"Unknown kind of word {kind}")
+
+
+def dumps(statements) -> bytes:
+    """Serializes davar Statements into the compact binary format read by `loads`.
+
+    Parameters
+    ----------
+    statements : iterable of Statement
+        Top-level Statements to serialize
+
+    Returns
+    -------
+    bytes
+        Serialized Statements.
+    """
+    word_indexes = {}
+    words = bytearray()
+    body = bytearray()
+    offsets = []
+    for statement in statements:
+        offsets.append(len(body))
+        stack = [statement]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, model.Statement):
+                if type(item) not in _statement_tags:
+                    raise ValueError(f"{type(item).__name__} can't be serialized")
+                _write_varint(body, _statement_tags[type(item)])
+                stack.extend(reversed(item._children()))
+                continue
+            index = word_indexes.get(item)
+            if index is None:
+                index = word_indexes[item] = len(word_indexes)
+                _write_varint(words, _encode_word(item))
+            _write_varint(body, index << 2)
+    words_at = _header.size
+    body_at = words_at + len(words)
+    index_at = body_at + len(body)
+    width = 4 if len(body) < 1 << 32 else 8
+    header = _header.pack(
+        _MAGIC, len(word_indexes), len(offsets), words_at, body_at, index_at, width
+    )
+    index = b"".join(map(_offsets[width].pack, offsets))
+    return b"".join((header, words, body, index))
+
+
+def _read_header(data) -> tuple:
+    if len(data) < _header.size:
+        raise ValueError("Not a serialized davar corpus")
+    magic, *fields = _header.unpack_from(data)
+    if magic != _MAGIC:
+        raise ValueError("Not a serialized davar corpus")
+    return fields
+
+
+def _read_word_values(data, count: int, pos: int) -> list:
+    values = []
+    for _ in range(count):
+        value, pos = _read_varint(data, pos)
+        values.append(value)
+    return values
+
+
+def _read_statement(data, pos: int, words: list, word_values: list):
+    """Reads one top-level Statement starting at pos, building it with an explicit
+    stack so that Statements of any depth can be read. Words are only constructed the
+    first time they are read, and kept in words.
+    """
+    # each frame is the class of a Statement being read and the children read so far
+    stack = []
+    while True:
+        value, pos = _read_varint(data, pos)
+        if value & 3:
+            stack.append((_STATEMENT_KINDS[value], []))
+            continue
+        item = words[value >> 2]
+        if item is None:
+            item = words[value >> 2] = _decode_word(word_values[value >> 2])
+        while True:
+            if not stack:
+                return item
+            cls, children = stack[-1]
+            children.append(item)
+            if len(children) < len(cls._fields):
+                break
+            stack.pop()
+            item = cls(*children)
+
+
+def loads(data) -> list:
+    """Deserializes davar Statements serialized by `dumps`.
+
+    Parameters
+    ----------
+    data : bytes-like
+        Serialized Statements
+
+    Returns
+    -------
+    list
+        Deserialized Statements.
+    """
+    return list(StatementFile._from_buffer(data))
+
+
+def dump(statements, path: str):
+    """Serializes davar Statements into a file.
+
+    Parameters
+    ----------
+    statements : iterable of Statement
+        Top-level Statements to serialize
+    path : str
+        Path to write to
+    """
+    with open(path, "wb") as f:
+        f.write(dumps(statements))
+
+
+def load(path: str) -> list:
+    """Deserializes all of the davar Statements in a file written by `dump`.
+
+    Parameters
+    ----------
+    path : str
+        Path to read from
+
+    Returns
+    -------
+    list
+        Deserialized Statements.
+    """
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+class StatementFile(Sequence):
+    """Read-only sequence of the Statements in a file written by `dump`. The file is
+    memory mapped, and each Statement is only deserialized when it is accessed, so
+    opening a corpus only reads its table of Words, and individual Statements can be
+    read without reading the rest. Use `.close()`, or use it as a context manager, to
+    unmap the file.
+    """
+
+    def __init__(self, path: str):
+        """Opens a serialized corpus.
+
+        Parameters
+        ----------
+        path : str
+            Path to the corpus
+        """
+        self.path = os.fspath(path)
+        with open(self.path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                raise ValueError("Not a serialized davar corpus")
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._load(data)
+
+    @classmethod
+    def _from_buffer(cls, data):
+        self = cls.__new__(cls)
+        self.path = None
+        self._load(data)
+        return self
+
+    def _load(self, data):
+        header = _read_header(data)
+        word_count, self._count, words_at, self._body_at, self._index_at, width = header
+        self._offset = _offsets[width]
+        self._data = data
+        self._word_values = _read_word_values(data, word_count, words_at)
+        self._words = [None] * word_count
+
+    def __len__(self) -> int:
+        """Returns the number of top-level Statements in the corpus."""
+        return self._count
+
+    def __getitem__(self, index):
+        """Returns the top-level Statement at an index, or a list of Statements for a
+        slice.
+        """
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("statement index out of range")
+        offset = self._offset
+        (pos,) = offset.unpack_from(self._data, self._index_at + index * offset.size)
+        return _read_statement(
+            self._data, self._body_at + pos, self._words, self._word_values
+        )
+
+    def __iter__(self):
+        """Iterates over the top-level Statements in the corpus, in order."""
+        for index in range(self._count):
+            yield self[index]
+
+    def close(self):
+        """Unmaps the file. Statements already read stay usable, but no more can be
+        read.
+        """
+        if self.path is not None:
+            self._data.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
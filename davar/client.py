@@ -0,0 +1,157 @@
+import json
+import socket
+
+DEFAULT_ADDRESS = "127.0.0.1:8765"
+
+
+def parse_address(address: str) -> tuple:
+    """Parses the address of a server.
+
+    Parameters
+    ----------
+    address : str
+        `HOST:PORT`, optionally prefixed by `http://`, or `unix:PATH` for a Unix socket
+
+    Returns
+    -------
+    tuple
+        `(socket.AF_INET, (host, port))` or `(socket.AF_UNIX, path)`.
+    """
+    if address.startswith("unix:"):
+        return socket.AF_UNIX, address[len("unix:") :]
+    if address.startswith("http://"):
+        address = address[len("http://") :]
+    host, _, port = address.rstrip("/").rpartition(":")
+    if not host or not port.isdigit():
+        raise ValueError(f"Expected HOST:PORT or unix:PATH, not {address!r}")
+    return socket.AF_INET, (host, int(port))
+
+
+class Client:
+    """Client of a server started by `python -m davar serve`, keeping its connection
+    open between requests. It speaks just enough HTTP to talk to the server, so that
+    importing it stays fast.
+    """
+
+    def __init__(self, address: str = DEFAULT_ADDRESS, timeout: float = 60):
+        """Constructs a client of the server at an address, without connecting yet.
+
+        Parameters
+        ----------
+        address : str, optional
+            `HOST:PORT` or `unix:PATH`, by default 127.0.0.1:8765
+        timeout : float, optional
+            Seconds to wait for the server, by default 60
+        """
+        self.family, self.location = parse_address(address)
+        self.timeout = timeout
+        self._socket = None
+        self._file = None
+
+    def _connect(self):
+        self._socket = socket.socket(self.family, socket.SOCK_STREAM)
+        self._socket.settimeout(self.timeout)
+        self._socket.connect(self.location)
+        if self.family != socket.AF_UNIX:
+            self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._file = self._socket.makefile("rb")
+
+    def _exchange(self, data: bytes) -> tuple:
+        """Sends a request, and returns the status and body of the response."""
+        if self._socket is None:
+            self._connect()
+        self._socket.sendall(data)
+        status_line = self._file.readline()
+        if not status_line:
+            raise ConnectionError("The server closed the connection")
+        status = int(status_line.split()[1])
+        length = 0
+        while True:
+            line = self._file.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.partition(b":")
+            if name.strip().lower() == b"content-length":
+                length = int(value)
+        return status, self._file.read(length)
+
+    def _request(self, request: dict) -> dict:
+        body = json.dumps(request).encode()
+        data = (
+            b"POST /describe HTTP/1.1\r\nHost: davar\r\n"
+            b"Content-Type: application/json\r\n"
+            b"Content-Length: %d\r\n\r\n" % len(body)
+        ) + body
+        try:
+            status, response = self._exchange(data)
+        except ConnectionError:
+            # the server may have closed a kept-alive connection, so retry once
+            self.close()
+            status, response = self._exchange(data)
+        result = json.loads(response)
+        if status != 200:
+            raise ValueError(result.get("error", f"HTTP {status}"))
+        return result
+
+    def describe(self, davartext: str, langs) -> dict:
+        """Describes a document like `Davar.describe_many`.
+
+        Parameters
+        ----------
+        davartext : str
+            A string of text written in davar
+        langs : iterable of str
+            BCP 47 language tags
+
+        Returns
+        -------
+        dict
+            Maps each language tag to the list of strings describing Statements in
+            that language.
+
+        Raises
+        ------
+        ValueError
+            If the document could not be described.
+        """
+        request = {"davartext": davartext, "langs": list(langs)}
+        return self._request(request)["descriptions"]
+
+    def describe_batch(self, documents, langs) -> list:
+        """Describes several documents in a single request.
+
+        Parameters
+        ----------
+        documents : iterable of str
+            Texts written in davar
+        langs : iterable of str
+            BCP 47 language tags
+
+        Returns
+        -------
+        list
+            For each document, a dict like `.describe()` returns, or a ValueError if
+            it could not be described.
+        """
+        request = {"documents": list(documents), "langs": list(langs)}
+        return [
+            (
+                result["descriptions"]
+                if "error" not in result
+                else ValueError(result["error"])
+            )
+            for result in self._request(request)["results"]
+        ]
+
+    def close(self):
+        """Closes the connection to the server."""
+        if self._socket is not None:
+            self._file.close()
+            self._socket.close()
+            self._socket = self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
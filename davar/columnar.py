@@ -0,0 +1,334 @@
+from array import array
+from collections import Counter
+from types import SimpleNamespace
+from davar import binary, instrument, model
+
+# kind of each node: 0 for a Word, or the tag of its class of Statement in
+# `binary._STATEMENT_KINDS`
+WORD = 0
+
+
+def _numpy():
+    """Returns the numpy module, or None if it is not installed."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _layout_template(cls, nested: bool) -> tuple:
+    """Returns the description layout of a class of Statement, with the position of
+    each child among its children in place of the child.
+    """
+    placeholder = SimpleNamespace(**{name: i for i, name in enumerate(cls._fields)})
+    return cls._describe_layout(placeholder, int(nested))
+
+
+# (kind, nested) -> layout template, as layouts only depend on whether a Statement is
+# nested, as `Statement._render` also assumes
+_templates = {
+    (tag, nested): _layout_template(cls, nested)
+    for tag, cls in enumerate(binary._STATEMENT_KINDS)
+    if tag
+    for nested in (False, True)
+}
+
+
+class ColumnarDavar:
+    """Set of statements in davar stored as flat typed arrays rather than as Statement
+    objects, for corpora too large to hold as Statements.
+
+    Every Statement and Word is a node, and nodes are stored in prefix order: a
+    Statement is followed by its children in the order they are written. For each
+    node, `kinds` holds 0 for a Word or the kind of Statement it is, `ids` holds the
+    index of a Word in `word_table`, and `sizes` holds the number of nodes in its
+    subtree, so that the children of the node at n start at n + 1, n + 1 +
+    sizes[n + 1], and so on. `roots` holds the node each top-level Statement starts at.
+    A node takes 9 bytes, and each distinct Word is stored once.
+
+    It describes Statements like `Davar`, without constructing them.
+    """
+
+    def __init__(self):
+        """Constructs an empty ColumnarDavar. Use `.from_statements()`,
+        `.from_davartext()` or `.from_file()` to construct one holding Statements.
+        """
+        self.kinds = array("B")
+        self.ids = array("I")
+        self.sizes = array("I")
+        self.roots = array("Q")
+        self.word_table = []
+        self._word_indexes = {}
+
+    @classmethod
+    def from_statements(cls, statements):
+        """Constructs a ColumnarDavar from davar Statements.
+
+        Parameters
+        ----------
+        statements : iterable of Statement
+            Top-level Statements, which may be read one at a time
+
+        Returns
+        -------
+        ColumnarDavar
+            A ColumnarDavar holding the Statements
+        """
+        self = cls()
+        self.extend(statements)
+        return self
+
+    @classmethod
+    def from_davartext(cls, davartext: str):
+        """Constructs a ColumnarDavar from a string of text written in davar.
+
+        Parameters
+        ----------
+        davartext : str
+            A string of text written in davar
+
+        Returns
+        -------
+        ColumnarDavar
+            A ColumnarDavar holding its Statements
+        """
+        from davar.parsing import transcribe
+
+        return cls.from_statements(transcribe(davartext))
+
+    @classmethod
+    def from_file(cls, davarfile):
+        """Constructs a ColumnarDavar from a file written in davar, transcribing one
+        top-level statement at a time so that no more than one is held as Statement
+        objects at once.
+
+        Parameters
+        ----------
+        davarfile : str, PathLike or file object
+            Path to a file written in davar, or a text file object to read from
+
+        Returns
+        -------
+        ColumnarDavar
+            A ColumnarDavar holding its Statements
+        """
+        from davar.utils import Davar
+
+        return cls.from_statements(Davar.iter_from_file(davarfile))
+
+    def extend(self, statements):
+        """Appends Statements.
+
+        Parameters
+        ----------
+        statements : iterable of Statement
+            Top-level Statements to append
+        """
+        kinds, ids, sizes = self.kinds, self.ids, self.sizes
+        word_indexes = self._word_indexes
+        for statement in statements:
+            self.roots.append(len(kinds))
+            stack = [statement]
+            while stack:
+                item = stack.pop()
+                if isinstance(item, int):
+                    # all of the children of the Statement at node item were added
+                    sizes[item] = len(kinds) - item
+                elif isinstance(item, model.Statement):
+                    if type(item) not in binary._statement_tags:
+                        raise ValueError(f"{type(item).__name__} can't be stored")
+                    stack.append(len(kinds))
+                    kinds.append(binary._statement_tags[type(item)])
+                    ids.append(0)
+                    sizes.append(0)
+                    stack.extend(reversed(item._children()))
+                else:
+                    index = word_indexes.get(item)
+                    if index is None:
+                        index = word_indexes[item] = len(self.word_table)
+                        self.word_table.append(item)
+                    kinds.append(WORD)
+                    ids.append(index)
+                    sizes.append(1)
+
+    def __len__(self) -> int:
+        """Returns the number of top-level Statements."""
+        return len(self.roots)
+
+    def __getitem__(self, index) -> model.Statement:
+        """Constructs the top-level Statement at an index."""
+        return self._statement(self.roots[index])
+
+    def __iter__(self):
+        """Iterates over the top-level Statements, constructing one at a time."""
+        for root in self.roots:
+            yield self._statement(root)
+
+    def _statement(self, node: int):
+        """Constructs the Statement or Word at a node, with an explicit stack so that
+        Statements of any depth can be constructed.
+        """
+        kinds, ids = self.kinds, self.ids
+        # each frame is the class of a Statement being built and its children so far
+        stack = []
+        while True:
+            kind = kinds[node]
+            node += 1
+            if kind != WORD:
+                stack.append((binary._STATEMENT_KINDS[kind], []))
+                continue
+            item = self.word_table[ids[node - 1]]
+            while True:
+                if not stack:
+                    return item
+                cls, children = stack[-1]
+                children.append(item)
+                if len(children) < len(cls._fields):
+                    break
+                stack.pop()
+                item = cls(*children)
+
+    def _describe_root(self, root: int, labels: list) -> str:
+        """Describes the top-level Statement at node root from the descriptions of its
+        Words, given in the order of `word_table`.
+        """
+        kinds, ids, sizes = self.kinds, self.ids, self.sizes
+        parts = []
+        stack = [(root, False)]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, str):
+                parts.append(item)
+                continue
+            node, nested = item
+            kind = kinds[node]
+            if kind == WORD:
+                parts.append(labels[ids[node]])
+                continue
+            children = []
+            child = node + 1
+            for _ in range(len(binary._STATEMENT_KINDS[kind]._fields)):
+                children.append((child, True))
+                child += sizes[child]
+            stack.extend(
+                part if isinstance(part, str) else children[part]
+                for part in reversed(_templates[kind, nested])
+            )
+        return "".join(parts)
+
+    def resolve(self, lang: str, workers: int = 4):
+        """Resolves the labels of all of its Words in a given language at once, like
+        `Davar.resolve`. Each distinct Word is only looked at once.
+
+        Parameters
+        ----------
+        lang : str
+            BCP 47 language tag
+        workers : int, optional
+            Number of threads fetching labels in parallel, by default 4
+        """
+        model.resolve_labels(self.word_table, [lang], workers=workers)
+
+    def describe(
+        self, lang: str, workers: int = 4, stats: instrument.Stats = None
+    ) -> list:
+        """Returns a list of strings describing its Statements in a human readable
+        format in a given language, like `Davar.describe`. Each distinct Word is
+        described once, and no Statement is constructed.
+
+        Parameters
+        ----------
+        lang : str
+            BCP 47 language tag
+        workers : int, optional
+            Number of threads fetching labels in parallel, by default 4
+        stats : instrument.Stats, optional
+            Records statistics like `Davar.describe` if given, by default None
+
+        Returns
+        -------
+        list
+            List of strings describing Statements in a human readable format
+        """
+        return list(self.iter_describe(lang, workers=workers, stats=stats))
+
+    def iter_describe(
+        self, lang: str, workers: int = 4, stats: instrument.Stats = None
+    ):
+        """Iterates over descriptions of its Statements like `.describe()`, without
+        holding every description at once.
+
+        Yields
+        ------
+        str
+            Description of each top-level Statement, in order.
+        """
+        # stats only records the work between yields, as the caller runs in between
+        with instrument.recording(stats):
+            if instrument.enabled():
+                counts = Counter()
+                for word, count in zip(self.word_table, self._word_counts()):
+                    counts[type(word).__name__] += int(count)
+                for name, count in counts.items():
+                    instrument.count(f"words.{name}", count)
+            self.resolve(lang, workers=workers)
+            labels = [word.describe(lang) for word in self.word_table]
+        for root in self.roots:
+            with instrument.recording(stats), instrument.phase("render"):
+                description = self._describe_root(root, labels)
+            yield description
+
+    def _word_counts(self):
+        """Returns the number of times each Word appears, in the order of
+        `word_table`, as a list or as a numpy array if numpy is installed.
+        """
+        numpy = _numpy()
+        if numpy is not None and self.kinds:
+            kinds = numpy.frombuffer(self.kinds, dtype=numpy.uint8)
+            ids = numpy.frombuffer(self.ids, dtype=numpy.uint32)
+            return numpy.bincount(ids[kinds == WORD], minlength=len(self.word_table))
+        counts = [0] * len(self.word_table)
+        for kind, index in zip(self.kinds, self.ids):
+            if kind == WORD:
+                counts[index] += 1
+        return counts
+
+    def id_counts(self) -> Counter:
+        """Returns the number of times each Word appears, counted with numpy if it is
+        installed.
+
+        Returns
+        -------
+        Counter
+            Maps the id of each Word to the number of times it appears.
+        """
+        return Counter(
+            {
+                word.id: int(count)
+                for word, count in zip(self.word_table, self._word_counts())
+            }
+        )
+
+    def to_numpy(self) -> dict:
+        """Returns copies of its `kinds`, `ids`, `sizes` and `roots` as numpy arrays,
+        for vectorized queries. Requires numpy.
+
+        Returns
+        -------
+        dict
+            Maps the name of each array to a numpy array.
+        """
+        numpy = _numpy()
+        if numpy is None:
+            raise ImportError("to_numpy() requires numpy, install it with pip")
+        dtypes = {
+            "kinds": numpy.uint8,
+            "ids": numpy.uint32,
+            "sizes": numpy.uint32,
+            "roots": numpy.uint64,
+        }
+        return {
+            name: numpy.array(getattr(self, name), dtype=dtype)
+            for name, dtype in dtypes.items()
+        }
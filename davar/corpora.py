@@ -0,0 +1,91 @@
+import argparse
+import sys
+import threading
+
+# project directory that corpora are downloaded to, and searched in besides NLTK's own
+# data directories
+NLTK_DATA_PATH = "nltk_data"
+# NLTK corpora needed to describe OMW synsets
+CORPORA = {"omw": "corpora/omw", "wordnet": "corpora/wordnet"}
+
+_wordnet = None
+_wordnet_lock = threading.Lock()
+
+
+def get_wordnet():
+    """Returns NLTK's WordNet corpus reader, which also reads the Open Multilingual
+    Wordnet, importing NLTK and finding the corpora on first use.
+
+    Returns
+    -------
+    WordNetCorpusReader
+        Shared WordNet corpus reader.
+
+    Raises
+    ------
+    LookupError
+        If the corpora have not been downloaded.
+    """
+    global _wordnet
+    if _wordnet is None:
+        with _wordnet_lock:
+            if _wordnet is None:
+                import nltk
+
+                # so that it can detect downloaded nltk_data in the project directory
+                if NLTK_DATA_PATH not in nltk.data.path:
+                    nltk.data.path.append(NLTK_DATA_PATH)
+                for name, resource in CORPORA.items():
+                    try:
+                        nltk.data.find(resource)
+                    except LookupError:
+                        raise LookupError(
+                            f"NLTK corpus {name} not found, run `python -m davar "
+                            "download` to download it"
+                        ) from None
+                from nltk.corpus import wordnet
+
+                _wordnet = wordnet
+    return _wordnet
+
+
+def download(directory: str = NLTK_DATA_PATH) -> bool:
+    """Downloads the NLTK corpora needed to describe OMW synsets, around 100mb.
+
+    Parameters
+    ----------
+    directory : str, optional
+        Directory to download to, by default `NLTK_DATA_PATH`
+
+    Returns
+    -------
+    bool
+        True if every corpus was downloaded or already present.
+    """
+    import nltk
+
+    return all([nltk.download(name, directory) for name in CORPORA])
+
+
+def main(argv=None):
+    """Downloads the NLTK corpora from the command line.
+
+    Parameters
+    ----------
+    argv : list, optional
+        Command line arguments after `download`, by default those of this process
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m davar download",
+        description="Download the NLTK corpora needed to describe OMW synsets.",
+    )
+    parser.add_argument(
+        "-d",
+        "--dir",
+        default=NLTK_DATA_PATH,
+        help=f"Directory to download to, by default {NLTK_DATA_PATH}.",
+    )
+    args = parser.parse_args(argv)
+
+    if not download(args.dir):
+        sys.exit(1)
@@ -0,0 +1,184 @@
+from collections import defaultdict
+from heapq import merge
+from operator import itemgetter
+from davar import model
+
+# names of the roles a Word can have in a Statement
+ROLES = ("sub", "ob", "rel")
+
+
+class Occurrence:
+    """Place where a Word appears in a corpus: as the `role` child of the Statement
+    reached from the top-level Statement at `position` by following the children
+    named in `path`.
+    """
+
+    __slots__ = ("position", "role", "_path")
+
+    def __init__(self, position: int, path: tuple, role: str):
+        self.position = position
+        self.role = role
+        # paths are kept as linked (parent, name) pairs sharing their prefixes, so
+        # that indexing deeply nested Statements takes linear time and memory
+        self._path = None
+        for name in path:
+            self._path = (self._path, name)
+
+    @classmethod
+    def _linked(cls, position: int, path, role: str):
+        self = cls.__new__(cls)
+        self.position = position
+        self.role = role
+        self._path = path
+        return self
+
+    @property
+    def path(self) -> tuple:
+        """Names of the children leading from the top-level Statement to the Statement
+        the Word is a child of, empty if that is the top-level Statement.
+        """
+        names = []
+        link = self._path
+        while link is not None:
+            link, name = link
+            names.append(name)
+        return tuple(reversed(names))
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Occurrence):
+            return NotImplemented
+        return (self.position, self.path, self.role) == (
+            other.position,
+            other.path,
+            other.role,
+        )
+
+    def __repr__(self):
+        return f"Occurrence({self.position}, {self.path!r}, {self.role!r})"
+
+
+def _word_id(word) -> str:
+    return word if isinstance(word, str) else word.id
+
+
+class StatementIndex:
+    """Index of the Words in a sequence of Statements, mapping the id of each Word to
+    every place it appears as a subject, object or rel, including in nested
+    Statements, so that finding them takes time proportional to the number found
+    rather than to the size of the corpus.
+
+    The index is kept up to date with Statements appended to the sequence, which are
+    indexed the next time it is queried or `.update()` is called. Statements replaced
+    or removed in place are not noticed, and need a new index.
+    """
+
+    def __init__(self, statements):
+        """Indexes a sequence of Statements.
+
+        Parameters
+        ----------
+        statements : sequence of Statement
+            Top-level Statements to index, like the `statements` of a `Davar`
+        """
+        self.statements = statements
+        # (id, role) -> (position, path) of each occurrence in order of position
+        self._occurrences = defaultdict(list)
+        self._indexed = 0
+        self.update()
+
+    def update(self):
+        """Indexes the Statements appended to the sequence since it was last indexed."""
+        statements = self.statements
+        if len(statements) < self._indexed:
+            # Statements were removed, so start over
+            self._occurrences.clear()
+            self._indexed = 0
+        occurrences = self._occurrences
+        for position in range(self._indexed, len(statements)):
+            stack = [(statements[position], None)]
+            while stack:
+                statement, path = stack.pop()
+                for role, child in zip(statement._fields, statement._children()):
+                    if isinstance(child, model.Statement):
+                        stack.append((child, (path, role)))
+                    else:
+                        occurrences[child.id, role].append((position, path))
+            self._indexed = position + 1
+
+    def _check_role(self, role):
+        if role is not None and role not in ROLES:
+            raise ValueError(f"role must be one of {', '.join(ROLES)}, not {role!r}")
+
+    def find(self, word, role: str = None) -> list:
+        """Returns every place a Word appears, in the order of the Statements.
+
+        Parameters
+        ----------
+        word : DavarWord or str
+            Word, or its id like `"Q42"`
+        role : str, optional
+            Only find the Word as `"sub"`, `"ob"` or `"rel"`, by default in any role
+
+        Returns
+        -------
+        list
+            Occurrences of the Word.
+        """
+        self._check_role(role)
+        self.update()
+        id = _word_id(word)
+        roles = ROLES if role is None else (role,)
+        found = []
+        for r in roles:
+            entries = self._occurrences.get((id, r), ())
+            found.append([Occurrence._linked(p, path, r) for p, path in entries])
+        return list(merge(*found, key=lambda occurrence: occurrence.position))
+
+    def statements_with(self, word, role: str = None) -> list:
+        """Returns the top-level Statements a Word appears in, in order, each once.
+
+        Parameters
+        ----------
+        word : DavarWord or str
+            Word, or its id like `"Q42"`
+        role : str, optional
+            Only find the Word as `"sub"`, `"ob"` or `"rel"`, by default in any role
+
+        Returns
+        -------
+        list
+            Top-level Statements.
+        """
+        self._check_role(role)
+        self.update()
+        id = _word_id(word)
+        roles = ROLES if role is None else (role,)
+        found = [self._occurrences.get((id, r), ()) for r in roles]
+        positions = dict.fromkeys(p for p, _ in merge(*found, key=itemgetter(0)))
+        return [self.statements[position] for position in positions]
+
+    def count(self, word, role: str = None) -> int:
+        """Returns the number of places a Word appears, like `len(.find(...))`."""
+        self._check_role(role)
+        self.update()
+        id = _word_id(word)
+        roles = ROLES if role is None else (role,)
+        return sum(len(self._occurrences.get((id, r), ())) for r in roles)
+
+    def resolve(self, occurrence: Occurrence) -> model.Statement:
+        """Returns the Statement an Occurrence is a child of, which is nested in a
+        top-level Statement unless its path is empty.
+        """
+        statement = self.statements[occurrence.position]
+        for name in occurrence.path:
+            statement = getattr(statement, name)
+        return statement
+
+    def ids(self) -> set:
+        """Returns the ids of every Word indexed."""
+        self.update()
+        return {id for id, _ in self._occurrences}
+
+    def __contains__(self, word) -> bool:
+        """Returns True if a Word, or a Word with a given id, appears anywhere."""
+        return self.count(word) > 0
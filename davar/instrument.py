@@ -0,0 +1,201 @@
+import contextvars
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+
+# callables receiving every event as `hook(kind, name, value)`, where kind is "time"
+# for the seconds a phase took and "count" for a number of things counted. Hooks are
+# kept per context, so that each thread or asyncio task only sends its own events to
+# the hooks it added, and concurrent recordings don't see each other's events.
+# Nothing is measured while there are none, so instrumentation costs one check when
+# disabled.
+_hooks = contextvars.ContextVar("davar_instrument_hooks", default=())
+_null_phase = nullcontext()
+
+
+def enabled() -> bool:
+    """Returns True if any hook receives the events of the current context."""
+    return bool(_hooks.get())
+
+
+def add_hook(hook):
+    """Starts sending the instrumentation events of the current context, which is the
+    current thread or asyncio task, to a hook.
+
+    Parameters
+    ----------
+    hook : callable
+        Called as `hook(kind, name, value)` for every event, where kind is `"time"` for
+        the seconds spent in a phase and `"count"` for a number of things counted. May
+        be called from several threads at once, if work is handed to them with
+        `bind()`.
+    """
+    _hooks.set((*_hooks.get(), hook))
+
+
+def remove_hook(hook):
+    """Stops sending the instrumentation events of the current context to a hook added
+    with `add_hook`.
+    """
+    _hooks.set(tuple(h for h in _hooks.get() if h is not hook))
+
+
+def bind(func):
+    """Returns a function calling func with the hooks of the current context, so that
+    work handed to other threads is recorded like work done in this one.
+
+    Parameters
+    ----------
+    func : callable
+        Function to call, typically in a thread pool
+
+    Returns
+    -------
+    callable
+        func itself if no hook is set, or a function taking the same arguments.
+    """
+    hooks = _hooks.get()
+    if not hooks:
+        return func
+
+    def bound(*args, **kwargs):
+        token = _hooks.set(hooks)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _hooks.reset(token)
+
+    return bound
+
+
+def count(name: str, value: int = 1):
+    """Records that value things called name were counted, if any hook is set.
+
+    Parameters
+    ----------
+    name : str
+        Name of what was counted, like `http.requests`
+    value : int, optional
+        Number counted, by default 1
+    """
+    for hook in _hooks.get():
+        hook("count", name, value)
+
+
+class _Phase:
+    """Context manager timing a phase and sending its wall time to every hook."""
+
+    __slots__ = ("name", "start")
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        seconds = time.perf_counter() - self.start
+        for hook in _hooks.get():
+            hook("time", self.name, seconds)
+
+
+def phase(name: str):
+    """Returns a context manager timing a phase called name, which does nothing if no
+    hook is set. Phases may be nested, in which case the time of the inner phase is
+    also part of the time of the outer.
+
+    Parameters
+    ----------
+    name : str
+        Name of the phase, like `parse`
+
+    Returns
+    -------
+    context manager
+        Times the block it manages.
+    """
+    if not _hooks.get():
+        return _null_phase
+    return _Phase(name)
+
+
+class Stats:
+    """Hook accumulating the total wall time of each phase, how many times it was
+    entered, and the total of each count.
+    """
+
+    def __init__(self):
+        self.times = Counter()
+        self.calls = Counter()
+        self.counts = Counter()
+        self._lock = threading.Lock()
+
+    def __call__(self, kind: str, name: str, value):
+        with self._lock:
+            if kind == "time":
+                self.times[name] += value
+                self.calls[name] += 1
+            else:
+                self.counts[name] += value
+
+    def as_dict(self) -> dict:
+        """Returns the accumulated statistics as plain dicts.
+
+        Returns
+        -------
+        dict
+            Maps `times` to the seconds spent in each phase, `calls` to the number of
+            times each phase was entered, and `counts` to the total of each count.
+        """
+        with self._lock:
+            return {
+                "times": dict(self.times),
+                "calls": dict(self.calls),
+                "counts": dict(self.counts),
+            }
+
+    def report(self) -> str:
+        """Returns the accumulated statistics as a human readable table."""
+        stats = self.as_dict()
+        lines = [
+            f"{name:<28} {seconds * 1e3:10.2f} ms  ({stats['calls'][name]} calls)"
+            for name, seconds in sorted(stats["times"].items())
+        ]
+        lines += [
+            f"{name:<28} {value:>10}" for name, value in sorted(stats["counts"].items())
+        ]
+        return "\n".join(lines)
+
+
+@contextmanager
+def recording(stats: Stats = None):
+    """Sends the instrumentation events of the current context to stats for the
+    duration of a block, doing nothing if stats is None.
+
+    Parameters
+    ----------
+    stats : Stats, optional
+        Hook to record into, by default None
+
+    Yields
+    ------
+    Stats or None
+        stats
+    """
+    if stats is None:
+        yield None
+        return
+    add_hook(stats)
+    try:
+        yield stats
+    finally:
+        remove_hook(stats)
+
+
+def collect():
+    """Returns a context manager recording every instrumentation event in the block it
+    manages into a new `Stats`, which it yields.
+    """
+    return recording(Stats())
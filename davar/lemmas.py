@@ -0,0 +1,245 @@
+import argparse
+import mmap
+import os
+import struct
+import sys
+import threading
+from davar.corpora import NLTK_DATA_PATH, get_wordnet
+
+# where `python -m davar lemmas` writes the lemma table, and where it is looked for
+# by default, next to the downloaded nltk_data
+DEFAULT_PATH = os.path.join(NLTK_DATA_PATH, "davar_lemmas.bin")
+
+_MAGIC = b"DAVARLT1"
+# magic, then the number of records
+_header = struct.Struct("<8sI")
+# key of offset, part of speech and ISO 639-2 language code, which sorts bytewise in
+# the same order as the tuple it packs
+_key = struct.Struct(">I1s3s")
+# where the lemma of a key starts in the string section, and its length in bytes
+_location = struct.Struct("<IH")
+_RECORD_SIZE = _key.size + _location.size
+
+
+def _pack_key(offset: int, pos: str, lang: str) -> bytes:
+    return _key.pack(offset, pos.encode("ascii"), lang.encode("ascii"))
+
+
+def write_lemma_table(path: str, entries) -> int:
+    """Writes a lemma table, which maps the offset, part of speech and language of a
+    synset to its first lemma name.
+
+    Parameters
+    ----------
+    path : str
+        Path to write the table to, replacing any existing table
+    entries : iterable of tuple
+        Offset, part of speech (`n`, `v`, `a` or `r`), ISO 639-2 language code and
+        lemma name of each synset. Only the first lemma name of each key is kept.
+
+    Returns
+    -------
+    int
+        Number of lemma names in the table.
+    """
+    lemmas = {}
+    for offset, pos, lang, lemma in entries:
+        lemmas.setdefault(_pack_key(offset, pos, lang), lemma)
+    keys = sorted(lemmas)
+    strings = bytearray()
+    records = bytearray()
+    for key in keys:
+        lemma = lemmas[key].encode("utf-8")
+        records += key + _location.pack(len(strings), len(lemma))
+        strings += lemma
+    tmp_path = f"{os.fspath(path)}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_header.pack(_MAGIC, len(keys)))
+        f.write(records)
+        f.write(strings)
+    # replace atomically, so that processes mapping the old table keep a whole file
+    os.replace(tmp_path, path)
+    _forget_default_table()
+    return len(keys)
+
+
+def iter_omw_lemmas(langs=None):
+    """Iterates over the first lemma name of every synset in every language of the
+    Open Multilingual Wordnet, loading it through NLTK.
+
+    Parameters
+    ----------
+    langs : iterable of str, optional
+        ISO 639-2 language codes to include, by default every language in the corpus
+
+    Yields
+    ------
+    tuple
+        Offset, part of speech, ISO 639-2 language code and first lemma name.
+    """
+    wn = get_wordnet()
+    langs = sorted(wn.langs()) if langs is None else list(langs)
+    for synset in wn.all_synsets():
+        # satellite adjectives are written as adjectives in davar
+        pos = "a" if synset.pos() == "s" else synset.pos()
+        for lang in langs:
+            names = synset.lemma_names(lang)
+            if names:
+                yield synset.offset(), pos, lang, names[0]
+
+
+def build_lemma_table(path: str = DEFAULT_PATH, langs=None) -> int:
+    """Builds a lemma table from the Open Multilingual Wordnet, so that synsets can be
+    described without loading the corpus.
+
+    Parameters
+    ----------
+    path : str, optional
+        Path to write the table to, by default `DEFAULT_PATH`
+    langs : iterable of str, optional
+        ISO 639-2 language codes to include, by default every language in the corpus
+
+    Returns
+    -------
+    int
+        Number of lemma names in the table.
+    """
+    directory = os.path.dirname(os.fspath(path))
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    return write_lemma_table(path, iter_omw_lemmas(langs))
+
+
+class LemmaTable:
+    """Read-only lemma table written by `write_lemma_table`. The file is memory mapped
+    and searched in place, so opening it is instant, only the pages that lookups touch
+    are read, and they are shared by every process that maps the same file.
+    """
+
+    def __init__(self, path: str):
+        """Opens a lemma table.
+
+        Parameters
+        ----------
+        path : str
+            Path to the table
+        """
+        self.path = os.fspath(path)
+        with open(self.path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self._count = _header.unpack_from(self._map)
+        if magic != _MAGIC:
+            raise ValueError(f"{self.path} is not a davar lemma table")
+        self._strings = _header.size + self._count * _RECORD_SIZE
+
+    def get(self, offset: int, pos: str, lang: str):
+        """Returns the first lemma name of a synset, or None if it is not in the table.
+
+        Parameters
+        ----------
+        offset : int
+            Offset of the synset
+        pos : str
+            Part of speech of the synset
+        lang : str
+            ISO 639-2 language code
+
+        Returns
+        -------
+        str or None
+            First lemma name in given language.
+        """
+        if len(lang) != 3 or not lang.isascii():
+            return None
+        key = _pack_key(offset, pos, lang)
+        data = self._map
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = _header.size + mid * _RECORD_SIZE
+            found = data[start : start + _key.size]
+            if found < key:
+                lo = mid + 1
+            elif found > key:
+                hi = mid
+            else:
+                at, length = _location.unpack_from(data, start + _key.size)
+                at += self._strings
+                return data[at : at + length].decode("utf-8")
+        return None
+
+    def __len__(self) -> int:
+        """Returns the number of lemma names in the table."""
+        return self._count
+
+    def close(self):
+        """Unmaps the table."""
+        self._map.close()
+
+
+# the table at `DEFAULT_PATH`, or None if it was not built, once looked for
+_UNSET = object()
+_default_table = _UNSET
+_default_table_lock = threading.Lock()
+
+
+def default_lemma_table():
+    """Returns the lemma table at `DEFAULT_PATH`, opening it on first use, or None if
+    it has not been built. It is only looked for once, and again after a table is
+    written.
+
+    Returns
+    -------
+    LemmaTable or None
+        Default lemma table.
+    """
+    global _default_table
+    table = _default_table
+    if table is _UNSET:
+        with _default_table_lock:
+            if _default_table is _UNSET:
+                if os.path.exists(DEFAULT_PATH):
+                    _default_table = LemmaTable(DEFAULT_PATH)
+                else:
+                    _default_table = None
+            table = _default_table
+    return table
+
+
+def _forget_default_table():
+    """Makes `default_lemma_table` look for the table again on its next call."""
+    global _default_table
+    with _default_table_lock:
+        _default_table = _UNSET
+
+
+def main(argv=None):
+    """Builds a lemma table from the Open Multilingual Wordnet from the command line.
+
+    Parameters
+    ----------
+    argv : list, optional
+        Command line arguments after `lemmas`, by default those of this process
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m davar lemmas",
+        description="Build a lemma table from the Open Multilingual Wordnet, so that "
+        "synsets can be described without loading it.",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        default=DEFAULT_PATH,
+        metavar="TABLE",
+        help=f"Table file to write, by default {DEFAULT_PATH}.",
+    )
+    parser.add_argument(
+        "--langs",
+        help="Comma separated ISO 639-2 language codes to include, like eng,fra. "
+        "By default every language in the corpus.",
+    )
+    args = parser.parse_args(argv)
+
+    langs = args.langs.split(",") if args.langs else None
+    count = build_lemma_table(args.output, langs)
+    print(f"Wrote {count} lemma names to {args.output}.", file=sys.stderr)
@@ -1,16 +1,769 @@
-from wikidata.client import Client
 from re import compile
-from nltk.corpus import wordnet as wn
-import pycountry
+from collections import OrderedDict, namedtuple
+from urllib.error import HTTPError
+from urllib.parse import urlencode, urlsplit
+import gzip
+import json
+import os
+import sqlite3
+import threading
+import time
+import weakref
+from functools import lru_cache
+from davar import instrument
+from davar.corpora import get_wordnet
+from davar.lemmas import default_lemma_table
+
+# shared by all Wikidata words for `.data`, built on first use so that constructing
+# words never touches the network, and importing davar never imports wikidata
+_client = None
+
+
+def _get_client():
+    """Returns the Wikidata client shared by all Wikidata words, building it on first
+    use.
+
+    Returns
+    -------
+    Client
+        Shared Wikidata client.
+    """
+    global _client
+    if _client is None:
+        from wikidata.client import Client
+
+        _client = Client()
+    return _client
+
+
+class HTTPClient:
+    """Minimal HTTP client for fetching JSON, shared by all Words. Keeps one persistent
+    (keep-alive) connection per host for each thread, so that connections are reused
+    across requests instead of paying for a new TCP and TLS handshake every time, and
+    asks for gzip compressed responses.
+    """
+
+    def __init__(
+        self,
+        timeout: float = 30,
+        user_agent: str = "davar (https://github.com/impossiblynew/davar)",
+    ):
+        """Constructs an HTTPClient.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Seconds to wait for a connection or response, by default 30
+        user_agent : str, optional
+            User-Agent header sent with every request
+        """
+        self.timeout = timeout
+        self.user_agent = user_agent
+        self._local = threading.local()
+
+    def _connection(self, scheme: str, netloc: str, fresh: bool = False):
+        """Returns the connection to a host for the current thread, opening it if there
+        is none yet or if fresh is true.
+        """
+        from http.client import HTTPConnection, HTTPSConnection
+
+        connections = self._local.__dict__.setdefault("connections", {})
+        key = (scheme, netloc)
+        if fresh or key not in connections:
+            if key in connections:
+                connections[key].close()
+            connection_class = HTTPSConnection if scheme == "https" else HTTPConnection
+            connections[key] = connection_class(netloc, timeout=self.timeout)
+        return connections[key]
+
+    def get_json(self, url: str):
+        """Fetches and decodes a JSON document.
+
+        Parameters
+        ----------
+        url : str
+            URL of the document
+
+        Returns
+        -------
+        object
+            The decoded document.
+
+        Raises
+        ------
+        urllib.error.HTTPError
+            Raised if the server does not respond with status 200.
+        """
+        from http.client import HTTPException
+
+        parts = urlsplit(url)
+        path = f"{parts.path or '/'}?{parts.query}" if parts.query else parts.path
+        headers = {"User-Agent": self.user_agent, "Accept-Encoding": "gzip"}
+        connection = self._connection(parts.scheme, parts.netloc)
+        with instrument.phase("http"):
+            try:
+                connection.request("GET", path, headers=headers)
+                response = connection.getresponse()
+            except (HTTPException, ConnectionError):
+                # the server may have closed a kept-alive connection, so retry once
+                connection = self._connection(parts.scheme, parts.netloc, fresh=True)
+                connection.request("GET", path, headers=headers)
+                response = connection.getresponse()
+            body = response.read()
+        if instrument.enabled():
+            instrument.count("http.requests")
+            instrument.count("http.bytes", len(body))
+        if response.status != 200:
+            raise HTTPError(
+                url, response.status, response.reason, response.headers, None
+            )
+        if response.getheader("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+        return json.loads(body)
+
+    def close(self):
+        """Closes the connections of the current thread."""
+        for connection in self._local.__dict__.pop("connections", {}).values():
+            connection.close()
+
+
+# HTTP client used for every request for labels
+http_client = HTTPClient()
+
+
+# endpoint of the Wikidata API, used to fetch labels in bulk
+WIKIDATA_API_URL = "https://www.wikidata.org/w/api.php"
+# most ids the wbgetentities API accepts in one request
+WBGETENTITIES_MAX_IDS = 50
+
+
+def fetch_wikidata_labels(ids, langs, api_url: str = None) -> dict:
+    """Fetches the labels of many Wikidata entities at once through the Wikidata
+    `wbgetentities` API with `http_client`, making one request per
+    `WBGETENTITIES_MAX_IDS` ids.
+
+    Parameters
+    ----------
+    ids : iterable of str
+        Wikidata entity identifiers, like `Q42` or `P31`
+    langs : iterable of str
+        BCP 47 language tags of the labels to fetch
+    api_url : str, optional
+        URL of the Wikidata API, by default `WIKIDATA_API_URL`
+
+    Returns
+    -------
+    dict
+        Maps `(id, lang)` to label, for every label that exists.
+    """
+    if api_url is None:
+        api_url = WIKIDATA_API_URL
+    ids = list(dict.fromkeys(ids))
+    languages = "|".join(langs)
+    labels = {}
+    for start in range(0, len(ids), WBGETENTITIES_MAX_IDS):
+        query = urlencode(
+            {
+                "action": "wbgetentities",
+                "ids": "|".join(ids[start : start + WBGETENTITIES_MAX_IDS]),
+                "props": "labels",
+                "languages": languages,
+                "format": "json",
+            }
+        )
+        result = http_client.get_json(f"{api_url}?{query}")
+        for key, entity in result.get("entities", {}).items():
+            # redirected entities are keyed by their target, but asked for by source
+            entity_id = entity.get("redirects", {}).get("from", key)
+            for lang, label in entity.get("labels", {}).items():
+                labels[(entity_id, lang)] = label["value"]
+    return labels
+
+
+CacheInfo = namedtuple(
+    "CacheInfo", ["hits", "misses", "evictions", "maxsize", "currsize"]
+)
+
+
+class LRUCache:
+    """Bounded in-memory cache that evicts the least recently used entries first, and
+    counts its hits, misses and evictions so that it can be sized. Safe to share
+    between threads.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        """Constructs an empty LRUCache.
+
+        Parameters
+        ----------
+        maxsize : int, optional
+            Most entries kept, by default 4096. A maxsize of 0 disables the cache.
+        """
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = self._misses = self._evictions = 0
+
+    def get(self, key, default=None):
+        """Returns the value cached for a key, marking it as recently used, or default
+        if there is none.
+
+        Parameters
+        ----------
+        key : hashable
+            Cache key
+        default : optional
+            Returned if nothing is cached for key, by default None
+        """
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self._misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def set(self, key, value):
+        """Caches a value for a key, evicting the least recently used entries if the
+        cache is full.
+
+        Parameters
+        ----------
+        key : hashable
+            Cache key
+        value
+            Value to cache
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            self._evict()
+
+    def _evict(self):
+        """Evicts least recently used entries until at most maxsize are left."""
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def resize(self, maxsize: int):
+        """Changes the most entries kept, evicting entries if there are now too many.
+
+        Parameters
+        ----------
+        maxsize : int
+            Most entries kept
+        """
+        with self._lock:
+            self.maxsize = maxsize
+            self._evict()
+
+    def invalidate(self, key):
+        """Removes the value cached for a key, if any.
+
+        Parameters
+        ----------
+        key : hashable
+            Cache key
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """Removes every cached value and resets the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def stats(self) -> CacheInfo:
+        """Returns statistics about the use of this cache.
+
+        Returns
+        -------
+        CacheInfo
+            Hits, misses and evictions since the cache was last cleared, and the
+            current maxsize and number of entries.
+        """
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                self.maxsize,
+                len(self._entries),
+            )
+
+    def __len__(self) -> int:
+        """Returns the number of cached entries."""
+        return len(self._entries)
+
+
+class SQLiteLabelCache:
+    """Persistent cache of Word labels keyed by Word identifier and language, stored in
+    an SQLite database. Several processes can safely share one database file, so that
+    labels fetched by one run are reused by later runs.
+    """
+
+    # most variables in one SQLite statement, for bulk lookups
+    _max_variables = 500
+
+    def __init__(self, path: str, ttl: float = None, max_entries: int = None):
+        """Opens, creating if needed, a label cache stored in an SQLite database.
+
+        Parameters
+        ----------
+        path : str
+            Path to the database file
+        ttl : float, optional
+            Seconds a label is kept before it is fetched again, by default forever
+        max_entries : int, optional
+            Most labels kept, by default no limit. Once exceeded, the oldest labels are
+            evicted until a tenth of them are gone. Labels written by other processes
+            are only noticed the next time this one counts them.
+        """
+        self.path = os.fspath(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        # labels in the cache as of the last count, plus those written since, which
+        # can only be more than there are
+        self._count = None
+        self._local = threading.local()
+        with self._connection() as db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS labels (id TEXT, lang TEXT, label TEXT, "
+                "fetched REAL, PRIMARY KEY (id, lang)) WITHOUT ROWID"
+            )
+            db.execute("CREATE INDEX IF NOT EXISTS labels_fetched ON labels (fetched)")
+
+    def _connection(self) -> sqlite3.Connection:
+        """Returns a connection to the database for the current thread and process, as
+        SQLite connections can't be shared across either.
+        """
+        pid = os.getpid()
+        if getattr(self._local, "pid", None) != pid:
+            db = sqlite3.connect(self.path, timeout=30)
+            db.execute("PRAGMA journal_mode=WAL")
+            self._local.db = db
+            self._local.pid = pid
+        return self._local.db
+
+    def _oldest_fresh(self) -> float:
+        """Returns the time before which cached labels have expired."""
+        return time.time() - self.ttl if self.ttl is not None else float("-inf")
+
+    def get(self, id: str, lang: str):
+        """Returns a cached label, or None if it is not cached or has expired.
+
+        Parameters
+        ----------
+        id : str
+            Word identifier
+        lang : str
+            BCP 47 language tag
+
+        Returns
+        -------
+        str or None
+            Cached label
+        """
+        row = (
+            self._connection()
+            .execute(
+                "SELECT label FROM labels WHERE id = ? AND lang = ? AND fetched >= ?",
+                (id, lang, self._oldest_fresh()),
+            )
+            .fetchone()
+        )
+        return row[0] if row is not None else None
+
+    def get_many(self, ids, langs) -> dict:
+        """Returns every cached label for the given identifiers and languages.
+
+        Parameters
+        ----------
+        ids : iterable of str
+            Word identifiers
+        langs : iterable of str
+            BCP 47 language tags
+
+        Returns
+        -------
+        dict
+            Maps `(id, lang)` to label, for every cached label that has not expired.
+        """
+        ids = list(ids)
+        langs = list(langs)
+        labels = {}
+        db = self._connection()
+        step = self._max_variables - len(langs) - 1
+        for start in range(0, len(ids), step):
+            chunk = ids[start : start + step]
+            rows = db.execute(
+                f"SELECT id, lang, label FROM labels "
+                f"WHERE id IN ({','.join('?' * len(chunk))}) "
+                f"AND lang IN ({','.join('?' * len(langs))}) AND fetched >= ?",
+                (*chunk, *langs, self._oldest_fresh()),
+            )
+            for id, lang, label in rows:
+                labels[(id, lang)] = label
+        return labels
+
+    def set(self, id: str, lang: str, label: str):
+        """Caches a label.
+
+        Parameters
+        ----------
+        id : str
+            Word identifier
+        lang : str
+            BCP 47 language tag
+        label : str
+            Label of the Word in the given language
+        """
+        self.set_many({(id, lang): label})
+
+    def set_many(self, labels: dict):
+        """Caches many labels at once, evicting the oldest labels if the cache grows
+        past `max_entries`.
+
+        Parameters
+        ----------
+        labels : dict
+            Maps `(id, lang)` to label
+        """
+        now = time.time()
+        with self._connection() as db:
+            db.executemany(
+                "INSERT OR REPLACE INTO labels VALUES (?, ?, ?, ?)",
+                ((id, lang, label, now) for (id, lang), label in labels.items()),
+            )
+            if self.ttl is not None:
+                db.execute("DELETE FROM labels WHERE fetched < ?", (now - self.ttl,))
+            if self.max_entries is not None:
+                self._evict(db, len(labels))
+
+    def _evict(self, db: sqlite3.Connection, written: int):
+        """Evicts the oldest labels if the cache may have grown past `max_entries`,
+        only counting them, which scans the whole table, when the labels written since
+        the last count could have filled it.
+        """
+        if self._count is not None:
+            self._count += written
+            if self._count <= self.max_entries:
+                return
+        (count,) = db.execute("SELECT COUNT(*) FROM labels").fetchone()
+        if count > self.max_entries:
+            # evict a tenth more than needed, so that the next count is that many
+            # writes away
+            keep = self.max_entries - self.max_entries // 10
+            db.execute(
+                "DELETE FROM labels WHERE (id, lang) IN (SELECT id, lang "
+                "FROM labels ORDER BY fetched LIMIT ?)",
+                (count - keep,),
+            )
+            count = keep
+        self._count = count
+
+    def clear(self):
+        """Removes every cached label."""
+        with self._connection() as db:
+            db.execute("DELETE FROM labels")
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Returns the number of cached labels."""
+        return self._connection().execute("SELECT COUNT(*) FROM labels").fetchone()[0]
+
+
+# in-memory cache of Word labels shared by all Words, keyed by (class, id, lang)
+label_lru = LRUCache()
+# persistent cache consulted for Word labels before they are fetched, if set
+label_cache = None
+# offline index of Wikidata labels, like a `wikidump.LabelIndex`, consulted before
+# fetching Wikidata labels if set
+label_index = None
+# if true, Wikidata labels are never fetched from the network, so only labels in
+# `label_index` or a cache can be described
+offline = False
+# table of OMW lemma names, like a `lemmas.LemmaTable`, consulted before loading the
+# Open Multilingual Wordnet if set, or else the table at `lemmas.DEFAULT_PATH` if built
+lemma_table = None
+# in-memory cache of Statement descriptions, keyed by (Statement, lang, lvl > 0), used
+# by `Statement.describe` if set, so that repeated subtrees are described once per
+# language
+render_cache = None
+# longest description kept in `render_cache`, so that describing deeply nested
+# Statements doesn't copy ever longer descriptions at every level
+RENDER_CACHE_MAX_LENGTH = 4096
+
+
+def resolve_labels(words, langs, api_url: str = None, workers: int = 1):
+    """Resolves the labels of many Words at once, so that describing them needs no
+    further requests. Labels of Wikidata entities are read from `label_lru`,
+    `label_index` or `label_cache` if in any, and otherwise fetched in bulk with
+    `fetch_wikidata_labels`, once per distinct identifier, unless `offline` is set.
+    Other Words are ignored.
+
+    Parameters
+    ----------
+    words : iterable of DavarWord
+        Words to resolve
+    langs : iterable of str
+        BCP 47 language tags of the labels to resolve
+    api_url : str, optional
+        URL of the Wikidata API, by default `WIKIDATA_API_URL`
+    workers : int, optional
+        Number of threads fetching batches of labels in parallel, by default 1
+    """
+    with instrument.phase("resolve"):
+        _resolve_labels(words, list(langs), api_url, workers)
+
+
+# threads fetching labels in parallel, kept across calls so that each keeps its
+# connections in `http_client` alive, and the process they were started in
+_fetch_pool = None
+_fetch_pool_size = 0
+_fetch_pool_pid = None
+_fetch_pool_lock = threading.Lock()
+
+
+def _get_fetch_pool(workers: int):
+    """Returns the thread pool shared by every call fetching labels in parallel, with
+    at least workers threads, starting it on first use and again after a fork.
+    """
+    global _fetch_pool, _fetch_pool_size, _fetch_pool_pid
+    with _fetch_pool_lock:
+        pid = os.getpid()
+        if _fetch_pool_pid != pid:
+            # threads don't survive a fork, so the child starts its own
+            _fetch_pool, _fetch_pool_size, _fetch_pool_pid = None, 0, pid
+        if _fetch_pool_size < workers:
+            from concurrent.futures import ThreadPoolExecutor
+
+            if _fetch_pool is not None:
+                # its threads finish the work they were given, then exit
+                _fetch_pool.shutdown(wait=False)
+            _fetch_pool = ThreadPoolExecutor(workers, "davar-labels")
+            _fetch_pool_size = workers
+        return _fetch_pool
+
+
+def _resolve_labels(words, langs: list, api_url: str, workers: int):
+    """Resolves labels for `resolve_labels`."""
+    unresolved, labels, missing = _cached_labels(words, langs)
+    batches = _batches(missing) if not offline else []
+    fetched = {}
+    if workers > 1 and len(batches) > 1:
+        fetch = instrument.bind(fetch_wikidata_labels)
+
+        def fetch_batches(shard):
+            found = {}
+            for batch in shard:
+                found.update(fetch(batch, langs, api_url=api_url))
+            return found
+
+        # at most workers batches are fetched at once, however large the pool is
+        shards = [batches[i::workers] for i in range(min(workers, len(batches)))]
+        for shard_labels in _get_fetch_pool(workers).map(fetch_batches, shards):
+            fetched.update(shard_labels)
+    elif batches:
+        fetched = fetch_wikidata_labels(missing, langs, api_url=api_url)
+    _store_labels(unresolved, labels, fetched)
+
+
+async def aresolve_labels(words, langs, api_url: str = None, concurrency: int = 8):
+    """Resolves the labels of many Words at once like `resolve_labels`, but without
+    blocking the event loop: bulk requests for Wikidata labels are made concurrently,
+    as are lookups of labels of other Words.
+
+    Parameters
+    ----------
+    words : iterable of DavarWord
+        Words to resolve
+    langs : iterable of str
+        BCP 47 language tags of the labels to resolve
+    api_url : str, optional
+        URL of the Wikidata API, by default `WIKIDATA_API_URL`
+    concurrency : int, optional
+        Most requests or lookups made at the same time, by default 8
+    """
+    import asyncio
+
+    langs = list(langs)
+    words = set(words)
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(concurrency)
+    pool = _get_fetch_pool(concurrency)
+
+    async def run(func, *args):
+        async with semaphore:
+            return await loop.run_in_executor(pool, instrument.bind(func), *args)
+
+    unresolved, labels, missing = _cached_labels(words, langs)
+    batches = _batches(missing) if not offline else []
+    others = [
+        (word, lang)
+        for word in words
+        if not isinstance(word, WikidataEntity)
+        for lang in langs
+    ]
+    results = await asyncio.gather(
+        *(run(fetch_wikidata_labels, batch, langs, api_url) for batch in batches),
+        *(run(word._label, lang) for word, lang in others),
+    )
+    fetched = {}
+    for batch_labels in results[: len(batches)]:
+        fetched.update(batch_labels)
+    _store_labels(unresolved, labels, fetched)
+
+
+def _batches(ids: list) -> list:
+    """Splits identifiers into batches small enough for one `wbgetentities` request."""
+    return [
+        ids[start : start + WBGETENTITIES_MAX_IDS]
+        for start in range(0, len(ids), WBGETENTITIES_MAX_IDS)
+    ]
+
+
+def _cached_labels(words, langs: list) -> tuple:
+    """Finds the Wikidata entities among Words that are missing a resolved label in any
+    of the given languages, and looks their labels up in `label_lru`, `label_index`
+    and `label_cache`.
+
+    Returns
+    -------
+    tuple
+        A dict mapping the identifier of each such entity to its Word, a dict mapping
+        `(id, lang)` to every label found, and a list of the identifiers still missing
+        a label.
+    """
+    unresolved = {}
+    for word in words:
+        if isinstance(word, WikidataEntity) and any(
+            lang not in word._labels for lang in langs
+        ):
+            unresolved[word.id] = word
+    labels = {}
+    for id, word in unresolved.items():
+        for lang in langs:
+            label = label_lru.get((type(word), id, lang))
+            if label is not None:
+                labels[(id, lang)] = label
+    if instrument.enabled():
+        instrument.count("labels.lru_hits", len(labels))
+    missing = _missing_labels(unresolved, langs, labels)
+    for name, cache in (("index", label_index), ("cache", label_cache)):
+        if missing and cache is not None:
+            found = cache.get_many(missing, langs)
+            labels.update(found)
+            missing = _missing_labels(missing, langs, labels)
+            if instrument.enabled():
+                instrument.count(f"labels.{name}_hits", len(found))
+    return unresolved, labels, missing
+
+
+def _store_labels(unresolved: dict, labels: dict, fetched: dict):
+    """Stores labels on the Words they were resolved for and in `label_lru`, and newly
+    fetched labels in `label_cache`.
+
+    Parameters
+    ----------
+    unresolved : dict
+        Maps identifier to the Word to store its labels on
+    labels : dict
+        Maps `(id, lang)` to label, for labels found in a cache
+    fetched : dict
+        Maps `(id, lang)` to label, for labels fetched from Wikidata
+    """
+    if label_cache is not None and fetched:
+        label_cache.set_many(fetched)
+    if instrument.enabled():
+        instrument.count("labels.fetched", len(fetched))
+    labels.update(fetched)
+    for (id, lang), label in labels.items():
+        word = unresolved.get(id)
+        if word is not None:
+            word._labels[lang] = label
+            label_lru.set((type(word), id, lang), label)
+
+
+def configure_labels(cache: str = None, index: str = None, offline: bool = False):
+    """Sets where labels are read from, as the command line tools do.
+
+    Parameters
+    ----------
+    cache : str, optional
+        Path to an SQLite file to keep labels in across runs, set as `label_cache`,
+        by default the current `label_cache` is kept
+    index : str, optional
+        Path to an offline Wikidata label index built by `wikidump`, set as
+        `label_index`, by default the current `label_index` is kept
+    offline : bool, optional
+        If true, Wikidata labels are never fetched, only read from the index or the
+        cache, by default False
+    """
+    global label_cache, label_index
+    if cache is not None:
+        label_cache = SQLiteLabelCache(cache)
+    if index is not None:
+        from davar.wikidump import LabelIndex
+
+        label_index = LabelIndex(index)
+    # the parameter shadows the module's setting of the same name
+    globals()["offline"] = offline
+
+
+def clear_labels():
+    """Forgets every label held in memory, both in `label_lru` and resolved on Words,
+    so that labels are fetched again the next time they are needed.
+    """
+    label_lru.clear()
+    if render_cache is not None:
+        render_cache.clear()
+    for word in list(_interned_words.values()):
+        word._forget()
+
+
+def _missing_labels(ids, langs, labels: dict) -> list:
+    """Returns the identifiers missing a label in any of the given languages."""
+    return [id for id in ids if any((id, lang) not in labels for lang in langs)]
+
+
+# every living Word, keyed by (class, id), so that each identifier maps to one Word
+_interned_words = weakref.WeakValueDictionary()
+_interned_words_lock = threading.Lock()
 
 
 class DavarWord:
-    """Informal abstract class for Words, like Rel and Node.
+    """Informal abstract class for Words, like Rel and Node. Words are immutable and
+    interned: constructing a Word of the same class and identifier as an existing Word
+    returns that Word.
     """
 
-    def __init__(self, id: str):
-        """Initializes a Word from an identifier. This should only be used on 
-        super().__init__.
+    def __new__(cls, id: str):
+        """Returns the Word of this class for an identifier, constructing and
+        initializing it if there is none yet.
+
+        Parameters
+        ----------
+        id : str
+            Word identifier
+        """
+        key = (cls, id)
+        word = _interned_words.get(key)
+        if word is None:
+            with _interned_words_lock:
+                word = _interned_words.get(key)
+                if word is None:
+                    word = super().__new__(cls)
+                    word._initialize(id)
+                    _interned_words[key] = word
+        return word
+
+    def _initialize(self, id: str):
+        """Initializes a new Word from an identifier. This should only be used by
+        `__new__` and on super()._initialize.
 
         Parameters
         ----------
@@ -18,7 +771,19 @@ class DavarWord:
             Word identifier
         """
         self._validate_id(id)
-        self.id = id
+        object.__setattr__(self, "id", id)
+
+    def __setattr__(self, name, value):
+        """Raises AttributeError, as Words are immutable."""
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        """Raises AttributeError, as Words are immutable."""
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self):
+        """Pickles self by identifier, so that unpickling returns the interned Word."""
+        return (type(self), (self.id,))
 
     def _validate_id(self, id: str):
         """Informal abstract method for validating id on init. This method should be
@@ -48,8 +813,86 @@ class DavarWord:
 
     def __eq__(self, other) -> bool:
         """Returns True if equal, false if not."""
+        if not isinstance(other, DavarWord):
+            return NotImplemented
         return self.id == other.id
 
+    def __hash__(self) -> int:
+        """Returns hash of self, consistent with equality."""
+        return hash(self.id)
+
+    def resolve(self, langs=("en",)):
+        """Fetches any external data this Word needs to be described in the given
+        languages. Words are plain identifiers until they are described or resolved,
+        so that constructing them needs no network or corpus I/O. Does nothing for
+        Words without external data.
+
+        Parameters
+        ----------
+        langs : iterable of str, optional
+            BCP 47 language tags, by default en
+
+        Returns
+        -------
+        DavarWord
+            self
+        """
+        return self
+
+    def _forget(self):
+        """Forgets any external data fetched for this Word. Does nothing for Words
+        without external data.
+        """
+
+    def _fetch_label(self, lang: str) -> str:
+        """Informal abstract method for fetching the label of this Word in a given
+        language from its external data. Should be implemented by any subclass that
+        is described by its label.
+
+        Parameters
+        ----------
+        lang : str
+            BCP 47 language tag
+
+        Raises
+        ------
+        NotImplementedError
+            Will always be raised if this method is called, as it is an abstract method.
+        """
+        raise NotImplementedError
+
+    def _label(self, lang: str) -> str:
+        """Returns the label of this Word in a given language, from `label_lru` or
+        `label_cache` if cached in either, or from `._fetch_label()` if not.
+
+        Parameters
+        ----------
+        lang : str
+            BCP 47 language tag
+
+        Returns
+        -------
+        str
+            Label in given language
+        """
+        key = (type(self), self.id, lang)
+        label = label_lru.get(key)
+        if label is not None:
+            if instrument.enabled():
+                instrument.count("labels.lru_hits")
+            return label
+        cache = label_cache
+        if cache is not None:
+            label = cache.get(self.id, lang)
+            if label is not None and instrument.enabled():
+                instrument.count("labels.cache_hits")
+        if label is None:
+            label = self._fetch_label(lang)
+            if cache is not None:
+                cache.set(self.id, lang, label)
+        label_lru.set(key, label)
+        return label
+
     def describe(self, lang: str, lvl: int = 0) -> str:
         """Informal abstract method. Should be implemented by any subclasses. When
         implemented, returns a human-readable description of the Word in a given 
@@ -81,9 +924,6 @@ class Node(DavarWord):
     subclasses of Node and of Rel can be distinguished easily.
     """
 
-    def __init__(self, id):
-        super().__init__(id)
-
 
 class Rel(DavarWord):
     """Informal abstract class for Rel in davar, which represent properties, verbs, or any 
@@ -91,31 +931,126 @@ class Rel(DavarWord):
     Node, and exists so that subclasses of Node and of Rel can be distinguished easily.
     """
 
-    def __init__(self, id):
-        super().__init__(id)
-
 
-class WikidataItem(Node):
-    """Class for Wikidata Items, a type of Node, which is itself a type of DavarWord.
+class WikidataEntity(DavarWord):
+    """Informal abstract mixin for DavarWords that are Wikidata entities, which share
+    how their data is fetched from Wikidata.
     """
 
-    _compiled_id_regex = compile(r"Q\d+")
-
-    def __init__(self, id: str):
-        """Constructs and initializes a WikidataItem from a valid Wikidata Property
-        identifier.
+    def _initialize(self, id: str):
+        """Initializes a new WikidataEntity from an identifier. This should only be
+        used by `__new__` and on super()._initialize.
 
         Parameters
         ----------
         id : str
-            A valid Wikidata Item identifier in the form Q# where # is a natural number.
+            Wikidata entity identifier
+        """
+        super()._initialize(id)
+        # labels resolved in bulk by `resolve_labels`
+        object.__setattr__(self, "_labels", {})
+
+    @property
+    def data(self):
+        """The `wikidata` entity for this Word, kept for compatibility, as labels are
+        fetched without it. The entity is looked up on first access, and its data is
+        only fetched when it is first read.
+        """
+        try:
+            return self._data
+        except AttributeError:
+            object.__setattr__(self, "_data", _get_client().get(self.id))
+            return self._data
+
+    def resolve(self, langs=("en",)):
+        """Fetches the labels of this Word's Wikidata entity in the given languages
+        with `resolve_labels`, unless they were already resolved.
+
+        Parameters
+        ----------
+        langs : iterable of str, optional
+            BCP 47 language tags, by default en
+
+        Returns
+        -------
+        WikidataEntity
+            self
+        """
+        resolve_labels([self], langs)
+        return self
+
+    def _forget(self):
+        """Forgets the Wikidata entity and labels resolved for this Word."""
+        self._labels.clear()
+        self.__dict__.pop("_data", None)
+
+    def _fetch_label(self, lang: str) -> str:
+        """Fetches the label of this Word's Wikidata entity in a given language, from
+        `label_index` if set and indexed there, or otherwise from Wikidata unless
+        `offline` is set. Only the label is fetched, rather than all of the entity's
+        data.
+
+        Parameters
+        ----------
+        lang : str
+            BCP 47 language tag
+
+        Returns
+        -------
+        str
+            Label in given language
+
+        Raises
+        ------
+        KeyError
+            Raised if the entity has no label in the given language, or if `offline`
+            is set and the label is not in `label_index`.
         """
-        super().__init__(id)
-        self.data = Client().get(id)
+        if label_index is not None:
+            label = label_index.get(self.id, lang)
+            if label is not None:
+                if instrument.enabled():
+                    instrument.count("labels.index_hits")
+                return label
+        if offline:
+            raise KeyError(lang)
+        try:
+            label = fetch_wikidata_labels([self.id], [lang])[(self.id, lang)]
+        except KeyError:
+            raise KeyError(lang) from None
+        if instrument.enabled():
+            instrument.count("labels.fetched")
+        return label
+
+    def _label(self, lang: str) -> str:
+        """Returns the label of this Word in a given language, from the labels resolved
+        by `resolve_labels` if there, or as any other Word's label if not.
+
+        Parameters
+        ----------
+        lang : str
+            BCP 47 language tag
+
+        Returns
+        -------
+        str
+            Label in given language
+        """
+        try:
+            return self._labels[lang]
+        except KeyError:
+            return super()._label(lang)
+
+
+class WikidataItem(WikidataEntity, Node):
+    """Class for Wikidata Items, a type of Node, which is itself a type of DavarWord.
+    """
+
+    _compiled_id_regex = compile(r"Q\d+")
 
     @classmethod
     def _validate_id(cls, id: str):
-        """Called at `__init__` to validate identifiers, which should be in the form
+        """Called on construction to validate identifiers, which should be in the form
         `Q#` where `#` is a natural number. Does nothing if the identifier is valid, but
         throws a ValueError if it is invalid.
 
@@ -148,31 +1083,18 @@ class WikidataItem(Node):
         str
             Wikidata Item label in given language
         """
-        return self.data.label[lang]
+        return self._label(lang)
 
 
-class WikidataProperty(Rel):
+class WikidataProperty(WikidataEntity, Rel):
     """Class for Wikidata Properties, a type of Rel, which is itself a type of DavarWord.
     """
 
     _compiled_id_regex = compile(r"P\d+")
 
-    def __init__(self, id: str):
-        """Constructs and initializes a WikidataProperty from a valid Wikidata
-        Property identifier.
-
-        Parameters
-        ----------
-        id : str
-            A valid Wikidata Property identifier in the form `P#` where `#` is a
-            natural number.
-        """
-        super().__init__(id)
-        self.data = Client().get(id)
-
     @classmethod
     def _validate_id(cls, id):
-        """Called at `__init__` to validate identifiers, which should be in the form
+        """Called on construction to validate identifiers, which should be in the form
         `P#` where `#` is a natural number. Does nothing if the identifier is valid, but
         throws a ValueError if it is invalid.
 
@@ -205,28 +1127,18 @@ class WikidataProperty(Rel):
         str
             Wikidata Property label in given language
         """
-        return self.data.label[lang]
+        return self._label(lang)
 
 
 class OMWSynset(Node, Rel):
     """A Synonym Set in the Open Multilingual Wordnet, representing a set of synonyms
-    that represent the same idea across languages.
+    that represent the same idea across languages. Identified by Part Of Speech and
+    offset, in the form `OFFSET-POS` where `OFFSET` is an eight digit code and POS is a
+    letter representing part of speech, either 'v,' 'r,' 'n,' or 'a.'
     """
 
     _compiled_id_regex = compile(r"\d{8}-[v|r|n|a]")
 
-    def __init__(self, id: str):
-        """Constructs a OMWSynset from an "identifier," more formally Part Of Speech and
-        offset, in the form `OFFSET-POS` where `OFFSET` is an eight digit code and POS
-        is a letter representing part of speech, either 'v,' 'r,' 'n,' or 'a.'
-
-        Parameters
-        ----------
-        id : str
-            Synset offset and POS.
-        """
-        super().__init__(id)
-
     @classmethod
     def _validate_id(cls, id):
         if cls._compiled_id_regex.fullmatch(id) == None:
@@ -235,6 +1147,7 @@ class OMWSynset(Node, Rel):
             )
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def _bcp_47_to_iso_639_2(lang_tag: str) -> str:
         """Utility function for getting a ISO 639-2 three letter language code from a 
         BCP 47 language tag.
@@ -256,7 +1169,10 @@ class OMWSynset(Node, Rel):
             # three letter lang tags are already in alpha_3 format
             return lang_tag
         else:
-            return pycountry.languages.get(alpha_2=lang_tag).alpha_3
+            with instrument.phase("language_mapping"):
+                import pycountry
+
+                return pycountry.languages.get(alpha_2=lang_tag).alpha_3
 
     def describe(self, lang: str, lvl: int = 0) -> str:
         """Returns the first listed lemma name for Synset in a given language. Ignores
@@ -274,17 +1190,54 @@ class OMWSynset(Node, Rel):
         str
             First lemma name for Synset in a given language.
         """
-        return wn.synset_from_pos_and_offset(
-            self.id[-1], int(self.id[:-2])
-        ).lemma_names(self._bcp_47_to_iso_639_2(lang))[0]
+        return self._label(lang)
+
+    def _fetch_label(self, lang: str) -> str:
+        """Returns the first listed lemma name for Synset in a given language from the
+        lemma table, or from the Open Multilingual Wordnet if it is not in the table.
+
+        Parameters
+        ----------
+        lang : str
+            BCP 47 language tag
+
+        Returns
+        -------
+        str
+            First lemma name for Synset in a given language.
+        """
+        offset, pos = int(self.id[:-2]), self.id[-1]
+        lang = self._bcp_47_to_iso_639_2(lang)
+        table = lemma_table if lemma_table is not None else default_lemma_table()
+        if table is not None:
+            lemma = table.get(offset, pos, lang)
+            if lemma is not None:
+                if instrument.enabled():
+                    instrument.count("lemmas.table_hits")
+                return lemma
+        with instrument.phase("wordnet"):
+            synset = get_wordnet().synset_from_pos_and_offset(pos, offset)
+            return synset.lemma_names(lang)[0]
+
+
+# every living Statement, keyed by (class, *children), so that identical Statements
+# are one shared Statement
+_interned_statements = weakref.WeakValueDictionary()
+_interned_statements_lock = threading.Lock()
 
 
 class Statement:
     """Most basic form of Statement (often refered to as a Singleton Statement)
-    involving only a subject.
+    involving only a subject. Statements are immutable and hash-consed: constructing a
+    Statement of the same class and children as an existing Statement returns that
+    Statement, so identical subtrees are stored once and compared by identity.
     """
 
-    def __init__(self, sub):
+    __slots__ = ("sub", "_hash", "__weakref__")
+    # names of the children of this class of Statement, in the order they are written
+    _fields = ("sub",)
+
+    def __new__(cls, sub):
         """Constructs a Singleton Statement from a subject.
 
         Parameters
@@ -292,22 +1245,125 @@ class Statement:
         sub : Node or Statement
             The subject of this statement
         """
-        self.sub = sub
+        return cls._intern((sub,))
+
+    @classmethod
+    def _intern(cls, children: tuple):
+        """Returns the Statement of this class with the given children, constructing it
+        if there is none yet.
+
+        Parameters
+        ----------
+        children : tuple
+            Children of the Statement, in the order of `_fields`
+
+        Returns
+        -------
+        Statement
+            The shared Statement.
+        """
+        key = (cls, *children)
+        statement = _interned_statements.get(key)
+        if statement is None:
+            with _interned_statements_lock:
+                statement = _interned_statements.get(key)
+                if statement is None:
+                    statement = object.__new__(cls)
+                    for name, child in zip(cls._fields, children):
+                        object.__setattr__(statement, name, child)
+                    # children hash in constant time, so this never recurses deeply
+                    object.__setattr__(statement, "_hash", hash(key))
+                    _interned_statements[key] = statement
+        return statement
+
+    def __setattr__(self, name, value):
+        """Raises AttributeError, as Statements are immutable."""
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        """Raises AttributeError, as Statements are immutable."""
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self):
+        """Pickles self by children, so that unpickling returns the shared Statement."""
+        return (type(self), self._children())
 
     def __eq__(self, other) -> bool:
-        return self.__dict__ == other.__dict__  # FIXME: messy, bad
+        """Returns True if equal, false if not."""
+        if self is other:
+            return True
+        if not isinstance(other, Statement):
+            return NotImplemented
+        # identical Statements are shared, so this is only reached if they differ
+        return (
+            type(self) is type(other)
+            and self._hash == other._hash
+            and self._children() == other._children()
+        )
+
+    def __hash__(self) -> int:
+        """Returns hash of self, computed once on construction."""
+        return self._hash
 
     def __repr__(self):
-        return f"Statement({repr(self.sub)})"
+        return "".join(
+            part if isinstance(part, str) else repr(part)
+            for part in self._fragments(layout="_repr_layout")
+        )
 
     def __str__(self):
-        return f"({self.sub})"
+        return "".join(
+            part if isinstance(part, str) else str(part)
+            for part in self._fragments(layout="_str_layout")
+        )
+
+    def _children(self) -> tuple:
+        """Returns the children of this Statement in the order they are written."""
+        return (self.sub,)
+
+    def words(self):
+        """Iterates over every Word in this Statement, including Words in nested
+        Statements, in the order they are written.
+
+        Yields
+        ------
+        DavarWord
+            Each Word in this Statement.
+        """
+        stack = [self]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, Statement):
+                stack.extend(reversed(item._children()))
+            else:
+                yield item
+
+    async def adescribe(self, lang: str, lvl: int = 0, concurrency: int = 8) -> str:
+        """Describes self like `.describe()`, after resolving the labels of all of its
+        Words concurrently with `aresolve_labels`, without blocking the event loop.
+
+        Parameters
+        ----------
+        lang : str
+            BCP 47 language tag
+        lvl : int, optional
+            The level of hierarchy in the text description, by default 0
+        concurrency : int, optional
+            Most requests or lookups made at the same time, by default 8
+
+        Returns
+        -------
+        str
+            Description of self in given language.
+        """
+        await aresolve_labels(self.words(), [lang], concurrency=concurrency)
+        return self.describe(lang, lvl)
 
     def describe(self, lang: str, lvl: int = 0) -> str:
-        """Describes self in human readable format in a given language by calling
-        `.describe()` on children and structuring results in a human readable format.
-        Will return slightly different formatting to minimize confusion if lvl is
-        greater than 0.
+        """Describes self in human readable format in a given language by laying out
+        its description with `._fragments()` and joining it with the descriptions of
+        its Words, or with `._render()` if `render_cache` is set. Will return slightly
+        different formatting to minimize confusion if lvl is greater than 0.
 
         Parameters
         ----------
@@ -321,18 +1377,152 @@ class Statement:
         str
             Description of self in given language.
         """
-        sub_label = self.sub.describe(lang, lvl + 1)
+        if render_cache is not None:
+            return self._render(lang, lvl, render_cache)
+        return _fill_fragments(self._fragments(lvl), lang)
+
+    def _render(self, lang: str, lvl: int, cache) -> str:
+        """Describes self like `.describe()`, reusing the descriptions of Statements
+        found in cache and adding those it renders, so that identical subtrees are
+        described once per language and formatting mode.
+
+        Parameters
+        ----------
+        lang : str
+            BCP 47 language tag
+        lvl : int
+            The level of hierarchy in the text description
+        cache : LRUCache
+            Cache of descriptions, keyed by (Statement, lang, lvl > 0)
+
+        Returns
+        -------
+        str
+            Description of self in given language.
+        """
+        parts = []
+        # Statements being rendered, each as its cache key, where its description
+        # starts in parts, and whether it holds a description too long to cache
+        open_statements = []
+        # items to render, with their level, and None to close the innermost Statement
+        stack = [(self, lvl)]
+        while stack:
+            item, lvl = stack.pop()
+            if item is None:
+                key, start, too_long = open_statements.pop()
+                if not too_long:
+                    text = "".join(parts[start:])
+                    too_long = len(text) > RENDER_CACHE_MAX_LENGTH
+                    if not too_long:
+                        parts[start:] = [text]
+                        cache.set(key, text)
+                if too_long and open_statements:
+                    open_statements[-1][2] = True
+            elif isinstance(item, str):
+                parts.append(item)
+            elif isinstance(item, Statement):
+                key = (item, lang, lvl > 0)
+                text = cache.get(key)
+                if instrument.enabled():
+                    hit = text is not None
+                    instrument.count(f"render_cache.{'hits' if hit else 'misses'}")
+                if text is not None:
+                    parts.append(text)
+                    continue
+                open_statements.append([key, len(parts), False])
+                stack.append((None, lvl))
+                layout = item._describe_layout(lvl)
+                stack.extend((part, lvl + 1) for part in reversed(layout))
+            else:
+                parts.append(item.describe(lang))
+        return "".join(parts)
+
+    def describe_many(self, langs, lvl: int = 0) -> dict:
+        """Describes self like `.describe()` in each of the given languages, walking
+        itself only once: its description is laid out once as fragments of text and
+        Words, which are then filled in with the label of each Word in each language.
+        If `render_cache` is set, each language is rendered with `._render()` instead.
+
+        Parameters
+        ----------
+        langs : iterable of str
+            BCP 47 language tags
+        lvl : int, optional
+            The level of hierarchy in the text description, by default 0
+
+        Returns
+        -------
+        dict
+            Maps each language tag to the description of self in that language.
+        """
+        if render_cache is not None:
+            return {lang: self._render(lang, lvl, render_cache) for lang in langs}
+        fragments = self._fragments(lvl)
+        return {lang: _fill_fragments(fragments, lang) for lang in langs}
+
+    def _fragments(self, lvl: int = 0, layout: str = "_describe_layout") -> list:
+        """Lays self out as a flat list of fragments of text and of the Words that go
+        between them, walking nested Statements with an explicit stack so that
+        Statements of any depth can be laid out.
+
+        Parameters
+        ----------
+        lvl : int, optional
+            The level of hierarchy of self, by default 0
+        layout : str, optional
+            Name of the method laying out one Statement at a level, by default
+            `"_describe_layout"`
+
+        Returns
+        -------
+        list
+            Fragments of text and Words, in order.
+        """
+        fragments = []
+        stack = [(self, lvl)]
+        while stack:
+            item, lvl = stack.pop()
+            if isinstance(item, Statement):
+                parts = getattr(item, layout)(lvl)
+                stack.extend((part, lvl + 1) for part in reversed(parts))
+            else:
+                fragments.append(item)
+        return fragments
+
+    def _describe_layout(self, lvl: int) -> tuple:
+        """Returns the text and children making up the description of self at level
+        lvl, in order.
+        """
         if lvl == 0:  # give fancy formatting if it is top level
-            return f"{sub_label}."
+            return (self.sub, ".")
         else:  # give utilitarian formatting if it is not
-            return f"[{sub_label}]"
+            return ("[", self.sub, "]")
+
+    def _str_layout(self, lvl: int) -> list:
+        """Returns the text and children making up self as written in davar."""
+        parts = ["("]
+        for child in self._children():
+            parts += (child, " ")
+        parts[-1] = ")"
+        return parts
+
+    def _repr_layout(self, lvl: int) -> list:
+        """Returns the text and children making up the representation of self."""
+        parts = [f"{type(self).__name__}("]
+        for child in self._children():
+            parts += (child, ", ")
+        parts[-1] = ")"
+        return parts
 
 
 class Edge(Statement):
     """Statement defining an unlabeled relationship between a subject and an object.
     """
 
-    def __init__(self, sub, ob):
+    __slots__ = ("ob",)
+    _fields = ("sub", "ob")
+
+    def __new__(cls, sub, ob):
         """Constructs an edge from the subject to the object.
 
         Parameters
@@ -342,46 +1532,30 @@ class Edge(Statement):
         ob : Node or Statement
             Object / endpoint of Edge
         """
-        self.ob = ob
-        super().__init__(sub)
+        return cls._intern((sub, ob))
 
-    def __repr__(self):
-        return f"Edge({repr(self.sub)}, {repr(self.ob)})"
+    def _children(self) -> tuple:
+        """Returns the children of this Edge in the order they are written."""
+        return (self.sub, self.ob)
 
-    def __str__(self):
-        return f"({self.sub} {self.ob})"
-
-    def describe(self, lang: str, lvl: int = 0) -> str:
-        """Describes self in human readable format in a given language by calling
-        `.describe()` on children and structuring results in a human readable format.
-        Will return slightly different formatting to minimize confusion if lvl is
-        greater than 0.
-
-        Parameters
-        ----------
-        lang : str
-            BCP 47 language tag
-        lvl : int, optional
-            The level of hierarchy in the text description, by default 0
-
-        Returns
-        -------
-        str
-            Description of self in given language.
+    def _describe_layout(self, lvl: int) -> tuple:
+        """Returns the text and children making up the description of self at level
+        lvl, in order.
         """
-        sub_label = self.sub.describe(lang, lvl + 1)
-        ob_label = self.ob.describe(lang, lvl + 1)
         if lvl == 0:  # give fancy formatting if it is top level
-            return f"{sub_label} → {ob_label}."
+            return (self.sub, " → ", self.ob, ".")
         else:  # give utilitarian formatting if it is not
-            return f"[{sub_label} → {ob_label}]"
+            return ("[", self.sub, " → ", self.ob, "]")
 
 
 class LabeledEdge(Edge):
     """Statement defining a labeled relationship from a subject to an object.
     """
 
-    def __init__(self, rel: Rel, sub, ob):
+    __slots__ = ("rel",)
+    _fields = ("rel", "sub", "ob")
+
+    def __new__(cls, rel: Rel, sub, ob):
         """Constructs a LabeledEdge from subject to object, labeled by a rel.
 
         Parameters
@@ -393,41 +1567,28 @@ class LabeledEdge(Edge):
         ob : Node or Statement
             Object / endpoint of LabeledEdge
         """
-        self.rel = rel
-        super().__init__(sub, ob)
-
-    def __repr__(self):
-        return f"LabeledEdge({repr(self.rel)}, {repr(self.sub)}, {repr(self.ob)})"
+        return cls._intern((rel, sub, ob))
 
-    def __str__(self):
-        return f"({self.rel} {self.sub} {self.ob})"
-
-    def describe(self, lang: str, lvl: int = 0) -> str:
-        """Describes self in human readable format in a given language by calling
-        `.describe()` on children and structuring results in a human readable format.
-        Will return slightly different formatting to minimize confusion if lvl is
-        greater than 0.
+    def _children(self) -> tuple:
+        """Returns the children of this LabeledEdge in the order they are written."""
+        return (self.rel, self.sub, self.ob)
 
-        Parameters
-        ----------
-        lang : str
-            BCP 47 language tag
-        lvl : int, optional
-            The level of hierarchy in the text description, by default 0
-
-        Returns
-        -------
-        str
-            Description of self in given language.
+    def _describe_layout(self, lvl: int) -> tuple:
+        """Returns the text and children making up the description of self at level
+        lvl, in order.
         """
-        rel_label = self.rel.describe(lang, lvl + 1)
-        sub_label = self.sub.describe(lang, lvl + 1)
-        ob_label = self.ob.describe(lang, lvl + 1)
-
         if lvl == 0:  # give fancy formatting if it is top level
-            return f"{sub_label} → {ob_label} ({rel_label})."
+            return (self.sub, " → ", self.ob, " (", self.rel, ").")
         else:  # give utilitarian formatting if it is not
-            return f"[{sub_label} → {ob_label} ({rel_label})]"
+            return ("[", self.sub, " → ", self.ob, " (", self.rel, ")]")
+
+
+def _fill_fragments(fragments: list, lang: str) -> str:
+    """Joins fragments of a description into the description in a given language."""
+    return "".join(
+        fragment if isinstance(fragment, str) else fragment.describe(lang)
+        for fragment in fragments
+    )
 
 
 def _bcp_47_to_iso_639_2(lang_code: str) -> str:
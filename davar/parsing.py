@@ -1,7 +1,9 @@
+import threading
+from re import compile
 import arpeggio
-from arpeggio import OneOrMore, EOF, ParserPython, PTNodeVisitor, visit_parse_tree
+from arpeggio import OneOrMore, EOF, ParserPython, PTNodeVisitor
 from arpeggio import RegExMatch as _
-from davar import model
+from davar import instrument, model
 
 # define rules
 # fmt: off
@@ -109,7 +111,43 @@ class DavarVisitor(PTNodeVisitor):
         return list(children)
 
 
-def parse(davartext: str, debug: bool = False) -> arpeggio.NonTerminal:
+# parsers are built lazily and kept per thread, as arpeggio parsers hold parse state
+_parsers = threading.local()
+
+
+def get_parser(debug: bool = False, memoization: bool = False) -> ParserPython:
+    """Returns an arpeggio parser for the davar grammar, building it on first use.
+    Parsers are cached per thread, since arpeggio parsers keep their parse state on
+    the parser object and so cannot be shared between threads.
+
+    Parameters
+    ----------
+    debug : bool, optional
+        If true, returns a parser that prints debug statements and places .dot files
+        into the project directory, by default False
+    memoization : bool, optional
+        If true, returns a parser that uses packrat memoization, by default False
+
+    Returns
+    -------
+    ParserPython
+        Parser for the davar grammar.
+    """
+    try:
+        cache = _parsers.cache
+    except AttributeError:
+        cache = _parsers.cache = {}
+    key = (debug, memoization)
+    try:
+        return cache[key]
+    except KeyError:
+        parser = cache[key] = ParserPython(davar, debug=debug, memoization=memoization)
+        return parser
+
+
+def parse(
+    davartext: str, debug: bool = False, memoization: bool = False
+) -> arpeggio.NonTerminal:
     """Parses a text string in davar into a list of davar Statements
 
     Parameters
@@ -119,14 +157,17 @@ def parse(davartext: str, debug: bool = False) -> arpeggio.NonTerminal:
     debug : bool, optional
         If true, prints debug statements as davartext is parsed and places .dot files
         representing said process into the project directory, by default False
+    memoization : bool, optional
+        If true, parses using arpeggio packrat memoization, by default False
 
     Returns
     -------
     arpeggio.NonTerminal
         Parse tree representing the entered text.
     """
-    parser = ParserPython(davar, debug=debug)
-    return parser.parse(davartext)
+    parser = get_parser(debug=debug, memoization=memoization)
+    with instrument.phase("parse"):
+        return parser.parse(davartext)
 
 
 def visit(davartree, debug: bool = False) -> list:
@@ -145,7 +186,168 @@ def visit(davartree, debug: bool = False) -> list:
     list
         List of davar Statements
     """
-    return visit_parse_tree(davartree, DavarVisitor(debug=debug))
+    with instrument.phase("visit"):
+        return _visit_parse_tree(davartree, DavarVisitor(debug=debug))
+
+
+def _visit_parse_tree(parse_tree, visitor):
+    """Applies a visitor to a parse tree like `arpeggio.visit_parse_tree`, but walks the
+    tree with an explicit stack instead of recursing, so that trees of any depth can be
+    visited.
+    """
+    if not parse_tree:
+        raise Exception("Parse tree is empty. You did call parse(), didn't you?")
+    if visitor.debug:
+        visitor.dprint("ASG: First pass")
+    # each entry is a node, the results of its parent's children to add its result
+    # to, and the results of its own children, or None if they have not been pushed yet
+    stack = [(parse_tree, None, None)]
+    result = None
+    while stack:
+        node, siblings, children = stack.pop()
+        if children is None:
+            if visitor.debug:
+                visitor.dprint(
+                    f"Visiting {node.rule_name}  type:{type(node).__name__} "
+                    f"str:{node}"
+                )
+            children = arpeggio.SemanticActionResults()
+            stack.append((node, siblings, children))
+            if isinstance(node, arpeggio.NonTerminal):
+                stack.extend((child, children, None) for child in reversed(node))
+            continue
+        result = _visit_node(node, children, visitor)
+        # if visit returns None suppress that child node
+        if siblings is not None and result is not None:
+            siblings.append_result(node.rule_name, result)
+    if visitor.debug:
+        visitor.dprint("ASG: Second pass")
+    for sa_name, asg_node in visitor.for_second_pass:
+        getattr(visitor, f"second_{sa_name}")(asg_node)
+    return result
+
+
+def _visit_node(node, children, visitor):
+    """Applies a visitor to one node of a parse tree, given the results of visiting its
+    children, like `arpeggio.ParseTreeNode.visit`.
+    """
+    visit_name = f"visit_{node.rule_name}"
+    if hasattr(visitor, visit_name):
+        result = getattr(visitor, visit_name)(node, children)
+        # if there is a method with 'second' prefix save the result of visit for
+        # post-processing
+        if hasattr(visitor, f"second_{node.rule_name}"):
+            visitor.for_second_pass.append((node.rule_name, result))
+        return result
+    elif visitor.defaults:
+        return visitor.visit__default__(node, children)
+
+
+# fast path
+# A single regular expression matching one token of the davar grammar, skipping the
+# same whitespace arpeggio does. Groups are, in order: "(", ")", q_id number, p_id
+# number and synset.
+_compiled_token_regex = compile(
+    r"[ \t\n\r]*(?:(\()|(\))|Q[ \t\n\r]*(\d+)|P[ \t\n\r]*(\d+)|(\d{8}\-[v|r|n|a]))"
+)
+_compiled_trailing_whitespace_regex = compile(r"[ \t\n\r]*")
+
+
+def _build_statement(children: list):
+    """Builds the Statement a closed pair of parentheses stands for in the davar
+    grammar, or returns None if the children don't form a valid statement.
+
+    Parameters
+    ----------
+    children : list
+        Words and Statements between the parentheses, in order.
+
+    Returns
+    -------
+    Statement or None
+        The Statement, or None if no statement rule matches the children.
+    """
+    # nodes are anything but Wikidata Properties, rels are Properties and Synsets
+    if len(children) == 1:
+        if not isinstance(children[0], model.WikidataProperty):
+            return model.Statement(*children)
+    elif len(children) == 2:
+        if not any(isinstance(c, model.WikidataProperty) for c in children):
+            return model.Edge(*children)
+    elif len(children) == 3:
+        rel, sub, ob = children
+        if (
+            isinstance(rel, (model.WikidataProperty, model.OMWSynset))
+            and not isinstance(sub, model.WikidataProperty)
+            and not isinstance(ob, model.WikidataProperty)
+        ):
+            return model.LabeledEdge(rel, sub, ob)
+    return None
+
+
+def _fast_transcribe(davartext: str):
+    """Transcribes a string of text in davar into a list of davar Statements in a
+    single pass, without building an arpeggio parse tree. Accepts exactly the texts
+    the `davar` grammar accepts.
+
+    Parameters
+    ----------
+    davartext : str
+        A string of text in davar
+
+    Returns
+    -------
+    list or None
+        List of davar Statements, or None if the text is not valid davar.
+    """
+    return _fast_scan(davartext)[0]
+
+
+def _fast_scan(davartext: str) -> tuple:
+    """Transcribes a string of text in davar like `_fast_transcribe`, also returning
+    where it stopped.
+
+    Returns
+    -------
+    tuple
+        List of davar Statements or None if the text is not valid davar, and the index
+        of the token it failed at, or the length of the text.
+    """
+    match_token = _compiled_token_regex.match
+    statements = []
+    stack = []  # children of each currently open statement
+    pos = 0
+    end = len(davartext)
+    while True:
+        match = match_token(davartext, pos)
+        if match is None:
+            break
+        start, pos = pos, match.end()
+        group = match.lastindex
+        if group == 1:
+            stack.append([])
+        elif group == 2:
+            if not stack:
+                return None, start
+            statement = _build_statement(stack.pop())
+            if statement is None:
+                return None, start
+            if stack:
+                stack[-1].append(statement)
+            else:
+                statements.append(statement)
+        elif not stack:
+            return None, start
+        elif group == 3:
+            stack[-1].append(model.WikidataItem(f"Q{int(match.group(3))}"))
+        elif group == 4:
+            stack[-1].append(model.WikidataProperty(f"P{int(match.group(4))}"))
+        else:
+            stack[-1].append(model.OMWSynset(match.group(5)))
+    pos = _compiled_trailing_whitespace_regex.match(davartext, pos).end()
+    if stack or not statements or pos != end:
+        return None, pos
+    return statements, pos
 
 
 def transcribe(davartext: str, debug: bool = False) -> list:
@@ -163,7 +365,115 @@ def transcribe(davartext: str, debug: bool = False) -> list:
     -------
     list
         List of davar Statements
+
+    Raises
+    ------
+    arpeggio.NoMatch
+        Raised if davartext is not valid davar.
     """
-    parse_tree = parse(davartext, debug=debug)
+    if not debug:
+        # only texts that are not valid davar need the full parser, for its errors
+        with instrument.phase("transcribe"):
+            result = _fast_transcribe(davartext)
+        if result is not None:
+            return result
+    try:
+        parse_tree = parse(davartext, debug=debug)
+    except RecursionError:
+        # arpeggio's parser is recursive, so text nested too deeply for it is reported
+        # at the token the fast path stopped at
+        position = _fast_scan(davartext)[1]
+        raise arpeggio.NoMatch([], position, get_parser(debug=debug)) from None
     result = visit(parse_tree, debug=debug)
     return result
+
+
+_compiled_paren_regex = compile(r"[()]")
+
+
+def statement_spans(davartext: str, pos: int = 0, endpos: int = None) -> tuple:
+    """Finds the spans of the top-level statements in a string of text in davar by
+    matching parentheses, without transcribing them.
+
+    Parameters
+    ----------
+    davartext : str
+        A string of text in davar
+    pos : int, optional
+        Index to start looking at, by default 0
+    endpos : int, optional
+        Index to stop looking at, by default the end of davartext
+
+    Returns
+    -------
+    tuple
+        A list of `(start, end)` spans, one per top-level statement, where each span
+        starts at the first character that is not whitespace after the previous span
+        and ends after its closing parenthesis, and the index after the last span.
+        Any text after that index that is not whitespace is not a complete statement.
+    """
+    if endpos is None:
+        endpos = len(davartext)
+    skip_whitespace = _compiled_trailing_whitespace_regex.match
+    spans = []
+    depth = 0
+    start = skip_whitespace(davartext, pos, endpos).end()
+    for match in _compiled_paren_regex.finditer(davartext, pos, endpos):
+        if match.group() == "(":
+            depth += 1
+            continue
+        depth -= 1
+        if depth <= 0:  # end of a top-level statement, or an unbalanced ")"
+            spans.append((start, match.end()))
+            depth = 0
+            start = skip_whitespace(davartext, match.end(), endpos).end()
+    return spans, spans[-1][1] if spans else pos
+
+
+def transcribe_iter(davarfile, debug: bool = False, chunk_size: int = 65536):
+    """Transcribes davar text read from a file object into davar Statements, yielding
+    them one at a time. Top-level statements are independent, so only the text of the
+    statement being read is held in memory at any time.
+
+    Parameters
+    ----------
+    davarfile : file object
+        A text file object or stream containing text written in davar
+    debug : bool, optional
+        If true, prints debug statements as each statement is transcribed and places
+        .dot files representing process into project directory, by default False
+    chunk_size : int, optional
+        Number of characters read from davarfile at a time, by default 65536
+
+    Yields
+    ------
+    Statement
+        Each top-level davar Statement, in order.
+
+    Raises
+    ------
+    arpeggio.NoMatch
+        Raised if the text is not valid davar. Positions in the error are relative to
+        the start of the statement being transcribed.
+    """
+    pieces = []  # text of the top-level statement being read
+    depth = 0
+    transcribed = False
+    for chunk in iter(lambda: davarfile.read(chunk_size), ""):
+        start = 0
+        for match in _compiled_paren_regex.finditer(chunk):
+            if match.group() == "(":
+                depth += 1
+                continue
+            depth -= 1
+            if depth <= 0:  # end of a top-level statement, or an unbalanced ")"
+                pieces.append(chunk[start : match.end()])
+                yield from transcribe("".join(pieces), debug=debug)
+                transcribed = True
+                pieces = []
+                start = match.end()
+        pieces.append(chunk[start:])
+    rest = "".join(pieces)
+    if not transcribed or rest.strip(" \t\n\r"):
+        # not valid davar, let transcribe raise the appropriate error
+        yield from transcribe(rest, debug=debug)
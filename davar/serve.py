@@ -0,0 +1,246 @@
+import argparse
+import json
+import os
+import socket
+import socketserver
+import stat
+import sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from davar.client import DEFAULT_ADDRESS, parse_address
+
+# synset described in each language on start up, to load the wordnet
+_WARM_UP_SYNSET = "02084071-n"
+
+
+def describe_request(request: dict) -> dict:
+    """Answers a describe request, as the server does.
+
+    Parameters
+    ----------
+    request : dict
+        Either `{"davartext": TEXT, "langs": [LANG, ...]}` to describe one document,
+        or `{"documents": [TEXT, ...], "langs": [LANG, ...]}` to describe several,
+        with the labels of all of their Words resolved at once.
+
+    Returns
+    -------
+    dict
+        `{"descriptions": {LANG: [DESCRIPTION, ...]}}` for one document, or
+        `{"results": [...]}` holding that for each document, or `{"error": MESSAGE}`
+        for each document that could not be described.
+
+    Raises
+    ------
+    ValueError
+        If the request is malformed, or its one document could not be described.
+    """
+    from davar import model
+    from davar.utils import Davar
+
+    langs = request.get("langs")
+    if (
+        not isinstance(langs, list)
+        or not langs
+        or not all(isinstance(lang, str) for lang in langs)
+    ):
+        raise ValueError('"langs" must be a non-empty list of language codes')
+    if "documents" in request:
+        documents = request["documents"]
+        if not isinstance(documents, list) or not all(
+            isinstance(text, str) for text in documents
+        ):
+            raise ValueError('"documents" must be a list of strings')
+        results = []
+        davars = []
+        for text in documents:
+            try:
+                davars.append(Davar.from_davartext(text))
+                results.append(None)
+            except Exception as e:
+                results.append({"error": f"{type(e).__name__}: {e}"})
+        model.resolve_labels(
+            (word for davar in davars for word in davar.words()), langs, workers=4
+        )
+        davars = iter(davars)
+        for i, result in enumerate(results):
+            if result is None:
+                try:
+                    results[i] = {"descriptions": next(davars).describe_many(langs)}
+                except Exception as e:
+                    results[i] = {"error": f"{type(e).__name__}: {e}"}
+        return {"results": results}
+    if "davartext" not in request:
+        raise ValueError('Expected "davartext" or "documents"')
+    if not isinstance(request["davartext"], str):
+        raise ValueError('"davartext" must be a string')
+    try:
+        davar = Davar.from_davartext(request["davartext"])
+    except Exception as e:
+        raise ValueError(f"{type(e).__name__}: {e}") from None
+    return {"descriptions": davar.describe_many(langs)}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # buffer responses so that headers and body are sent together
+    wbufsize = -1
+
+    def _reply(self, status: int, body: dict):
+        data = json.dumps(body, ensure_ascii=False).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._reply(200, {"status": "ok"})
+        else:
+            self._reply(404, {"error": "Not found"})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length)
+        if self.path != "/describe":
+            self._reply(404, {"error": "Not found"})
+            return
+        try:
+            request = json.loads(body)
+            if not isinstance(request, dict):
+                raise ValueError("Expected a JSON object")
+            self._reply(200, describe_request(request))
+        except ValueError as e:
+            self._reply(400, {"error": str(e)})
+        except Exception as e:
+            # like failing to fetch labels, which says nothing about the request
+            self._reply(500, {"error": f"{type(e).__name__}: {e}"})
+
+    def address_string(self) -> str:
+        return self.client_address[0] if self.client_address else "unix"
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _TCPHandler(_Handler):
+    # don't wait to fill packets, as requests are answered in a single write
+    disable_nagle_algorithm = True
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def make_server(address: str = DEFAULT_ADDRESS):
+    """Returns an HTTP server answering describe requests at an address, which is not
+    serving yet. Use its `serve_forever()` to serve.
+
+    Parameters
+    ----------
+    address : str, optional
+        `HOST:PORT` or `unix:PATH`, by default 127.0.0.1:8765. A port of 0 picks any
+        free port.
+
+    Returns
+    -------
+    socketserver.BaseServer
+        The server.
+    """
+    family, location = parse_address(address)
+    if family == socket.AF_UNIX:
+        if os.path.exists(location) and stat.S_ISSOCK(os.stat(location).st_mode):
+            # left over by a server that was not shut down cleanly
+            os.unlink(location)
+        return _UnixHTTPServer(location, _Handler)
+    server = ThreadingHTTPServer(location, _TCPHandler)
+    server.daemon_threads = True
+    return server
+
+
+def warm_up(langs):
+    """Builds the parser, and loads the wordnet and its lemmas in each language, so
+    that the first requests are as fast as later ones.
+
+    Parameters
+    ----------
+    langs : iterable of str
+        BCP 47 language tags to load wordnet lemmas in
+    """
+    from davar import model, parsing
+
+    parsing.get_parser()
+    parsing.transcribe("(Q42)")
+    for lang in langs:
+        try:
+            model.OMWSynset(_WARM_UP_SYNSET).describe(lang)
+        except (LookupError, KeyError, AttributeError) as e:
+            print(f"Could not load the wordnet in {lang}: {e}", file=sys.stderr)
+
+
+def serve(address: str = DEFAULT_ADDRESS, warm_langs=("en",)):
+    """Answers describe requests at an address until interrupted, keeping the parser,
+    the wordnet and every label fetched in memory between requests.
+
+    Parameters
+    ----------
+    address : str, optional
+        `HOST:PORT` or `unix:PATH`, by default 127.0.0.1:8765
+    warm_langs : iterable of str, optional
+        BCP 47 language tags to load wordnet lemmas in on start up, by default en
+    """
+    warm_up(warm_langs)
+    with make_server(address) as server:
+        if isinstance(server, _UnixHTTPServer):
+            address = f"unix:{server.server_address}"
+        else:
+            address = "{}:{}".format(*server.server_address[:2])
+        print(f"Serving davar at {address}", file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if isinstance(server, _UnixHTTPServer):
+                os.unlink(server.server_address)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m davar serve",
+        description="Answer describe requests over HTTP, keeping the parser, the "
+        "wordnet and labels in memory between requests.",
+        epilog="Run `python -m davar DAVARTEXT -l LANG --server ADDRESS` to describe "
+        "with a running server.",
+    )
+    parser.add_argument(
+        "address",
+        metavar="ADDRESS",
+        nargs="?",
+        default=DEFAULT_ADDRESS,
+        help=f"HOST:PORT or unix:PATH to listen at, by default {DEFAULT_ADDRESS}.",
+    )
+    parser.add_argument(
+        "--warm",
+        default="en",
+        help="Comma separated language codes to load wordnet lemmas in on start up.",
+    )
+    parser.add_argument(
+        "--cache", metavar="PATH", help="SQLite file to keep labels in across runs."
+    )
+    parser.add_argument(
+        "--index",
+        metavar="PATH",
+        help="Offline Wikidata label index to read labels from.",
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Never fetch labels from Wikidata, only from --index or --cache.",
+    )
+    args = parser.parse_args(argv)
+    from davar import model
+
+    model.configure_labels(args.cache, args.index, args.offline)
+    warm_langs = [lang for lang in args.warm.split(",") if lang]
+    serve(args.address, warm_langs)
@@ -1,4 +1,7 @@
-from davar.parsing import transcribe
+from os import PathLike
+from davar.parsing import transcribe, transcribe_iter
+from davar import binary, instrument, model
+from davar.index import StatementIndex
 
 
 class Davar:
@@ -14,35 +17,252 @@ class Davar:
             A list of davar Statements
         """
         self.statements = statements
+        self._index = None
 
     @classmethod
-    def from_davartext(cls, davartext: str):
+    def from_davartext(cls, davartext: str, stats: instrument.Stats = None):
         """Constructs a Davar object from a string of text written in davar.
 
         Parameters
         ----------
         davartext : str
             A string of text written in davar
+        stats : instrument.Stats, optional
+            Records the time spent parsing and transcribing if given, by default None
 
         Returns
         -------
         Davar
             A Davar object
         """
-        return cls(transcribe(davartext))
+        with instrument.recording(stats):
+            return cls(transcribe(davartext))
 
-    def describe(self, lang: str) -> list:
+    @classmethod
+    def from_bytes(cls, data):
+        """Constructs a Davar object from Statements serialized by `.to_bytes()`.
+
+        Parameters
+        ----------
+        data : bytes-like
+            Serialized Statements
+
+        Returns
+        -------
+        Davar
+            A Davar object
+        """
+        return cls(binary.loads(data))
+
+    def to_bytes(self) -> bytes:
+        """Serializes its Statements into a compact binary format, which is smaller
+        than davar text and much faster to read back than transcribing it.
+
+        Returns
+        -------
+        bytes
+            Serialized Statements
+        """
+        return binary.dumps(self.statements)
+
+    def dump(self, path):
+        """Serializes its Statements into a file, to be read back with `.load()`.
+
+        Parameters
+        ----------
+        path : str or PathLike
+            Path to write to
+        """
+        binary.dump(self.statements, path)
+
+    @classmethod
+    def load(cls, path, lazy: bool = False):
+        """Constructs a Davar object from a file written by `.dump()`.
+
+        Parameters
+        ----------
+        path : str or PathLike
+            Path to read from
+        lazy : bool, optional
+            If true, the file is memory mapped and each Statement is only read when it
+            is accessed, by default False. Its `statements` are then a read-only
+            `binary.StatementFile`, so `.extend()` is not supported, and
+            `statements.close()` unmaps the file.
+
+        Returns
+        -------
+        Davar
+            A Davar object
+        """
+        if lazy:
+            return cls(binary.StatementFile(path))
+        return cls(binary.load(path))
+
+    @staticmethod
+    def iter_from_file(davarfile):
+        """Iterates over the Statements in a file written in davar, transcribing one
+        top-level statement at a time so that files of any size can be read in
+        constant memory.
+
+        Parameters
+        ----------
+        davarfile : str, PathLike or file object
+            Path to a file written in davar, or a text file object to read from
+
+        Yields
+        ------
+        Statement
+            Each top-level davar Statement in the file, in order.
+        """
+        if isinstance(davarfile, (str, PathLike)):
+            with open(davarfile, encoding="utf-8") as f:
+                yield from transcribe_iter(f)
+        else:
+            yield from transcribe_iter(davarfile)
+
+    def extend(self, statements):
+        """Appends Statements, adding them to its index if it has one. Not supported
+        by Davar objects loaded with `.load(path, lazy=True)`.
+
+        Parameters
+        ----------
+        statements : iterable of Statement
+            Statements to append
+
+        Raises
+        ------
+        TypeError
+            If its Statements are read-only.
+        """
+        if not hasattr(self.statements, "extend"):
+            raise TypeError(f"{type(self.statements).__name__} is read-only")
+        self.statements.extend(statements)
+        if self._index is not None:
+            self._index.update()
+
+    def index(self) -> StatementIndex:
+        """Returns an index of where each Word appears in its Statements, building it
+        the first time. The index is kept up to date with Statements appended with
+        `.extend()` or to `statements`.
+
+        Returns
+        -------
+        StatementIndex
+            Index of its Statements
+        """
+        if self._index is None or self._index.statements is not self.statements:
+            self._index = StatementIndex(self.statements)
+        return self._index
+
+    def words(self):
+        """Iterates over every Word in its Statements, including Words in nested
+        Statements.
+
+        Yields
+        ------
+        DavarWord
+            Each Word in its Statements.
+        """
+        for statement in self.statements:
+            yield from statement.words()
+
+    def resolve(self, lang: str, workers: int = 4):
+        """Resolves the labels of all of its Words in a given language at once, so that
+        describing its Statements makes a handful of bulk requests instead of one
+        request per Word.
+
+        Parameters
+        ----------
+        lang : str
+            BCP 47 language tag
+        workers : int, optional
+            Number of threads fetching labels in parallel, by default 4
+        """
+        model.resolve_labels(self.words(), [lang], workers=workers)
+
+    def _count_words(self):
+        """Counts its Words by type for instrumentation, if any hook is set."""
+        if instrument.enabled():
+            for word in self.words():
+                instrument.count(f"words.{type(word).__name__}")
+
+    def describe(
+        self, lang: str, workers: int = 4, stats: instrument.Stats = None
+    ) -> list:
         """Returns a list of strings describing its Statements in a human readable
-        format in a given language.
+        format in a given language. Labels of all of its Words are resolved in bulk
+        first.
+
+        Parameters
+        ----------
+        lang : str
+            BCP 47 language tag
+        workers : int, optional
+            Number of threads fetching labels in parallel, by default 4
+        stats : instrument.Stats, optional
+            Records the time spent in each phase, requests made, bytes fetched, cache
+            hits and Words by type if given, by default None
+
+        Returns
+        -------
+        list
+            List of strings describing Statements in a human readable format
+        """
+        with instrument.recording(stats):
+            self._count_words()
+            self.resolve(lang, workers=workers)
+            with instrument.phase("render"):
+                return [s.describe(lang) for s in self.statements]
+
+    def describe_many(
+        self, langs, workers: int = 4, stats: instrument.Stats = None
+    ) -> dict:
+        """Returns lists of strings describing its Statements like `.describe()` in
+        each of the given languages. Labels of all of its Words are resolved in bulk
+        for every language at once, and each Statement is walked only once.
+
+        Parameters
+        ----------
+        langs : iterable of str
+            BCP 47 language tags
+        workers : int, optional
+            Number of threads fetching labels in parallel, by default 4
+        stats : instrument.Stats, optional
+            Records statistics like `.describe()` if given, by default None
+
+        Returns
+        -------
+        dict
+            Maps each language tag to the list of strings describing Statements in
+            that language.
+        """
+        langs = list(dict.fromkeys(langs))
+        with instrument.recording(stats):
+            self._count_words()
+            model.resolve_labels(self.words(), langs, workers=workers)
+            descriptions = {lang: [] for lang in langs}
+            with instrument.phase("render"):
+                for s in self.statements:
+                    for lang, description in s.describe_many(langs).items():
+                        descriptions[lang].append(description)
+        return descriptions
+
+    async def adescribe(self, lang: str, concurrency: int = 8) -> list:
+        """Returns a list of strings describing its Statements like `.describe()`, after
+        resolving the labels of all of its Words concurrently, without blocking the
+        event loop.
 
         Parameters
         ----------
         lang : str
             BCP 47 language tag
+        concurrency : int, optional
+            Most requests or lookups made at the same time, by default 8
 
         Returns
         -------
         list
             List of strings describing Statements in a human readable format
         """
+        await model.aresolve_labels(self.words(), [lang], concurrency=concurrency)
         return [s.describe(lang) for s in self.statements]
@@ -0,0 +1,266 @@
+import argparse
+import bisect
+import hashlib
+import os
+import sys
+import time
+import arpeggio
+from davar import model
+from davar.parsing import statement_spans, transcribe
+
+
+def _common_prefix(a: str, b: str) -> int:
+    """Returns the length of the longest common prefix of two strings, comparing
+    slices so that long prefixes are compared at C speed.
+    """
+    low, high = 0, min(len(a), len(b))
+    while low < high:
+        mid = (low + high + 1) // 2
+        if a[low:mid] == b[low:mid]:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+
+def _common_suffix(a: str, b: str, limit: int) -> int:
+    """Returns the length of the longest common suffix of two strings, up to limit."""
+    low, high = 0, limit
+    while low < high:
+        mid = (low + high + 1) // 2
+        if a[len(a) - mid : len(a) - low] == b[len(b) - mid : len(b) - low]:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+
+def _key(text: str) -> bytes:
+    """Returns the content hash of the text of a statement."""
+    return hashlib.blake2b(text.encode(), digest_size=16).digest()
+
+
+class IncrementalDescriber:
+    """Describes successive versions of a text written in davar, transcribing and
+    describing only the top-level statements that changed since the last version.
+
+    Each version is compared with the last to find the edited region, only the
+    statement spans overlapping it are found again, and a statement is only
+    transcribed and described if the content hash of its text was not seen before.
+    """
+
+    def __init__(self, langs, workers: int = 4):
+        """Constructs an IncrementalDescriber that has seen no text yet.
+
+        Parameters
+        ----------
+        langs : iterable of str
+            BCP 47 language tags to describe statements in
+        workers : int, optional
+            Number of threads fetching labels in parallel, by default 4
+        """
+        self.langs = list(dict.fromkeys(langs))
+        self.workers = workers
+        self.text = ""
+        # span, content hash and descriptions of each top-level statement, in order
+        self.spans = []
+        self._keys = []
+        self.descriptions = []
+        # content hash -> descriptions of every statement seen recently
+        self._known = {}
+
+    def update(self, text: str) -> range:
+        """Describes a new version of the text.
+
+        Parameters
+        ----------
+        text : str
+            The whole text, written in davar
+
+        Returns
+        -------
+        range
+            Positions of the statements in `.descriptions` that were found again,
+            which includes every statement that changed.
+
+        Raises
+        ------
+        ValueError
+            Raised if a statement is not valid davar, in which case the last version
+            is kept.
+        """
+        old = self.text
+        prefix = _common_prefix(old, text)
+        if prefix == len(old) == len(text):
+            return range(len(self.spans), len(self.spans))
+        suffix = _common_suffix(old, text, min(len(old), len(text)) - prefix)
+        delta = len(text) - len(old)
+        ends = [end for _, end in self.spans]
+        # statements ending before the edit are kept, and so are those starting
+        # after it, unless the edit left a statement open
+        first = bisect.bisect_right(ends, prefix)
+        last = first
+        while last < len(self.spans) and self.spans[last][0] < len(old) - suffix:
+            last += 1
+        pos = self.spans[first - 1][1] if first else 0
+        endpos = self.spans[last][0] + delta if last < len(self.spans) else len(text)
+        spans, stop = statement_spans(text, pos, endpos)
+        if text[stop:endpos].strip(" \t\n\r"):
+            last = len(self.spans)
+            endpos = len(text)
+            spans, stop = statement_spans(text, pos, endpos)
+            rest = text[stop:].lstrip(" \t\n\r")
+            if rest:
+                # not a complete statement, so that transcribing it raises an error
+                spans.append((len(text) - len(rest), len(text)))
+        keys = [_key(text[start:end]) for start, end in spans]
+        descriptions = self._describe(text, spans, keys)
+
+        self.text = text
+        kept = [(start + delta, end + delta) for start, end in self.spans[last:]]
+        self.spans[first:] = spans + kept
+        self._keys[first:last] = keys
+        self.descriptions[first:last] = descriptions
+        self._known.update(zip(keys, descriptions))
+        if len(self._known) > 2 * len(self._keys) + 1024:
+            # forget statements that were removed long ago
+            self._known = dict(zip(self._keys, self.descriptions))
+        return range(first, first + len(spans))
+
+    def _describe(self, text: str, spans: list, keys: list) -> list:
+        """Returns the descriptions of the statements at spans, transcribing and
+        describing those whose content hash was not seen before.
+        """
+        new = {}
+        starts = {}
+        for (start, end), key in zip(spans, keys):
+            if key in self._known or key in new:
+                continue
+            starts[key] = start
+            try:
+                (new[key],) = transcribe(text[start:end])
+            except (arpeggio.NoMatch, ValueError, RecursionError) as error:
+                line = text.count("\n", 0, start) + 1
+                raise ValueError(
+                    f"Statement at line {line} is not valid davar: {error}"
+                ) from None
+        try:
+            model.resolve_labels(
+                (word for statement in new.values() for word in statement.words()),
+                self.langs,
+                workers=self.workers,
+            )
+        except OSError as error:
+            raise ValueError(f"Could not fetch labels: {error}") from None
+        for key, statement in new.items():
+            try:
+                described = statement.describe_many(self.langs)
+            except (LookupError, OSError) as error:
+                # like a label missing offline, or failing to fetch one
+                line = text.count("\n", 0, starts[key]) + 1
+                raise ValueError(
+                    f"Statement at line {line} could not be described: "
+                    f"{type(error).__name__}: {error}"
+                ) from None
+            new[key] = tuple(described[lang] for lang in self.langs)
+        return [self._known.get(key) or new[key] for key in keys]
+
+
+def _print_descriptions(describer, positions, out):
+    for position in positions:
+        for lang, description in zip(describer.langs, describer.descriptions[position]):
+            if len(describer.langs) == 1:
+                print(f"{position + 1}\t{description}", file=out)
+            else:
+                print(f"{position + 1}\t{lang}\t{description}", file=out)
+    out.flush()
+
+
+def watch(path, langs, interval: float = 0.2, out=None, err=None, stop=None):
+    """Describes a file written in davar, then describes it again whenever it changes,
+    printing only the descriptions of the statements that changed, numbered by their
+    position in the file.
+
+    Parameters
+    ----------
+    path : str or PathLike
+        Path to the file to watch
+    langs : iterable of str
+        BCP 47 language tags to describe statements in
+    interval : float, optional
+        Seconds between checks for changes, by default 0.2
+    out : file object, optional
+        Where to print descriptions, by default standard output
+    err : file object, optional
+        Where to print errors and timings, by default standard error
+    stop : threading.Event, optional
+        Stops watching when set, by default watches until interrupted
+    """
+    out = out or sys.stdout
+    err = err or sys.stderr
+    describer = IncrementalDescriber(langs)
+    seen = None
+    while stop is None or not stop.is_set():
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            stat = None
+        if stat is not None and (stat.st_mtime_ns, stat.st_size) != seen:
+            seen = (stat.st_mtime_ns, stat.st_size)
+            start = time.perf_counter()
+            try:
+                with open(path, encoding="utf-8") as f:
+                    text = f.read()
+                positions = describer.update(text)
+            except (OSError, ValueError) as error:
+                # keeps the last version, and tries again once the file changes
+                print(error, file=err)
+            else:
+                seconds = time.perf_counter() - start
+                _print_descriptions(describer, positions, out)
+                print(
+                    f"{len(describer.spans)} statements, {len(positions)} described "
+                    f"again in {seconds * 1e3:.1f} ms",
+                    file=err,
+                )
+        time.sleep(interval)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m davar watch",
+        description="Describe a file written in davar again whenever it changes, "
+        "only re-describing the statements that changed.",
+    )
+    parser.add_argument("path", metavar="FILE")
+    parser.add_argument(
+        "-l",
+        "--lang",
+        required=True,
+        help="2 character language code, or comma separated codes like en,fr,de.",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=0.2,
+        help="Seconds between checks for changes, by default 0.2.",
+    )
+    parser.add_argument(
+        "--cache", metavar="PATH", help="SQLite file to keep labels in across runs."
+    )
+    parser.add_argument(
+        "--index",
+        metavar="PATH",
+        help="Offline Wikidata label index to read labels from.",
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Never fetch labels from Wikidata, only from --index or --cache.",
+    )
+    args = parser.parse_args(argv)
+    model.configure_labels(args.cache, args.index, args.offline)
+    try:
+        watch(args.path, args.lang.split(","), interval=args.interval)
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,243 @@
+import argparse
+import bz2
+import gzip
+import json
+import os
+import sqlite3
+import sys
+import threading
+from urllib.request import pathname2url
+
+
+def _open_dump(path: str):
+    """Opens a Wikidata JSON dump for reading text, decompressing it on the fly if its
+    name ends in `.bz2` or `.gz`.
+    """
+    path = os.fspath(path)
+    if path.endswith(".bz2"):
+        return bz2.open(path, "rt", encoding="utf-8")
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8")
+    return open(path, encoding="utf-8")
+
+
+def iter_dump_labels(lines, langs):
+    """Iterates over the labels of the Wikidata Items and Properties in the lines of a
+    Wikidata JSON dump, which holds one entity per line inside a JSON array.
+
+    Parameters
+    ----------
+    lines : iterable of str
+        Lines of the dump
+    langs : iterable of str
+        BCP 47 language tags of the labels to keep
+
+    Yields
+    ------
+    tuple
+        Kind of entity (`Q` or `P`), its number, language tag, and label.
+    """
+    langs = set(langs)
+    for line in lines:
+        line = line.strip().rstrip(",")
+        if line in ("[", "]", ""):
+            continue
+        entity = json.loads(line)
+        id = entity.get("id", "")
+        if id[:1] not in ("Q", "P"):
+            continue
+        labels = entity.get("labels") or {}
+        for lang in langs.intersection(labels):
+            yield id[0], int(id[1:]), lang, labels[lang]["value"]
+
+
+def build_label_index(dump_path: str, index_path: str, langs, batch_size=10000) -> int:
+    """Builds a label index from a Wikidata JSON dump, streaming the dump line by line
+    so that memory use does not grow with its size.
+
+    Parameters
+    ----------
+    dump_path : str
+        Path to the dump, optionally compressed with bz2 or gzip
+    index_path : str
+        Path to write the index to, replacing any existing index
+    langs : iterable of str
+        BCP 47 language tags of the labels to index
+    batch_size : int, optional
+        Number of labels written at a time, by default 10000
+
+    Returns
+    -------
+    int
+        Number of labels indexed.
+    """
+    index_path = os.fspath(index_path)
+    # built next to the index and swapped in once complete, so that processes reading
+    # the old index keep a whole file, and a failed build leaves it in place
+    tmp_path = f"{index_path}.tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    db = sqlite3.connect(tmp_path)
+    try:
+        count = _write_labels(db, dump_path, langs, batch_size)
+    except BaseException:
+        db.close()
+        os.remove(tmp_path)
+        raise
+    db.close()
+    os.replace(tmp_path, index_path)
+    return count
+
+
+def _write_labels(db: sqlite3.Connection, dump_path: str, langs, batch_size) -> int:
+    """Writes the labels of a dump into an empty database for `build_label_index`."""
+    # the index is written once by one process, so skip journaling and syncing
+    db.execute("PRAGMA journal_mode=OFF")
+    db.execute("PRAGMA synchronous=OFF")
+    db.execute(
+        "CREATE TABLE labels (kind TEXT, num INTEGER, lang TEXT, label TEXT, "
+        "PRIMARY KEY (kind, num, lang)) WITHOUT ROWID"
+    )
+    count = 0
+    batch = []
+    with _open_dump(dump_path) as dump:
+        for row in iter_dump_labels(dump, langs):
+            batch.append(row)
+            if len(batch) >= batch_size:
+                db.executemany(
+                    "INSERT OR REPLACE INTO labels VALUES (?, ?, ?, ?)", batch
+                )
+                count += len(batch)
+                batch = []
+    db.executemany("INSERT OR REPLACE INTO labels VALUES (?, ?, ?, ?)", batch)
+    count += len(batch)
+    db.commit()
+    db.execute("VACUUM")
+    return count
+
+
+class LabelIndex:
+    """Read-only index of Wikidata labels built from a dump by `build_label_index`.
+    Lookups go to disk through SQLite's B-tree, so the index is never loaded into
+    memory, and take microseconds.
+    """
+
+    # most variables in one SQLite statement, for bulk lookups
+    _max_variables = 500
+
+    def __init__(self, path: str):
+        """Opens a label index.
+
+        Parameters
+        ----------
+        path : str
+            Path to the index
+        """
+        self.path = os.fspath(path)
+        if not os.path.exists(self.path):
+            raise FileNotFoundError(self.path)
+        self._local = threading.local()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Returns a read-only connection to the index for the current thread and
+        process, as SQLite connections can't be shared across either.
+        """
+        pid = os.getpid()
+        if getattr(self._local, "pid", None) != pid:
+            # the index never changes once built, so SQLite can skip locking it
+            path = pathname2url(os.path.abspath(self.path))
+            uri = f"file:{path}?mode=ro&immutable=1"
+            self._local.db = sqlite3.connect(uri, uri=True)
+            self._local.pid = pid
+        return self._local.db
+
+    def get(self, id: str, lang: str):
+        """Returns the label of a Wikidata entity, or None if it is not indexed.
+
+        Parameters
+        ----------
+        id : str
+            Wikidata entity identifier, like `Q42` or `P31`
+        lang : str
+            BCP 47 language tag
+
+        Returns
+        -------
+        str or None
+            Label in given language
+        """
+        row = (
+            self._connection()
+            .execute(
+                "SELECT label FROM labels WHERE kind = ? AND num = ? AND lang = ?",
+                (id[0], int(id[1:]), lang),
+            )
+            .fetchone()
+        )
+        return row[0] if row is not None else None
+
+    def get_many(self, ids, langs) -> dict:
+        """Returns every indexed label for the given entities and languages.
+
+        Parameters
+        ----------
+        ids : iterable of str
+            Wikidata entity identifiers
+        langs : iterable of str
+            BCP 47 language tags
+
+        Returns
+        -------
+        dict
+            Maps `(id, lang)` to label, for every indexed label.
+        """
+        langs = list(langs)
+        labels = {}
+        db = self._connection()
+        for kind in ("Q", "P"):
+            nums = [int(id[1:]) for id in ids if id[0] == kind]
+            step = self._max_variables - len(langs) - 1
+            for start in range(0, len(nums), step):
+                chunk = nums[start : start + step]
+                rows = db.execute(
+                    f"SELECT num, lang, label FROM labels WHERE kind = ? "
+                    f"AND num IN ({','.join('?' * len(chunk))}) "
+                    f"AND lang IN ({','.join('?' * len(langs))})",
+                    (kind, *chunk, *langs),
+                )
+                for num, lang, label in rows:
+                    labels[(f"{kind}{num}", lang)] = label
+        return labels
+
+    def __len__(self) -> int:
+        """Returns the number of indexed labels."""
+        return self._connection().execute("SELECT COUNT(*) FROM labels").fetchone()[0]
+
+
+def main(argv=None):
+    """Builds a label index from a Wikidata JSON dump from the command line.
+
+    Parameters
+    ----------
+    argv : list, optional
+        Command line arguments after `index`, by default those of this process
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m davar index",
+        description="Build an offline label index from a Wikidata JSON dump.",
+    )
+    parser.add_argument(
+        "dump", metavar="DUMP", help="Wikidata JSON dump, optionally .bz2 or .gz."
+    )
+    parser.add_argument(
+        "-o", "--output", required=True, metavar="INDEX", help="Index file to write."
+    )
+    parser.add_argument(
+        "--langs",
+        required=True,
+        help="Comma separated language codes of the labels to index, like en,fr,de.",
+    )
+    args = parser.parse_args(argv)
+
+    count = build_label_index(args.dump, args.output, args.langs.split(","))
+    print(f"Indexed {count} labels into {args.output}.", file=sys.stderr)
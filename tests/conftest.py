@@ -0,0 +1,33 @@
+import pytest
+from benchmarks.fake_wikidata import FakeWikidata
+from davar import model as m
+
+# labels served by the fake Wikidata
+LABELS = {
+    "Q2": {"en": "Earth", "fr": "Terre"},
+    "Q5": {"en": "human", "fr": "être humain"},
+    "Q42": {"en": "Douglas Adams", "fr": "Douglas Adams"},
+    "Q2013": {"en": "Wikidata", "fr": "Wikidata"},
+    "Q3236990": {"en": "self", "fr": "soi"},
+    "Q5482740": {"en": "programmer", "fr": "programmeur"},
+    "P31": {"en": "instance of", "fr": "nature de l'élément"},
+    "P106": {"en": "occupation", "fr": "occupation"},
+}
+
+
+@pytest.fixture
+def fake_wikidata(monkeypatch):
+    """
+    Serves Wikidata labels from a local HTTP server, and points davar at it.
+    """
+    with FakeWikidata(dict(LABELS), latency=0) as fake:
+        monkeypatch.setattr(m, "WIKIDATA_API_URL", fake.api_url)
+        yield fake
+
+
+@pytest.fixture(autouse=True)
+def clear_labels():
+    """
+    Keeps labels cached by one test from being seen by the next.
+    """
+    m.clear_labels()
@@ -0,0 +1,72 @@
+import pytest
+from davar import batch
+
+DOCUMENTS = ["(Q2013)", "(P31 Q42 Q5) (Q2 Q5)", "(Q5", "(Q3236990 Q5482740)"]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_describe_batch(fake_wikidata, workers):
+    results = list(batch.describe_batch(DOCUMENTS, "en", workers=workers, chunksize=1))
+    assert [index for index, _, _ in results] == [0, 1, 2, 3]
+    assert results[0][1] == ["Wikidata."]
+    assert results[1][1] == ["Douglas Adams → human (instance of).", "Earth → human."]
+    assert results[2][1] is None and results[2][2].startswith("NoMatch")
+    assert results[3][1] == ["self → programmer."]
+
+
+def test_describe_batch_unordered(fake_wikidata):
+    results = batch.describe_batch(DOCUMENTS, "en", workers=2, ordered=False)
+    assert sorted(index for index, _, _ in results) == [0, 1, 2, 3]
+
+
+def test_describe_batch_in_process_restores_labels(fake_wikidata, tmp_path):
+    from davar import model
+
+    saved = model.label_cache, model.label_index, model.offline
+    results = batch.describe_batch(
+        DOCUMENTS, "en", workers=1, cache_path=str(tmp_path / "cache"), offline=True
+    )
+    next(results)
+    assert model.offline and model.label_cache is not saved[0]
+    results.close()
+    assert (model.label_cache, model.label_index, model.offline) == saved
+
+
+def test_iter_documents(tmp_path, monkeypatch):
+    from io import StringIO
+
+    (tmp_path / "b").mkdir()
+    (tmp_path / "b" / "2.davar").write_text("(Q2)")
+    (tmp_path / "1.davar").write_text("(Q1)")
+    (tmp_path / "3.davar").write_text("(Q3)")
+    monkeypatch.setattr("sys.stdin", StringIO("(Q4)\n\n(Q5)\n"))
+    assert list(batch.iter_documents([str(tmp_path), "-"])) == [
+        "(Q1)",
+        "(Q3)",
+        "(Q2)",
+        "(Q4)\n",
+        "(Q5)\n",
+    ]
+
+
+def test_main(fake_wikidata, tmp_path, capsys):
+    path = tmp_path / "doc.davar"
+    path.write_text("(P31 Q42 Q5)")
+    batch.main([str(path), str(path), "-l", "en", "-j", "1", "--tag"])
+    out, err = capsys.readouterr()
+    assert out == (
+        "0\tDouglas Adams → human (instance of).\n"
+        "1\tDouglas Adams → human (instance of).\n"
+    )
+    assert "Described 2 documents (0 failed)" in err
+
+
+def test_main_offline(fake_wikidata, tmp_path, capsys, monkeypatch):
+    monkeypatch.setattr("davar.model.offline", False)
+    path = tmp_path / "doc.davar"
+    path.write_text("(Q42)")
+    batch.main([str(path), "-l", "en", "-j", "2", "--offline"])
+    out, err = capsys.readouterr()
+    assert out == ""
+    assert "Described 1 documents (1 failed)" in err
+    assert fake_wikidata.requests == []
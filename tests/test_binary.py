@@ -0,0 +1,105 @@
+import pytest
+from davar import binary, parsing
+from davar import model as m
+from davar.utils import Davar
+
+TEXT = (
+    "(Q5)(P31 Q42 Q5) (Q5 Q42) (P106 Q3236990 (01835496-v Q42 02084071-n)) "
+    "(00110659-r (Q2 Q5)) (02084071-| Q12345678901 Q5) (P31 Q42 Q5)"
+)
+
+
+@pytest.fixture
+def statements():
+    return parsing.transcribe(TEXT)
+
+
+def test_roundtrip(statements):
+    data = binary.dumps(statements)
+    assert binary.loads(data) == statements
+
+
+def test_smaller_than_text(statements):
+    assert len(binary.dumps(statements * 100)) < len(TEXT * 100) / 2
+
+
+def test_roundtrip_empty():
+    assert binary.loads(binary.dumps([])) == []
+
+
+def test_roundtrip_deeply_nested():
+    depth = 20000
+    (statement,) = parsing.transcribe("(Q1 " * depth + "Q2" + ")" * depth)
+    assert binary.loads(binary.dumps([statement])) == [statement]
+
+
+def test_roundtrip_ids():
+    statement = m.LabeledEdge(
+        m.WikidataProperty("P0"), m.WikidataItem("Q10"), m.OMWSynset("00110659-r")
+    )
+    assert binary.loads(binary.dumps([statement])) == [statement]
+
+
+@pytest.mark.parametrize("word", [m.WikidataItem("Q007"), m.WikidataProperty("P01")])
+def test_leading_zeros(word):
+    with pytest.raises(ValueError, match="leading zeros"):
+        binary.dumps([m.Statement(word)])
+
+
+def test_shares_words_and_statements(statements):
+    loaded = binary.loads(binary.dumps(statements))
+    assert all(a is b for a, b in zip(loaded, statements))
+
+
+def test_not_a_corpus(tmp_path):
+    with pytest.raises(ValueError):
+        binary.loads(b"(Q5)")
+    (tmp_path / "empty").write_bytes(b"")
+    with pytest.raises(ValueError):
+        binary.StatementFile(tmp_path / "empty")
+
+
+def test_unserializable_word():
+    class Word(m.Node):
+        @classmethod
+        def _validate_id(cls, id):
+            pass
+
+    with pytest.raises(ValueError):
+        binary.dumps([m.Statement(Word("x"))])
+
+
+def test_statement_file(tmp_path, statements):
+    binary.dump(statements, tmp_path / "corpus.davarb")
+    corpus = binary.StatementFile(tmp_path / "corpus.davarb")
+    assert len(corpus) == len(statements)
+    assert corpus[3] == statements[3]
+    assert corpus[-1] == statements[-1]
+    assert corpus[1:3] == statements[1:3]
+    assert list(corpus) == statements
+    with pytest.raises(IndexError):
+        corpus[len(statements)]
+    assert binary.load(tmp_path / "corpus.davarb") == statements
+    corpus.close()
+    with pytest.raises(ValueError):
+        corpus[0]
+
+
+def test_statement_file_context_manager(tmp_path, statements):
+    binary.dump(statements, tmp_path / "corpus.davarb")
+    with binary.StatementFile(tmp_path / "corpus.davarb") as corpus:
+        assert corpus[0] == statements[0]
+    assert corpus._data.closed
+
+
+def test_davar(tmp_path, statements):
+    davar = Davar(statements)
+    assert Davar.from_bytes(davar.to_bytes()).statements == statements
+    davar.dump(tmp_path / "corpus.davarb")
+    assert Davar.load(tmp_path / "corpus.davarb").statements == statements
+    lazy = Davar.load(tmp_path / "corpus.davarb", lazy=True)
+    assert isinstance(lazy.statements, binary.StatementFile)
+    assert list(lazy.words()) == list(davar.words())
+    with pytest.raises(TypeError):
+        lazy.extend(statements)
+    lazy.statements.close()
@@ -0,0 +1,88 @@
+import pytest
+import davar.instrument as i
+import davar.model as m
+import davar.utils as d
+from davar.columnar import ColumnarDavar
+
+TEXT = "(P31 Q3236990 Q5482740) (Q2013)(Q2 (P31 Q42 Q5)) (Q2 (Q42 Q5))"
+
+
+class TestColumnarDavar:
+    def test_statements(self):
+        columnar = ColumnarDavar.from_davartext(TEXT)
+        statements = d.Davar.from_davartext(TEXT).statements
+        assert len(columnar) == len(statements)
+        assert list(columnar) == statements
+        assert columnar[-1] is statements[-1]
+        assert len(columnar.word_table) == 7
+
+    def test_arrays(self):
+        columnar = ColumnarDavar.from_davartext("(Q2 (P31 Q42 Q5)) (Q42)")
+        assert list(columnar.kinds) == [2, 0, 3, 0, 0, 0, 1, 0]
+        assert list(columnar.ids) == [0, 0, 0, 1, 2, 3, 0, 2]
+        assert list(columnar.sizes) == [6, 1, 4, 1, 1, 1, 2, 1]
+        assert list(columnar.roots) == [0, 6]
+
+    def test_from_file(self, tmp_path):
+        path = tmp_path / "corpus.davar"
+        path.write_text(TEXT.replace(") (", ")\n("))
+        assert list(ColumnarDavar.from_file(path)) == list(
+            ColumnarDavar.from_davartext(TEXT)
+        )
+
+    def test_describe(self, fake_wikidata):
+        columnar = ColumnarDavar.from_davartext(TEXT)
+        assert columnar.describe("en") == [
+            "self → programmer (instance of).",
+            "Wikidata.",
+            "Earth → [Douglas Adams → human (instance of)].",
+            "Earth → [Douglas Adams → human].",
+        ]
+        assert len(fake_wikidata.requests) == 1
+
+    def test_describe_stats(self, fake_wikidata):
+        stats = i.Stats()
+        ColumnarDavar.from_davartext(TEXT).describe("en", stats=stats)
+        assert stats.counts["words.WikidataItem"] == 9
+        assert stats.counts["words.WikidataProperty"] == 2
+        assert stats.counts["http.requests"] == 1
+
+    def test_iter_describe_stats(self, fake_wikidata):
+        stats = i.Stats()
+        descriptions = ColumnarDavar.from_davartext(TEXT).iter_describe(
+            "en", stats=stats
+        )
+        next(descriptions)
+        # the caller's own work between descriptions is not recorded
+        assert not i.enabled()
+        i.count("caller")
+        assert list(descriptions)
+        assert "caller" not in stats.counts
+        assert stats.calls["render"] == 4
+
+    def test_id_counts(self):
+        columnar = ColumnarDavar.from_davartext(TEXT)
+        assert columnar.id_counts() == {
+            "P31": 2,
+            "Q3236990": 1,
+            "Q5482740": 1,
+            "Q2013": 1,
+            "Q2": 2,
+            "Q42": 2,
+            "Q5": 2,
+        }
+        assert ColumnarDavar().id_counts() == {}
+
+    def test_to_numpy(self):
+        pytest.importorskip("numpy")
+        arrays = ColumnarDavar.from_davartext(TEXT).to_numpy()
+        assert (arrays["kinds"] == 0).sum() == 11
+        assert list(arrays["roots"]) == [0, 4, 6, 12]
+
+    def test_deeply_nested(self):
+        statement = m.WikidataItem("Q42")
+        for _ in range(10000):
+            statement = m.Edge(m.WikidataItem("Q2"), statement)
+        columnar = ColumnarDavar.from_statements([statement])
+        assert columnar[0] is statement
+        assert columnar.id_counts() == {"Q2": 10000, "Q42": 1}
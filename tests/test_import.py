@@ -0,0 +1,40 @@
+import subprocess
+import sys
+import pytest
+import davar
+from davar import corpora
+
+
+def imported_modules(statement: str) -> set:
+    code = f"import sys\n{statement}\nprint(' '.join(sys.modules))"
+    output = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout
+    return set(output.split())
+
+
+def test_import_is_lazy():
+    modules = imported_modules("import davar")
+    assert not {"nltk", "wikidata", "pycountry", "arpeggio", "davar.model"} & modules
+
+
+def test_import_model_is_lazy():
+    modules = imported_modules("import davar.model")
+    assert not {"nltk", "wikidata", "pycountry"} & modules
+
+
+def test_exports():
+    from davar.parsing import transcribe
+    from davar.utils import Davar
+
+    assert davar.transcribe is transcribe
+    assert davar.Davar is Davar
+    with pytest.raises(AttributeError):
+        davar.missing
+
+
+def test_missing_corpus(monkeypatch):
+    monkeypatch.setattr(corpora, "_wordnet", None)
+    monkeypatch.setitem(corpora.CORPORA, "missing", "corpora/missing")
+    with pytest.raises(LookupError, match="python -m davar download"):
+        corpora.get_wordnet()
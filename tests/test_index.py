@@ -0,0 +1,77 @@
+import pytest
+import davar.model as m
+import davar.utils as d
+from davar.index import Occurrence, StatementIndex
+
+
+@pytest.fixture
+def davar():
+    return d.Davar.from_davartext("(P31 Q42 Q5) (Q2 (P31 Q42 Q5)) (Q42) (Q5 Q42)")
+
+
+class TestStatementIndex:
+    def test_find(self, davar):
+        index = davar.index()
+        assert index.find("Q42", role="sub") == [
+            Occurrence(0, (), "sub"),
+            Occurrence(1, ("ob",), "sub"),
+            Occurrence(2, (), "sub"),
+        ]
+        assert index.find(m.WikidataItem("Q42")) == [
+            Occurrence(0, (), "sub"),
+            Occurrence(1, ("ob",), "sub"),
+            Occurrence(2, (), "sub"),
+            Occurrence(3, (), "ob"),
+        ]
+        assert index.find("Q43") == []
+
+    def test_statements_with(self, davar):
+        index = davar.index()
+        assert index.statements_with("P31", role="rel") == davar.statements[:2]
+        assert index.statements_with("Q5") == [
+            davar.statements[0],
+            davar.statements[1],
+            davar.statements[3],
+        ]
+
+    def test_count(self, davar):
+        index = davar.index()
+        assert index.count("Q42") == 4
+        assert index.count("Q42", role="ob") == 1
+        assert "Q2" in index
+        assert "P106" not in index
+        assert index.ids() == {"P31", "Q42", "Q5", "Q2"}
+
+    def test_resolve(self, davar):
+        index = davar.index()
+        (occurrence,) = index.find("Q2")
+        assert index.resolve(occurrence) is davar.statements[1]
+        occurrence = index.find("P31")[1]
+        assert index.resolve(occurrence) is davar.statements[0]
+
+    def test_unknown_role(self, davar):
+        with pytest.raises(ValueError):
+            davar.index().find("Q42", role="object")
+
+    def test_incremental(self, davar):
+        index = davar.index()
+        davar.extend(d.Davar.from_davartext("(Q2 Q42)").statements)
+        assert davar.index() is index
+        assert index.find("Q42", role="ob")[-1] == Occurrence(4, (), "ob")
+        davar.statements.append(m.Statement(m.WikidataItem("Q2013")))
+        assert index.statements_with("Q2013") == [davar.statements[5]]
+
+    def test_rebuilt_for_new_statements(self, davar):
+        index = davar.index()
+        davar.statements = davar.statements[:1]
+        assert davar.index() is not index
+        assert davar.index().count("Q42") == 1
+
+    def test_deeply_nested(self):
+        statement = m.WikidataItem("Q42")
+        for _ in range(10000):
+            statement = m.Edge(m.WikidataItem("Q2"), statement)
+        index = StatementIndex([statement])
+        (occurrence,) = index.find("Q42")
+        assert occurrence.path == ("ob",) * 9999
+        assert index.count("Q2") == 10000
@@ -0,0 +1,100 @@
+from threading import Barrier, Thread
+import davar.instrument as i
+import davar.model as m
+import davar.utils as d
+from davar.__main__ import main
+
+
+class TestHooks:
+    def test_hook_receives_events(self):
+        events = []
+        hook = lambda *event: events.append(event)
+        i.add_hook(hook)
+        try:
+            i.count("things", 3)
+            with i.phase("work"):
+                pass
+        finally:
+            i.remove_hook(hook)
+        i.count("things")
+        assert events[0] == ("count", "things", 3)
+        assert events[1][:2] == ("time", "work")
+        assert len(events) == 2
+
+    def test_phase_without_hooks(self):
+        assert not i.enabled()
+        assert i.phase("work") is i.phase("other")
+
+    def test_collect(self):
+        with i.collect() as stats:
+            i.count("things")
+            i.count("things", 2)
+            with i.phase("work"):
+                pass
+            with i.phase("work"):
+                pass
+        assert not i.enabled()
+        assert stats.counts == {"things": 3}
+        assert stats.calls == {"work": 2}
+        assert "things" in stats.report()
+
+    def test_hooks_per_thread(self):
+        barrier = Barrier(2)
+        results = {}
+
+        def record(name):
+            with i.collect() as stats:
+                barrier.wait()
+                i.count(name)
+                barrier.wait()
+            results[name] = stats.counts
+
+        threads = [Thread(target=record, args=(name,)) for name in ("a", "b")]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert results == {"a": {"a": 1}, "b": {"b": 1}}
+        assert not i.enabled()
+
+    def test_bind(self):
+        with i.collect() as stats:
+            thread = Thread(target=i.bind(i.count), args=("things",))
+            thread.start()
+            thread.join()
+        assert stats.counts == {"things": 1}
+
+
+class TestDavar:
+    def test_describe_stats(self, fake_wikidata):
+        stats = i.Stats()
+        davar = d.Davar.from_davartext("(P31 Q42 Q5) (Q2 (P31 Q42 Q5))", stats=stats)
+        davar.describe("en", stats=stats)
+        davar.describe("en", stats=stats)
+        assert not i.enabled()
+        assert {"transcribe", "resolve", "http", "render"} <= set(stats.times)
+        assert stats.counts["http.requests"] == 1
+        assert stats.counts["http.bytes"] > 0
+        assert stats.counts["labels.fetched"] == 4
+        assert stats.counts["words.WikidataItem"] == 2 * 5
+        assert stats.counts["words.WikidataProperty"] == 2 * 2
+
+    def test_resolve_workers_stats(self, fake_wikidata, monkeypatch):
+        monkeypatch.setattr(m, "WBGETENTITIES_MAX_IDS", 1)
+        stats = i.Stats()
+        davar = d.Davar.from_davartext("(P31 Q42 Q5)")
+        davar.describe("en", stats=stats)
+        assert stats.counts["http.requests"] == 3
+
+    def test_describe_many_stats(self, fake_wikidata):
+        stats = i.Stats()
+        d.Davar.from_davartext("(P31 Q42 Q5)").describe_many(["en", "fr"], stats=stats)
+        assert stats.counts["http.requests"] == 1
+        assert stats.counts["labels.fetched"] == 6
+
+    def test_cli_stats(self, fake_wikidata, capsys):
+        main(["(Q2)", "-l", "en", "--stats"])
+        out, err = capsys.readouterr()
+        assert out == "Earth.\n"
+        assert "http.requests" in err
+        assert "words.WikidataItem" in err
@@ -0,0 +1,62 @@
+import pytest
+from davar import lemmas
+from davar import model as m
+
+ENTRIES = [
+    (2084071, "n", "eng", "dog"),
+    (2084071, "n", "eng", "domestic_dog"),
+    (2084071, "n", "fra", "chien"),
+    (1835496, "v", "eng", "travel"),
+    (110659, "r", "jpn", "ちょっと"),
+]
+
+
+@pytest.fixture
+def table(tmp_path):
+    lemmas.write_lemma_table(tmp_path / "lemmas.bin", ENTRIES)
+    table = lemmas.LemmaTable(tmp_path / "lemmas.bin")
+    yield table
+    table.close()
+
+
+def test_lemma_table(table):
+    assert len(table) == 4
+    assert table.get(2084071, "n", "eng") == "dog"
+    assert table.get(2084071, "n", "fra") == "chien"
+    assert table.get(1835496, "v", "eng") == "travel"
+    assert table.get(110659, "r", "jpn") == "ちょっと"
+    assert table.get(2084071, "v", "eng") is None
+    assert table.get(2084071, "n", "deu") is None
+    assert table.get(99999999, "n", "eng") is None
+    assert table.get(2084071, "n", "en") is None
+
+
+def test_empty_lemma_table(tmp_path):
+    lemmas.write_lemma_table(tmp_path / "lemmas.bin", [])
+    assert lemmas.LemmaTable(tmp_path / "lemmas.bin").get(2084071, "n", "eng") is None
+
+
+def test_not_a_lemma_table(tmp_path):
+    (tmp_path / "lemmas.bin").write_bytes(b"not a lemma table")
+    with pytest.raises(ValueError):
+        lemmas.LemmaTable(tmp_path / "lemmas.bin")
+
+
+def test_default_lemma_table(tmp_path, monkeypatch):
+    monkeypatch.setattr(lemmas, "DEFAULT_PATH", str(tmp_path / "lemmas.bin"))
+    monkeypatch.setattr(lemmas, "_default_table", lemmas._UNSET)
+    assert lemmas.default_lemma_table() is None
+    # a missing table is remembered until a table is written
+    (tmp_path / "lemmas.bin").write_bytes(b"not a lemma table")
+    assert lemmas.default_lemma_table() is None
+    lemmas.write_lemma_table(lemmas.DEFAULT_PATH, ENTRIES)
+    table = lemmas.default_lemma_table()
+    assert table.get(2084071, "n", "eng") == "dog"
+    assert lemmas.default_lemma_table() is table
+    table.close()
+
+
+def test_describe_from_lemma_table(table, monkeypatch):
+    monkeypatch.setattr(m, "lemma_table", table)
+    assert m.OMWSynset("02084071-n").describe("en") == "dog"
+    assert m.OMWSynset("02084071-n").describe("fr") == "chien"
@@ -1,4 +1,6 @@
 from davar import model as m
+from socket import SHUT_RDWR
+from urllib.parse import urlsplit
 import pytest
 
 
@@ -62,6 +64,36 @@ class TestWikidataItem:
         with pytest.raises(ValueError):
             m.WikidataItem("Q42Z")
 
+    def test_construct_is_lazy(self, fake_wikidata):
+        m.WikidataItem("Q42")
+        assert fake_wikidata.requests == []
+
+    def test_resolve(self, fake_wikidata):
+        word = m.WikidataItem("Q42")
+        assert word.resolve() is word
+        assert len(fake_wikidata.api_requests()) == 1
+        assert word.describe("en") == "Douglas Adams"
+        assert len(fake_wikidata.requests) == 1
+
+    def test_data_shares_client(self):
+        assert m.WikidataItem("Q42").data.client is m.WikidataItem("Q5").data.client
+
+    def test_interned(self):
+        assert m.WikidataItem("Q42") is m.WikidataItem("Q42")
+
+    def test_hash(self):
+        assert {m.WikidataItem("Q42"): 1}[m.WikidataItem("Q42")] == 1
+
+    def test_immutable(self):
+        with pytest.raises(AttributeError):
+            m.WikidataItem("Q42").id = "Q5"
+
+    def test_pickle(self):
+        import pickle
+
+        word = m.WikidataItem("Q42")
+        assert pickle.loads(pickle.dumps(word)) is word
+
 
 class TestWikidataProperty:
     def test_describe(self, cached_WikidataProperty_P31):
@@ -88,6 +120,9 @@ class TestOWNSynset:
         with pytest.raises(ValueError):
             m.OMWSynset("Q42")
 
+    def test_interned(self):
+        assert m.OMWSynset("02084071-n") is m.OMWSynset("02084071-n")
+
     def test__bcp_47_to_iso_639_2_simple(self):
         assert m.OMWSynset._bcp_47_to_iso_639_2("en") == "eng"
 
@@ -136,6 +171,34 @@ class TestStatementNested:
         )
 
 
+class TestStatementSharing:
+    def test_shared(self, example_statement):
+        assert m.Statement(example_statement) is m.Statement(example_statement)
+        statement = m.LabeledEdge(
+            m.WikidataProperty("P31"), m.WikidataItem("Q42"), m.WikidataItem("Q5")
+        )
+        assert statement is example_statement
+
+    def test_not_shared_across_types(self, cached_WikidataItem_Q42):
+        assert m.Statement(cached_WikidataItem_Q42) != m.Edge(
+            cached_WikidataItem_Q42, cached_WikidataItem_Q42
+        )
+
+    def test_hash(self, example_statement):
+        statements = {m.Statement(example_statement), m.Statement(example_statement)}
+        assert len(statements) == 1
+
+    def test_immutable(self, example_statement):
+        with pytest.raises(AttributeError):
+            example_statement.sub = m.WikidataItem("Q5")
+
+    def test_pickle(self, example_statement):
+        import pickle
+
+        nested = m.Edge(example_statement, example_statement)
+        assert pickle.loads(pickle.dumps(nested)) is nested
+
+
 class TestEdge:
     def test_repr(self, cached_WikidataItem_Q42, cached_WikidataItem_Q5):
         s = m.Edge(cached_WikidataItem_Q42, cached_WikidataItem_Q5)
@@ -262,6 +325,323 @@ class TestLabeledEdgeNested:
             == "Douglas Adams → [Douglas Adams → human (instance of)] (instance of)."
         )
 
+    @pytest.mark.parametrize("lvl", [0, 1])
+    def test_describe_many(self, fake_wikidata, lvl):
+        statement = m.LabeledEdge(
+            m.WikidataProperty("P31"),
+            m.Edge(m.WikidataItem("Q2"), m.Statement(m.WikidataItem("Q42"))),
+            m.WikidataItem("Q5"),
+        )
+        assert statement.describe_many(["en", "fr"], lvl) == {
+            lang: statement.describe(lang, lvl) for lang in ["en", "fr"]
+        }
+
 
 def test__bcp_47_to_iso_639_2():
     assert m._bcp_47_to_iso_639_2("en") == "eng"
+
+
+class TestDeeplyNested:
+    depth = 20000
+
+    @pytest.fixture
+    def statement(self):
+        statement = m.Statement(m.WikidataItem("Q5"))
+        for _ in range(self.depth):
+            statement = m.Edge(m.WikidataItem("Q42"), statement)
+        return statement
+
+    def test_str(self, statement):
+        assert str(statement) == "(Q42 " * self.depth + "(Q5)" + ")" * self.depth
+
+    def test_repr(self, statement):
+        assert repr(statement) == (
+            'Edge(WikidataItem("Q42"), ' * self.depth
+            + 'Statement(WikidataItem("Q5"))'
+            + ")" * self.depth
+        )
+
+    def test_describe(self, statement):
+        m.label_lru.set((m.WikidataItem, "Q5", "en"), "human")
+        m.label_lru.set((m.WikidataItem, "Q42", "en"), "Douglas Adams")
+        assert statement.describe("en") == (
+            "Douglas Adams → "
+            + "[Douglas Adams → " * (self.depth - 1)
+            + "[human]"
+            + "]" * (self.depth - 1)
+            + "."
+        )
+
+
+class TestRenderCache:
+    @pytest.fixture(autouse=True)
+    def render_cache(self, monkeypatch):
+        for id, label in {"Q2": "Earth", "Q5": "human", "Q42": "Douglas Adams"}.items():
+            m.label_lru.set((m.WikidataItem, id, "en"), label)
+        m.label_lru.set((m.WikidataProperty, "P31", "en"), "instance of")
+        cache = m.LRUCache(64)
+        monkeypatch.setattr(m, "render_cache", cache)
+        return cache
+
+    def test_describe(self, render_cache):
+        shared = m.LabeledEdge(
+            m.WikidataProperty("P31"), m.WikidataItem("Q42"), m.WikidataItem("Q5")
+        )
+        statements = [m.Edge(m.WikidataItem(f"Q{i}"), shared) for i in (2, 5, 42)]
+        descriptions = [s.describe("en") for s in statements]
+        assert descriptions[0] == "Earth → [Douglas Adams → human (instance of)]."
+        # the shared subtree is rendered once, then found in the cache twice
+        assert render_cache.get((shared, "en", True)) == (
+            "[Douglas Adams → human (instance of)]"
+        )
+        assert render_cache.stats().currsize == 4
+        assert statements[0].describe("en") == descriptions[0]
+        assert shared.describe("en") == "Douglas Adams → human (instance of)."
+
+    def test_matches_uncached(self, render_cache, monkeypatch):
+        statement = m.Statement(m.WikidataItem("Q5"))
+        for _ in range(20000):
+            statement = m.Edge(m.WikidataItem("Q42"), statement)
+        cached = statement.describe("en")
+        assert statement.describe_many(["en"]) == {"en": cached}
+        monkeypatch.setattr(m, "render_cache", None)
+        assert statement.describe("en") == cached
+        # only descriptions short enough to cache were kept
+        assert all(
+            len(text) <= m.RENDER_CACHE_MAX_LENGTH
+            for text in render_cache._entries.values()
+        )
+
+
+class TestResolveLabels:
+    def test_fetch_wikidata_labels(self, fake_wikidata):
+        assert m.fetch_wikidata_labels(["Q42", "P31", "Q0"], ["en", "fr"]) == {
+            ("Q42", "en"): "Douglas Adams",
+            ("Q42", "fr"): "Douglas Adams",
+            ("P31", "en"): "instance of",
+            ("P31", "fr"): "nature de l'élément",
+        }
+
+    def test_fetch_wikidata_labels_batches(self, fake_wikidata):
+        ids = [f"Q{n}" for n in range(200)]
+        m.fetch_wikidata_labels(ids + ids, ["en"])
+        assert len(fake_wikidata.api_requests()) == 4
+
+    def test_resolve_labels(self, fake_wikidata):
+        words = [
+            m.WikidataItem("Q42"),
+            m.WikidataProperty("P31"),
+            m.WikidataItem("Q42"),
+        ]
+        m.resolve_labels(words, ["en"])
+        assert [w.describe("en") for w in words] == [
+            "Douglas Adams",
+            "instance of",
+            "Douglas Adams",
+        ]
+        assert len(fake_wikidata.requests) == 1
+
+    def test_resolve_labels_resolved(self, fake_wikidata):
+        words = [m.WikidataItem("Q42")]
+        m.resolve_labels(words, ["en"])
+        m.resolve_labels(words, ["en"])
+        assert len(fake_wikidata.requests) == 1
+
+    def test_describe_unresolved(self, fake_wikidata):
+        assert m.WikidataItem("Q5").describe("en") == "human"
+
+    def test_describe_missing_label(self, fake_wikidata):
+        with pytest.raises(KeyError):
+            m.WikidataItem("Q5").describe("de")
+
+    def test_resolve_labels_workers(self, fake_wikidata):
+        words = [m.WikidataItem(f"Q{n}") for n in range(200)]
+        m.resolve_labels(words, ["en"], workers=4)
+        assert len(fake_wikidata.requests) == 4
+        assert m.WikidataItem("Q5").describe("en") == "human"
+
+
+class TestSQLiteLabelCache:
+    @pytest.fixture
+    def cache(self, tmp_path):
+        return m.SQLiteLabelCache(tmp_path / "labels.db")
+
+    def test_get_set(self, cache):
+        assert cache.get("Q42", "en") is None
+        cache.set("Q42", "en", "Douglas Adams")
+        assert cache.get("Q42", "en") == "Douglas Adams"
+        assert cache.get("Q42", "fr") is None
+
+    def test_persistent(self, cache):
+        cache.set("Q42", "en", "Douglas Adams")
+        assert m.SQLiteLabelCache(cache.path).get("Q42", "en") == "Douglas Adams"
+
+    def test_get_many(self, cache):
+        cache.set_many({("Q42", "en"): "Douglas Adams", ("Q5", "en"): "human"})
+        assert cache.get_many(["Q42", "Q5", "Q2"], ["en", "fr"]) == {
+            ("Q42", "en"): "Douglas Adams",
+            ("Q5", "en"): "human",
+        }
+
+    def test_ttl(self, tmp_path, monkeypatch):
+        cache = m.SQLiteLabelCache(tmp_path / "labels.db", ttl=60)
+        cache.set("Q42", "en", "Douglas Adams")
+        now = m.time.time()
+        monkeypatch.setattr(m.time, "time", lambda: now + 61)
+        assert cache.get("Q42", "en") is None
+
+    def test_max_entries(self, tmp_path):
+        cache = m.SQLiteLabelCache(tmp_path / "labels.db", max_entries=2)
+        for n in range(3):
+            cache.set(f"Q{n}", "en", str(n))
+        assert len(cache) == 2
+
+    def test_max_entries_counts_rarely(self, tmp_path):
+        cache = m.SQLiteLabelCache(tmp_path / "labels.db", max_entries=100)
+        statements = []
+        cache._connection().set_trace_callback(statements.append)
+        for n in range(250):
+            cache.set(f"Q{n}", "en", str(n))
+        counts = [s for s in statements if s.startswith("SELECT COUNT")]
+        assert len(counts) <= 1 + 250 // 10
+        assert len(cache) <= 100
+        assert cache.get("Q249", "en") == "249"
+
+    def test_describe(self, cache, fake_wikidata, monkeypatch):
+        monkeypatch.setattr(m, "label_cache", cache)
+        assert m.WikidataItem("Q5").describe("en") == "human"
+        assert m.WikidataItem("Q5").describe("en") == "human"
+        assert len(fake_wikidata.requests) == 1
+
+    def test_resolve_labels(self, cache, fake_wikidata, monkeypatch):
+        monkeypatch.setattr(m, "label_cache", cache)
+        m.resolve_labels([m.WikidataItem("Q5")], ["en"])
+        m.resolve_labels([m.WikidataItem("Q5")], ["en"])
+        assert len(fake_wikidata.requests) == 1
+        assert cache.get("Q5", "en") == "human"
+
+    def test_describe_synset(self, cache, monkeypatch):
+        monkeypatch.setattr(m, "label_cache", cache)
+        cache.set("02084071-n", "en", "dog")
+        assert m.OMWSynset("02084071-n").describe("en") == "dog"
+
+
+def test_configure_labels(tmp_path, monkeypatch):
+    monkeypatch.setattr(m, "label_cache", None)
+    monkeypatch.setattr(m, "label_index", None)
+    monkeypatch.setattr(m, "offline", False)
+    m.configure_labels(cache=str(tmp_path / "labels.db"), offline=True)
+    assert isinstance(m.label_cache, m.SQLiteLabelCache)
+    assert m.label_index is None
+    assert m.offline
+
+
+class TestLRUCache:
+    def test_get_set(self):
+        cache = m.LRUCache(maxsize=2)
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.stats() == m.CacheInfo(1, 1, 0, 2, 1)
+
+    def test_evicts_least_recently_used(self):
+        cache = m.LRUCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.stats().evictions == 1
+
+    def test_resize(self):
+        cache = m.LRUCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.resize(1)
+        assert len(cache) == 1
+        assert cache.get("b") == 2
+
+    def test_invalidate(self):
+        cache = m.LRUCache()
+        cache.set("a", 1)
+        cache.invalidate("a")
+        assert cache.get("a") is None
+
+    def test_describe_uses_label_lru(self, fake_wikidata):
+        assert m.WikidataItem("Q5").describe("en") == "human"
+        assert m.WikidataItem("Q5").describe("en") == "human"
+        assert len(fake_wikidata.requests) == 1
+        assert m.label_lru.stats().hits == 1
+
+    def test_resolve_labels_uses_label_lru(self, fake_wikidata):
+        m.resolve_labels([m.WikidataItem("Q5")], ["en"])
+        m.resolve_labels([m.WikidataItem("Q5")], ["en"])
+        assert len(fake_wikidata.requests) == 1
+
+
+class TestAsync:
+    def test_aresolve_labels(self, fake_wikidata):
+        import asyncio
+
+        words = [m.WikidataItem("Q42"), m.WikidataProperty("P31")]
+        asyncio.run(m.aresolve_labels(words, ["en"]))
+        assert len(fake_wikidata.requests) == 1
+        assert [w.describe("en") for w in words] == ["Douglas Adams", "instance of"]
+
+    def test_aresolve_labels_concurrent(self, fake_wikidata):
+        import asyncio
+        import time
+
+        fake_wikidata.latency = 0.3
+        words = [m.WikidataItem(f"Q{n}") for n in range(4 * m.WBGETENTITIES_MAX_IDS)]
+        start = time.perf_counter()
+        asyncio.run(m.aresolve_labels(words, ["en"], concurrency=4))
+        # four batches of requests take about as long as one
+        assert time.perf_counter() - start < 4 * fake_wikidata.latency
+        assert len(fake_wikidata.requests) == 4
+
+    def test_adescribe(self, fake_wikidata, example_statement):
+        import asyncio
+
+        assert (
+            asyncio.run(m.Statement(example_statement).adescribe("en"))
+            == "[Douglas Adams → human (instance of)]."
+        )
+
+
+class TestHTTPClient:
+    def test_get_json(self, fake_wikidata):
+        client = m.HTTPClient()
+        url = f"{fake_wikidata.url}/w/api.php?ids=Q5&languages=en"
+        assert client.get_json(url) == {
+            "entities": {"Q5": fake_wikidata.entity("Q5", ["en"])}
+        }
+
+    def test_keep_alive(self, fake_wikidata):
+        client = m.HTTPClient()
+        for _ in range(3):
+            client.get_json(f"{fake_wikidata.url}/w/api.php?ids=Q5&languages=en")
+        assert len(fake_wikidata.connections) == 1
+
+    def test_keep_alive_across_parallel_resolves(self, fake_wikidata):
+        words = [m.WikidataItem(f"Q{n}") for n in range(1, 201)]
+        for _ in range(3):
+            m.clear_labels()
+            m.resolve_labels(words, ["en"], workers=4)
+        assert len(fake_wikidata.api_requests()) == 3 * 4
+        # each thread of the shared pool keeps its connection open between calls
+        assert len(fake_wikidata.connections) <= m._fetch_pool_size
+
+    def test_reconnect(self, fake_wikidata):
+        client = m.HTTPClient()
+        url = f"{fake_wikidata.url}/w/api.php?ids=Q5&languages=en"
+        client.get_json(url)
+        client._connection("http", urlsplit(url).netloc).sock.shutdown(SHUT_RDWR)
+        assert client.get_json(url)["entities"]["Q5"]["id"] == "Q5"
+
+    def test_http_error(self, fake_wikidata):
+        from urllib.error import HTTPError
+
+        with pytest.raises(HTTPError):
+            m.HTTPClient().get_json(f"{fake_wikidata.url}/nothing")
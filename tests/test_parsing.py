@@ -1,5 +1,6 @@
 from davar import parsing
 from davar import model as m
+from arpeggio import NoMatch
 import pytest
 
 
@@ -76,3 +77,91 @@ def test_transcribe_mixed():
             m.OMWSynset("01704452-v"), m.WikidataItem("Q42"), m.OMWSynset("03833065-n"),
         )
     ]
+
+
+def test_get_parser_cached():
+    assert parsing.get_parser() is parsing.get_parser()
+
+
+def test_get_parser_per_thread():
+    from threading import Thread
+
+    parsers = []
+    thread = Thread(target=lambda: parsers.append(parsing.get_parser()))
+    thread.start()
+    thread.join()
+    assert parsers[0] is not parsing.get_parser()
+
+
+def test_parse_memoization():
+    text = "(Q5482740 (P31 Q42 Q5))"
+    assert parsing.visit(parsing.parse(text, memoization=True)) == parsing.transcribe(
+        text
+    )
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "(Q5)",
+        "(Q5)(P31 Q42 Q5) (Q5 Q42) (P106 Q3236990 Q5482740)",
+        "(02664769-v (Q9128 Q204170) (Q11461 Q502261))",
+        "\n(Q 42\t(P 31 Q042 Q5))\n",
+        "(01704452-v Q42 03833065-n)",
+    ],
+)
+def test_fast_transcribe_matches_arpeggio(text):
+    assert parsing._fast_transcribe(text) == parsing.visit(parsing.parse(text))
+
+
+@pytest.mark.parametrize(
+    "text", ["", "Q5", "(P31)", "(P31 Q5)", "(Q42 Q5 Q5)", "(Q5))", "((Q5)", "(Q5) x"]
+)
+def test_transcribe_invalid(text):
+    assert parsing._fast_transcribe(text) is None
+    with pytest.raises(NoMatch):
+        parsing.transcribe(text)
+
+
+def test_transcribe_iter():
+    from io import StringIO
+
+    text = "(Q5)(P31 Q42\nQ5) (Q5 Q42)\n(P106 Q3236990 (Q5 Q42))\n"
+    # a small chunk size splits statements and words across reads
+    assert list(parsing.transcribe_iter(StringIO(text), chunk_size=3)) == (
+        parsing.transcribe(text)
+    )
+
+
+@pytest.mark.parametrize("text", ["", " \n", "(Q5) (Q42", "(Q5) Q42", "(Q5))"])
+def test_transcribe_iter_invalid(text):
+    from io import StringIO
+
+    with pytest.raises(NoMatch):
+        list(parsing.transcribe_iter(StringIO(text)))
+
+
+def test_visit_matches_arpeggio():
+    from arpeggio import visit_parse_tree
+
+    text = "(Q1 " * 50 + "(P31 Q42 02084071-n)" + ")" * 50 + " (Q5)"
+    tree = parsing.parse(text)
+    assert parsing.visit(tree) == visit_parse_tree(tree, parsing.DavarVisitor())
+
+
+def test_transcribe_deeply_nested():
+    depth = 20000
+    text = "(P31 Q42 " * depth + "(Q5)" + ")" * depth
+    (statement,) = parsing.transcribe(text)
+    for _ in range(depth):
+        assert statement.sub == m.WikidataItem("Q42")
+        statement = statement.ob
+    assert statement == m.Statement(m.WikidataItem("Q5"))
+
+
+def test_transcribe_deeply_nested_invalid():
+    depth = 20000
+    text = "(Q1 " * depth + "(Q2)" + ")" * (depth - 1)
+    with pytest.raises(NoMatch) as error:
+        parsing.transcribe(text)
+    assert error.value.position == len(text)
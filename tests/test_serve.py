@@ -0,0 +1,83 @@
+import threading
+import pytest
+from davar import serve
+from davar.serve import describe_request
+from davar.client import Client, parse_address
+from davar.__main__ import main
+
+
+@pytest.fixture(params=["tcp", "unix"])
+def server_address(request, fake_wikidata, tmp_path):
+    """
+    Serves davar in a background thread, and yields its address.
+    """
+    if request.param == "tcp":
+        server = serve.make_server("127.0.0.1:0")
+        address = "127.0.0.1:{}".format(server.server_address[1])
+    else:
+        address = f"unix:{tmp_path / 'davar.sock'}"
+        server = serve.make_server(address)
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield address
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize(
+    "request_",
+    [
+        {"documents": "(Q2)", "langs": ["en"]},
+        {"documents": [1], "langs": ["en"]},
+        {"documents": ["(Q2)"], "langs": [1]},
+        {"davartext": 1, "langs": ["en"]},
+    ],
+)
+def test_describe_request_invalid(request_):
+    with pytest.raises(ValueError):
+        describe_request(request_)
+
+
+def test_parse_address():
+    assert parse_address("localhost:8765")[1] == ("localhost", 8765)
+    assert parse_address("http://127.0.0.1:80/")[1] == ("127.0.0.1", 80)
+    assert parse_address("unix:/tmp/davar.sock")[1] == "/tmp/davar.sock"
+    with pytest.raises(ValueError):
+        parse_address("localhost")
+
+
+class TestClient:
+    def test_describe(self, server_address, fake_wikidata):
+        with Client(server_address) as client:
+            assert client.describe("(Q2 (P31 Q42 Q5))", ["en", "fr"]) == {
+                "en": ["Earth → [Douglas Adams → human (instance of)]."],
+                "fr": ["Terre → [Douglas Adams → être humain (nature de l'élément)]."],
+            }
+            # labels are kept in memory by the server
+            assert client.describe("(Q42)", ["en"]) == {"en": ["Douglas Adams."]}
+        assert len(fake_wikidata.requests) == 1
+
+    def test_describe_batch(self, server_address, fake_wikidata):
+        with Client(server_address) as client:
+            results = client.describe_batch(["(Q2)", "(Q2", "(Q5 Q42)"], ["en"])
+        assert results[0] == {"en": ["Earth."]}
+        assert isinstance(results[1], ValueError)
+        assert results[2] == {"en": ["human → Douglas Adams."]}
+        assert len(fake_wikidata.requests) == 1
+
+    def test_invalid_davar(self, server_address):
+        with Client(server_address) as client:
+            with pytest.raises(ValueError, match="NoMatch"):
+                client.describe("(Q2", ["en"])
+            with pytest.raises(ValueError, match="langs"):
+                client._request({"davartext": "(Q2)"})
+            # the connection is still usable after errors
+            assert client.describe("(Q2)", ["en"]) == {"en": ["Earth."]}
+
+    def test_cli(self, server_address, capsys):
+        main(["(Q2) (Q42)", "-l", "en", "--server", server_address])
+        assert capsys.readouterr().out == "Earth.\nDouglas Adams.\n"
+        main(["(Q2)", "-l", "en,fr", "--server", server_address])
+        assert capsys.readouterr().out == "en\tEarth.\nfr\tTerre.\n"
+        with pytest.raises(SystemExit):
+            main(["(Q2", "-l", "en", "--server", server_address])
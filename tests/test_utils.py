@@ -49,3 +49,44 @@ class TestDavar:
             singleton_statement.describe("en"),
             nested_statement.describe("en"),
         ]
+
+    def test_iter_from_file(self, tmp_path, flat_statement, nested_statement):
+        path = tmp_path / "corpus.davar"
+        path.write_text("(P31 Q3236990 Q5482740)\n(Q2 (P31 Q42 Q5))\n")
+        assert list(d.Davar.iter_from_file(path)) == [flat_statement, nested_statement]
+
+    def test_describe_resolves_in_bulk(self, fake_wikidata):
+        davar = d.Davar.from_davartext(
+            "(P31 Q3236990 Q5482740) (Q2013)(Q2 (P31 Q42 Q5))"
+        )
+        assert davar.describe("en") == [
+            "self → programmer (instance of).",
+            "Wikidata.",
+            "Earth → [Douglas Adams → human (instance of)].",
+        ]
+        assert len(fake_wikidata.requests) == 1
+
+    def test_adescribe(self, fake_wikidata):
+        import asyncio
+
+        davar = d.Davar.from_davartext("(Q2013)(Q2 (P31 Q42 Q5))")
+        assert asyncio.run(davar.adescribe("en")) == [
+            "Wikidata.",
+            "Earth → [Douglas Adams → human (instance of)].",
+        ]
+        assert len(fake_wikidata.requests) == 1
+
+    def test_describe_many(self, fake_wikidata):
+        davar = d.Davar.from_davartext("(P31 Q3236990 Q5482740) (Q2 (P31 Q42 Q5))")
+        assert davar.describe_many(["en", "fr"]) == {
+            "en": [
+                "self → programmer (instance of).",
+                "Earth → [Douglas Adams → human (instance of)].",
+            ],
+            "fr": [
+                "soi → programmeur (nature de l'élément).",
+                "Terre → [Douglas Adams → être humain (nature de l'élément)].",
+            ],
+        }
+        assert len(fake_wikidata.requests) == 1
+        assert "languages=en%7Cfr" in fake_wikidata.requests[0]
@@ -0,0 +1,114 @@
+import io
+import threading
+import time
+import pytest
+from davar.parsing import statement_spans
+from davar.watch import IncrementalDescriber, watch
+
+TEXT = "(P31 Q3236990 Q5482740)\n(Q2013)\n(Q2 (P31 Q42 Q5))\n"
+
+
+def test_statement_spans():
+    text = " (Q1 Q2)\n(P1 Q1 (Q3)) junk (Q4"
+    spans, stop = statement_spans(text)
+    assert [text[start:end] for start, end in spans] == ["(Q1 Q2)", "(P1 Q1 (Q3))"]
+    assert text[stop:] == " junk (Q4"
+
+
+class TestIncrementalDescriber:
+    def test_update(self, fake_wikidata):
+        describer = IncrementalDescriber(["en"])
+        assert describer.update(TEXT) == range(0, 3)
+        assert describer.descriptions == [
+            ("self → programmer (instance of).",),
+            ("Wikidata.",),
+            ("Earth → [Douglas Adams → human (instance of)].",),
+        ]
+        assert len(fake_wikidata.requests) == 1
+
+    def test_only_changed_statements(self, fake_wikidata, monkeypatch):
+        describer = IncrementalDescriber(["en", "fr"])
+        describer.update(TEXT)
+        transcribed = []
+        import davar.watch
+
+        transcribe = davar.watch.transcribe
+        monkeypatch.setattr(
+            davar.watch,
+            "transcribe",
+            lambda text: transcribed.append(text) or transcribe(text),
+        )
+        edited = TEXT.replace("(Q2013)", "(Q2013 Q42)")
+        assert describer.update(edited) == range(1, 2)
+        assert transcribed == ["(Q2013 Q42)"]
+        assert describer.descriptions[1] == (
+            "Wikidata → Douglas Adams.",
+            "Wikidata → Douglas Adams.",
+        )
+        assert describer.spans[2] == (edited.index("(Q2 "), len(edited) - 1)
+
+        # moving, undoing and whitespace only edits reuse earlier descriptions
+        describer.update("\n\n" + edited)
+        describer.update(TEXT)
+        assert transcribed == ["(Q2013 Q42)"]
+        assert describer.update(TEXT) == range(3, 3)
+
+    def test_insert_and_remove(self, fake_wikidata):
+        describer = IncrementalDescriber(["en"])
+        describer.update(TEXT)
+        describer.update("(Q42)\n" + TEXT + "(Q5)")
+        assert describer.descriptions[0] == ("Douglas Adams.",)
+        assert describer.descriptions[-1] == ("human.",)
+        assert len(describer.descriptions) == 5
+        describer.update(TEXT[:24])
+        assert describer.descriptions == [("self → programmer (instance of).",)]
+
+    def test_unclosed_statement(self, fake_wikidata):
+        describer = IncrementalDescriber(["en"])
+        describer.update(TEXT)
+        with pytest.raises(ValueError, match="line 2"):
+            describer.update(TEXT.replace("(Q2013)", "(Q2013"))
+        # the last valid version is kept
+        assert len(describer.descriptions) == 3
+        describer.update(TEXT.replace("(Q2013)", "((Q2013) Q2)"))
+        assert describer.descriptions[1] == ("[Wikidata] → Earth.",)
+
+    def test_undescribable_statement(self, fake_wikidata, monkeypatch):
+        import davar.model as m
+
+        describer = IncrementalDescriber(["en"])
+        describer.update(TEXT)
+        monkeypatch.setattr(m, "offline", True)
+        with pytest.raises(ValueError, match="line 4 could not be described"):
+            describer.update(TEXT + "(Q5 Q999)\n")
+        assert len(describer.descriptions) == 3
+
+    def test_deeply_nested_invalid_statement(self, fake_wikidata):
+        describer = IncrementalDescriber(["en"])
+        describer.update(TEXT)
+        with pytest.raises(ValueError, match="line 4"):
+            describer.update(TEXT + "(Q1 " * 20000 + "(Q2) Q2 Q2" + ")" * 20000)
+        assert len(describer.descriptions) == 3
+
+
+def test_watch(fake_wikidata, tmp_path):
+    path = tmp_path / "corpus.davar"
+    path.write_text(TEXT)
+    out, err = io.StringIO(), io.StringIO()
+    stop = threading.Event()
+    thread = threading.Thread(
+        target=watch, args=(path, ["en"], 0.01, out, err, stop), daemon=True
+    )
+    thread.start()
+    try:
+        deadline = time.monotonic() + 5
+        while out.getvalue().count("\n") < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        path.write_text(TEXT.replace("(Q2013)", "(Q42)"))
+        while out.getvalue().count("\n") < 4 and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        stop.set()
+        thread.join()
+    assert out.getvalue().splitlines()[-1] == "2\tDouglas Adams."
+    assert "3 statements, 1 described again" in err.getvalue()
@@ -0,0 +1,98 @@
+import bz2
+import gzip
+import json
+import pytest
+from davar import model as m
+from davar import wikidump
+from davar.utils import Davar
+
+ENTITIES = [
+    {
+        "id": "Q42",
+        "labels": {"en": {"value": "Douglas Adams"}, "fr": {"value": "Adams"}},
+    },
+    {"id": "Q5", "labels": {"en": {"value": "human"}, "de": {"value": "Mensch"}}},
+    {"id": "P31", "labels": {"en": {"value": "instance of"}}},
+    {"id": "L7", "labels": {"en": {"value": "lexeme"}}},
+]
+
+
+def write_dump(path, opener=open):
+    lines = ["["] + [json.dumps(entity) + "," for entity in ENTITIES] + ["]"]
+    with opener(path, "wt", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+
+
+@pytest.fixture
+def label_index(tmp_path):
+    write_dump(tmp_path / "dump.json")
+    wikidump.build_label_index(tmp_path / "dump.json", tmp_path / "index", ["en"])
+    return wikidump.LabelIndex(tmp_path / "index")
+
+
+@pytest.mark.parametrize(
+    "name,opener",
+    [("dump.json", open), ("dump.json.gz", gzip.open), ("dump.json.bz2", bz2.open)],
+)
+def test_build_label_index(tmp_path, name, opener):
+    write_dump(tmp_path / name, opener)
+    count = wikidump.build_label_index(
+        tmp_path / name, tmp_path / "index", ["en", "fr"]
+    )
+    assert count == 4
+    assert len(wikidump.LabelIndex(tmp_path / "index")) == 4
+
+
+def test_label_index(label_index):
+    assert label_index.get("Q42", "en") == "Douglas Adams"
+    assert label_index.get("Q42", "fr") is None
+    assert label_index.get("Q1", "en") is None
+    assert label_index.get_many(["Q42", "Q5", "P31", "Q1"], ["en", "de"]) == {
+        ("Q42", "en"): "Douglas Adams",
+        ("Q5", "en"): "human",
+        ("P31", "en"): "instance of",
+    }
+
+
+def test_rebuild_label_index(label_index, tmp_path):
+    assert label_index.get("Q42", "en") == "Douglas Adams"
+    # a failed build keeps the old index
+    (tmp_path / "bad.json").write_text("[\n{not json\n]\n")
+    with pytest.raises(ValueError):
+        wikidump.build_label_index(tmp_path / "bad.json", tmp_path / "index", ["en"])
+    assert not (tmp_path / "index.tmp").exists()
+    assert wikidump.LabelIndex(tmp_path / "index").get("Q42", "en") == "Douglas Adams"
+    # an index that is open keeps reading the old file while it is replaced
+    (tmp_path / "new.json").write_text(
+        '[\n{"id": "Q42", "labels": {"en": {"value": "Adams"}}}\n]\n'
+    )
+    wikidump.build_label_index(tmp_path / "new.json", tmp_path / "index", ["en"])
+    assert label_index.get("Q5", "en") == "human"
+    assert wikidump.LabelIndex(tmp_path / "index").get("Q5", "en") is None
+    assert wikidump.LabelIndex(tmp_path / "index").get("Q42", "en") == "Adams"
+
+
+def test_label_index_path_quoted(tmp_path):
+    directory = tmp_path / "a?b#c%20d"
+    directory.mkdir()
+    write_dump(directory / "dump.json")
+    wikidump.build_label_index(directory / "dump.json", directory / "index", ["en"])
+    assert wikidump.LabelIndex(directory / "index").get("Q42", "en") == "Douglas Adams"
+
+
+def test_offline_describe(fake_wikidata, label_index, monkeypatch):
+    monkeypatch.setattr(m, "label_index", label_index)
+    monkeypatch.setattr(m, "offline", True)
+    davar = Davar.from_davartext("(P31 Q42 Q5)")
+    assert davar.describe("en") == ["Douglas Adams → human (instance of)."]
+    assert fake_wikidata.requests == []
+    with pytest.raises(KeyError):
+        Davar.from_davartext("(Q2)").describe("en")
+
+
+def test_main(tmp_path, capsys):
+    write_dump(tmp_path / "dump.json")
+    wikidump.main(
+        [str(tmp_path / "dump.json"), "-o", str(tmp_path / "index"), "--langs", "en"]
+    )
+    assert "Indexed 3 labels" in capsys.readouterr().err